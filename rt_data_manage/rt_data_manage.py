@@ -12,6 +12,10 @@ from scipy import interpolate
 from copy import deepcopy
 import time
 import itertools
+import warnings
+import functools
+import concurrent.futures
+import collections.abc
 
 #from matplotlib.lines import Line2D
 
@@ -19,7 +23,11 @@ matplotlib.rcParams['pdf.fonttype'] = 42
 matplotlib.rcParams['ps.fonttype'] = 42
 
 # to manage directories and save/load data
+import os
 import glob
+import csv
+import hashlib
+import json
 import pickle as pkl
 
 # import xls manager package manager
@@ -28,6 +36,212 @@ import pickle as pkl
 # import optimizer
 from scipy.optimize import curve_fit
 
+def hashable_key(value):
+    """
+    it returns a hashable version of value to use it as dictionary key.
+    lists (e.g. parameter names as ['a','b','N']) are converted to tuples, 
+    other unhashable values are converted to their repr string.
+    """
+    if isinstance(value, (list, tuple)):
+        return(tuple(hashable_key(element) for element in value))
+    
+    try:
+        hash(value)
+        return(value)
+    except TypeError:
+        return(repr(value))
+
+class Indexed_list(list):
+    """
+    List of objects which also keeps an index {object key: position}, where 
+    the key is the value of its key_attr attribute (see hashable_key).
+    It gives constant time search and replacement by key, and it works as a
+    regular list for the rest of the code.
+    If there are objects with the same key, the first one is indexed, or the
+    last one if last_wins is True (e.g. the newest reading with a name).
+    
+    Obs: if the key attribute of an object is modified after it was added,
+    call reindex() to update the index.
+    """
+    key_attr = 'name'
+    last_wins = False
+    
+    def __init__(self, items = ()):
+        
+        list.__init__(self, items)
+        self.reindex()
+    
+    def __reduce__(self):
+        # the index is created again when it is loaded
+        return(self.__class__, (list(self),))
+    
+    def item_key(self, item):
+        return(hashable_key(getattr(item, self.key_attr, None)))
+    
+    def reindex(self):
+        """
+        create the index again
+        """
+        self.keys_idx = dict()
+        
+        for i, item in enumerate(self):
+            if self.last_wins == True:
+                self.keys_idx[self.item_key(item)] = i
+            else:
+                self.keys_idx.setdefault(self.item_key(item), i)
+    
+    def position(self, key):
+        """
+        Return the position of the object with key or None if there is not.
+        """
+        return(self.keys_idx.get(hashable_key(key)))
+    
+    def get(self, key, default = None):
+        """
+        Return the object with key or default if there is not.
+        """
+        i = self.position(key)
+        
+        if i == None:
+            return(default)
+        
+        return(list.__getitem__(self, i))
+    
+    def pop_key(self, key, default = None):
+        """
+        Remove and return the object with key or default if there is not.
+        """
+        i = self.position(key)
+        
+        if i == None:
+            return(default)
+        
+        return(self.pop(i))
+    
+    def assign(self, item):
+        """
+        it replaces the object with the same key of item or append it
+        if there is not. Return the item position.
+        """
+        i = self.position(self.item_key(item))
+        
+        if i == None:
+            self.append(item)
+            return(len(self)-1)
+        
+        list.__setitem__(self, i, item)
+        return(i)
+    
+    def append(self, item):
+        
+        list.append(self, item)
+        
+        if self.last_wins == True:
+            self.keys_idx[self.item_key(item)] = len(self)-1
+        else:
+            self.keys_idx.setdefault(self.item_key(item), len(self)-1)
+    
+    def extend(self, items):
+        
+        for item in items:
+            self.append(item)
+    
+    def __iadd__(self, items):
+        
+        self.extend(items)
+        return(self)
+    
+    def __setitem__(self, i, item):
+        
+        if isinstance(i, slice):
+            list.__setitem__(self, i, item)
+            self.reindex()
+            
+        else:
+            same = self.item_key(list.__getitem__(self, i)) == self.item_key(item)
+            list.__setitem__(self, i, item)
+            
+            if not same:
+                self.reindex()
+    
+    def __delitem__(self, i):
+        
+        list.__delitem__(self, i)
+        self.reindex()
+    
+    def insert(self, i, item):
+        
+        list.insert(self, i, item)
+        self.reindex()
+    
+    def pop(self, i = -1):
+        
+        item = list.pop(self, i)
+        self.reindex()
+        return(item)
+    
+    def remove(self, item):
+        
+        list.remove(self, item)
+        self.reindex()
+    
+    def clear(self):
+        
+        list.clear(self)
+        self.keys_idx = dict()
+    
+    def sort(self, *args, **kwargs):
+        
+        list.sort(self, *args, **kwargs)
+        self.reindex()
+    
+    def reverse(self):
+        
+        list.reverse(self)
+        self.reindex()
+
+class Analysis_list(Indexed_list):
+    """
+    Indexed_list of Parameter objects (Well.analysis) indexed by parameter name.
+    e.g. well.analysis.get(['a','b','N'])
+    """
+    key_attr = 'name'
+
+class Data_list(Indexed_list):
+    """
+    Indexed_list of Reading objects (Well.data) indexed by reading name (r_name).
+    e.g. well.data.get('Amplification data')
+    If a reading was created again (e.g. create_readings called twice), the
+    last one is used.
+    """
+    key_attr = 'r_name'
+    last_wins = True
+    
+    def channel(self, r_name, channel, default = None):
+        """
+        Return the values of a reading serie (reading.values[channel]) or 
+        default if there is not.
+        """
+        reading = self.get(r_name)
+        
+        if reading == None:
+            return(default)
+        
+        try:
+            return(reading.values[channel])
+        except KeyError:
+            return(default)
+
+class Dset_list(Indexed_list):
+    """
+    Indexed_list of Data_set objects (Well_set.dsets) indexed by name.
+    e.g. wset.dsets.get('Amplification data Cycle vs Rn')
+    If there are datasets with the same name (create_dataset appends them),
+    the last one is used (as find_dataset).
+    """
+    key_attr = 'name'
+    last_wins = True
+
 class Well:
     def __init__(self, fname, exp, wpos, s_name, reporter, target, data, analysis, caths = None):
         """
@@ -39,7 +253,9 @@ class Well:
         same reagent added to the well) which define Ex/Em wavelengths.
         target = sample target
         data = list with measurement objects
+            it is stored as a Data_list (readings indexed by r_name)
         analysis = list with proceced information, parameters and analysis objects
+            it is stored as an Analysis_list (parameters indexed by name)
         caths = . list of "Well_cath" objects
             object custom cathegories wich it belongs
         """
@@ -62,6 +278,21 @@ class Well:
     
     # hint: to add a new attibute use setattr(well_obj, new_attribute, attribute value)
     
+    def __setattr__(self, name, value):
+        # analysis and data are always indexed lists (by name and r_name)
+        if name == 'analysis' and type(value) == list:
+            value = Analysis_list(value)
+        
+        elif name == 'data' and type(value) == list:
+            value = Data_list(value)
+        
+        object.__setattr__(self, name, value)
+    
+    def __setstate__(self, state):
+        # wells stored before analysis and data were indexed lists
+        for name, value in state.items():
+            setattr(self, name, value)
+    
     def description(self):
         return f"{self.wpos} from {self.exp} experiment in {self.fname} file"
         
@@ -135,6 +366,8 @@ class Reading:
         r_name = reading name  --> e.g. "Amplification data"
         d_type = what kind of measurements are in values --> their label/header/identifier.
         values = measured values --> np.array
+            it is stored as a Reading_values dictionary, which also gives
+            the derived columns (see Derived_column and add_derived)
         units = values units
         signal = signal descriptor --> e.g. "SYBR green fluorescence"
         
@@ -143,7 +376,7 @@ class Reading:
         self.sheet = sheet
         self.well = well
         self.r_name = r_name
-        self.values = values
+        self.values = Reading_values(values)
         self.units = units
         self.signal = signal
         
@@ -179,6 +412,371 @@ class Reading:
     def attr_names(self):
         return(list(self.__dict__.keys()))
 
+class Reading_values(dict):
+    """
+    Dictionary with the values of a Reading ({d_type: values}).
+    Besides the stored values, it gives the values of its derived columns
+    (e.g. time from cycles), which are computed when they are requested
+    instead of being stored in each well.
+    Derived columns are keys as the stored ones ('Time' in values, keys(),
+    items(), iteration), see stored_keys for the stored values only.
+    
+    derived = dict
+        {column name: Derived_column object}
+    store = Plate_store object
+        plate store which has the values of the reading (see bind)
+    row = int
+        row of the reading in the store
+    """
+    def __init__(self, *args, **kwargs):
+        
+        dict.__init__(self, *args, **kwargs)
+        self.derived = dict()
+        self.store = None
+        self.row = None
+    
+    def __reduce__(self):
+        # values which are views of the store are not stored twice,
+        # they are taken from the store again when it is loaded
+        state = self.__dict__.copy()
+        items = list(dict.items(self))
+        
+        if self.store != None:
+            items = [(key, values) for key, values in items 
+                     if not self.store.is_view(key, values)]
+        
+        return(Reading_values, (), state, None, iter(items))
+    
+    def __setstate__(self, state):
+        
+        self.__dict__.update({'derived': dict(), 'store': None, 'row': None})
+        self.__dict__.update(state)
+        
+        if self.store != None:
+            self.store.readings[self.row] = self
+            
+            for key, values in self.store.views(self.row).items():
+                if key not in self:
+                    self[key] = values
+    
+    def bind(self, store, row):
+        """
+        it replaces the values with views of a plate store row (no copies)
+        
+        store = Plate_store object
+        row = row of this reading in the store
+        """
+        self.store = store
+        self.row = row
+        
+        store.readings[row] = self
+        self.update(store.views(row))
+        
+    def __missing__(self, key):
+        
+        if key in self.derived:
+            return(self.derived[key].compute(self))
+        
+        raise KeyError(key)
+    
+    def get(self, key, default = None):
+        
+        try:
+            return(self[key])
+        except KeyError:
+            return(default)
+    
+    def __contains__(self, key):
+        return(dict.__contains__(self, key) or key in self.derived)
+    
+    def __iter__(self):
+        
+        for key in dict.__iter__(self):
+            yield(key)
+        
+        for key in self.derived:
+            if not dict.__contains__(self, key):
+                yield(key)
+    
+    def __len__(self):
+        return(len(set(self.derived).union(dict.keys(self))))
+    
+    def keys(self):
+        return(collections.abc.KeysView(self))
+    
+    def items(self):
+        return(collections.abc.ItemsView(self))
+    
+    def values(self):
+        return(collections.abc.ValuesView(self))
+
+def stored_keys(values):
+    """
+    keys of the stored values of a reading (Reading_values or a plain
+    dictionary of old readings), without the derived columns
+    """
+    return(list(dict.keys(values)))
+
+class Derived_column:
+    def __init__(self, name, function, sources, params = None, units = '', cache = True,
+                 cache_size = 8):
+        """
+        Reading column computed on demand from other columns of the reading
+        (e.g. time from cycle, ΔRn from Rn and baseline).
+        The same object is shared by all the readings of a plate, so
+        computed values are cached by plate and not copied in each well.
+        
+        name = column name (key in Reading.values)
+        function = function used to compute the column
+            function(*source_values, **params). It has to be defined at module 
+            level to be able to store (pickle) the readings.
+        sources = list with the names of the columns used as function input
+        params = dictionary with the other function parameters
+        units = column units
+        cache = boolean
+            if True, computed values are stored (by source values) and reused
+            by readings with equal source values (e.g. the plate cycles).
+        cache_size = maximum number of cached values
+        
+        """
+        
+        if params == None:
+            params = dict()
+        
+        self.name = name
+        self.function = function
+        self.sources = sources
+        self.params = params
+        self.units = units
+        self.cache = cache
+        self.cache_size = cache_size
+        self.computed = dict()
+    
+    def description(self):
+        return f"'{self.name}' column computed from {self.sources}"
+        
+    def __str__(self):
+        #to print some information instead of just the object memory location
+        return f"'{self.name}' derived column"
+    
+    def __getstate__(self):
+        # computed values are not stored
+        state = self.__dict__.copy()
+        state['computed'] = dict()
+        return(state)
+    
+    def get_attrs(self, attrs):
+        """
+        Return a list with the values of attrs
+        attrs: list of strings
+            list with the names of the attributes of interest
+        """
+        values = []
+        if type(attrs) != list:
+            attrs = [attrs]
+            
+        for attr in attrs:
+            values.append(getattr(self, attr))
+        return(values)
+    
+    def attr_names(self):
+        return(list(self.__dict__.keys()))
+    
+    def compute(self, values):
+        """
+        compute the column values from the source columns in values
+        
+        values = Reading.values dictionary
+        """
+        src = [np.asarray(values[source]) for source in self.sources]
+        
+        if self.cache == False:
+            return(self.function(*src, **self.params))
+        
+        key = tuple((s.dtype.str, s.shape, s.tobytes()) for s in src)
+        
+        if key not in self.computed:
+            
+            if len(self.computed) >= self.cache_size:
+                del self.computed[next(iter(self.computed))]   # the oldest one
+            
+            column = np.asarray(self.function(*src, **self.params))
+            column.flags.writeable = False    # it is shared by the plate readings
+            
+            self.computed[key] = column
+        
+        return(self.computed[key])
+
+def dc_scale(values, factor):
+    """
+    Derived_column function: values multiplied by factor
+    (e.g. time from cycles, with factor = time per cycle)
+    """
+    return(values * factor)
+
+def dc_baseline_subtract(signal, cycles, b_start, b_end):
+    """
+    Derived_column function: signal minus its baseline, where the baseline 
+    is the mean signal between cycles b_start and b_end (both included)
+    (e.g. ΔRn from Rn)
+    """
+    b_mask = (cycles >= b_start) & (cycles <= b_end)
+    
+    return(signal - np.mean(signal[b_mask]))
+
+class Plate_store:
+    def __init__(self, name, wpos, data, lengths = None, units = None, metadata = None):
+        """
+        Plate level store of reading values. Each reading serie (channel) is
+        a 2-D float array (wells x cycles), so the readings of a plate share 
+        a single array per channel and whole plate numpy operations can be
+        done over it (e.g. store.data['ΔRn'].max(axis = 1)).
+        
+        name = store name (e.g. reading name)
+        wpos = list with the well positions, in the same order as the array rows
+        data = dictionary {channel: 2-D array}
+        lengths = number of values of each row (rows of wells with less
+            values are filled with nan). By default all the columns.
+        units = dictionary {channel: units}
+        metadata = list with a dictionary of information of each well
+            (e.g. {'wpos': 'A1', 's_name': 'sample', ...}) in the rows order
+        readings = dictionary {row: Reading_values} of the bound readings
+            (see Reading_values.bind). It is not saved with the store, the
+            readings register again when they are loaded.
+        
+        """
+        
+        if units == None:
+            units = dict()
+        
+        if metadata == None:
+            metadata = [{'wpos': well_name} for well_name in wpos]
+        
+        n_rows = len(wpos)
+        
+        if lengths is None:
+            n_cols = max([d_array.shape[1] for d_array in data.values()], default = 0)
+            lengths = np.full(n_rows, n_cols, dtype = np.int64)
+        
+        self.name = name
+        self.wpos = list(wpos)
+        self.index = {well_name: i for i, well_name in enumerate(self.wpos)}
+        self.data = data
+        self.lengths = np.asarray(lengths, dtype = np.int64)
+        self.units = units
+        self.metadata = metadata
+        self.readings = dict()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['readings']
+        return(state)
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.readings = dict()
+    
+    def description(self):
+        return f"'{self.name}' plate store with {len(self.wpos)} wells and channels {list(self.data.keys())}"
+        
+    def __str__(self):
+        #to print some information instead of just the object memory location
+        return f"'{self.name}' plate store"
+    
+    def get_attrs(self, attrs):
+        """
+        Return a list with the values of attrs
+        attrs: list of strings
+            list with the names of the attributes of interest
+        """
+        values = []
+        if type(attrs) != list:
+            attrs = [attrs]
+            
+        for attr in attrs:
+            values.append(getattr(self, attr))
+        return(values)
+    
+    def attr_names(self):
+        return(list(self.__dict__.keys()))
+    
+    def views(self, row):
+        """
+        Return a dictionary {channel: values} with views (not copies) of 
+        the row values
+        """
+        n = self.lengths[row]
+        
+        return({channel: d_array[row, :n] for channel, d_array in self.data.items()})
+    
+    def values(self, well_name, channel):
+        """
+        Return a view of the values of a well channel
+        
+        well_name = well position
+        channel = channel name
+        """
+        row = self.index[well_name]
+        
+        return(self.data[channel][row, :self.lengths[row]])
+    
+    def is_view(self, channel, values):
+        """
+        True if values are (a view of) the store values of channel
+        """
+        if channel not in self.data or not isinstance(values, np.ndarray):
+            return(False)
+        
+        return(np.may_share_memory(values, self.data[channel]))
+    
+    def extend(self, row, values):
+        """
+        It appends values at the end of a row (e.g. the new cycles of a run
+        in progress). The channel arrays grow (filled with nan) when the row
+        gets longer than them, and the bound readings are bound again to the
+        new arrays.
+        
+        row = row of the well in the store
+        values = dictionary {channel: values to append}
+        
+        Return the number of appended values
+        """
+        n_old = self.lengths[row]
+        n_new = max([len(tail) for channel, tail in values.items() 
+                     if channel in self.data], default = 0)
+        
+        if n_new == 0:
+            return(0)
+        
+        rebind = False
+        
+        for channel, d_array in self.data.items():
+            
+            # grow the array, or copy it if it is read only (e.g. a memory map)
+            if n_old + n_new > d_array.shape[1] or not d_array.flags.writeable:
+                n_cols = max(n_old + n_new, d_array.shape[1])
+                
+                g_array = np.full((d_array.shape[0], n_cols), np.nan)
+                g_array[:, :d_array.shape[1]] = d_array
+                
+                self.data[channel] = g_array
+                rebind = True
+        
+        for channel, tail in values.items():
+            if channel in self.data:
+                self.data[channel][row, n_old:n_old + len(tail)] = tail
+        
+        self.lengths[row] = n_old + n_new
+        
+        if rebind == True:
+            for b_row, r_values in self.readings.items():
+                r_values.bind(self, b_row)
+        
+        elif row in self.readings:
+            self.readings[row].bind(self, row)
+        
+        return(n_new)
+
 class Parameter:
     def __init__(self, name, description, units, value, properties = None):
         """
@@ -239,6 +837,7 @@ class Well_set:
             filename origin of the data
         dset = list
             list of Data_set objects asociated to the Well_set
+            it is stored as a Dset_list (datasets indexed by name)
         clfs = list
             list of Classification objects asociated
         fgs = list
@@ -277,6 +876,18 @@ class Well_set:
                     pass
             self.fname = nr_list(fnames, False)
     
+    def __setattr__(self, name, value):
+        # dsets is always a Dset_list (datasets indexed by name)
+        if name == 'dsets' and type(value) == list:
+            value = Dset_list(value)
+        
+        object.__setattr__(self, name, value)
+    
+    def __setstate__(self, state):
+        # well_sets stored before dsets was a Dset_list
+        for name, value in state.items():
+            setattr(self, name, value)
+    
     def description(self):
         return f"'{self.name}' well_set. {self.description}"
         
@@ -314,28 +925,155 @@ class Well_set:
         """
         clf = self.clfs[clf_idx]
         
+        self.unindex_clf(clf)
+        
         for cath in clf.groups.keys():
             
             for well in clf.groups[cath]:
                 
-                for i in range(0,len(well.caths)):
-                    
-                    if cath == well.caths[i]:
-                        
-                        del well.caths[i]
-                        break
+                if cath in well.caths:
+                    well.caths.remove(cath)
                         
         del self.clfs[clf_idx]  
+        
+        self.cath_signature = self.caths_signature()
     
-
-class Database:
-    def __init__(self, name, folder, filename, list_names, description = ''):
+    def caths_signature(self):
+        # identity of the wells and their well_caths, used to check if cath_index 
+        # is updated (the indexed objects are referenced by it, so their ids 
+        # are not reused)
+        return(tuple([(id(well),) + tuple(map(id, well.caths)) for well in self.wells]))
+    
+    def caths_index(self):
         """
-        name = database descriptional name
-        folder = folder where database is stored
-        filename = filename of the database
-        list_names = names of lists where objects will be stored
-        description = text with description of the database
+        inverted index of the wells cathegories:
+            {(cathegory name, cathegory value): {well: cath}}
+        It is kept updated by the methods which modify the wells caths 
+        (add_caths, index_clf, remove_clf), and it is built again if the 
+        wells or their caths were modified in other way (e.g. by hand, a cath
+        replaced by other one) or the well_set was loaded.
+        
+        Return
+        ------
+        cath_index: dict
+        """
+        index = getattr(self, 'cath_index', None)
+        
+        if index == None or getattr(self, 'cath_signature', None) != self.caths_signature():
+            
+            index = dict()
+            
+            for well in self.wells:
+                for cath in well.caths:
+                    key = (cath.name, hashable_key(cath.value))
+                    index.setdefault(key, dict())[well] = cath
+            
+            self.cath_index = index
+            self.cath_signature = self.caths_signature()
+        
+        return(index)
+    
+    def add_caths(self, caths, wells):
+        """
+        it appends caths[i] to wells[i].caths and to the cathegory index at 
+        the same time, so the index is updated instead of built again
+        
+        caths: list of Well_cath objects
+        wells: list of Well objects (of the well_set)
+        """
+        # checked (or built) before the wells caths are modified
+        index = self.caths_index()
+        
+        for cath, well in zip(caths, wells):
+            well.caths.append(cath)
+            index.setdefault((cath.name, hashable_key(cath.value)), dict())[well] = cath
+        
+        self.cath_signature = self.caths_signature()
+    
+    def index_clf(self, clf):
+        """
+        add the cathegories of the Classification clf to its wells (well.caths)
+        and to the cathegory index (see add_caths)
+        """
+        caths = list()
+        wells = list()
+        
+        for cath, c_wells in clf.groups.items():
+            caths.extend([cath]*len(c_wells))
+            wells.extend(c_wells)
+        
+        self.add_caths(caths, wells)
+    
+    def unindex_clf(self, clf):
+        """
+        remove the groups of the Classification clf from the cathegory index
+        """
+        index = self.caths_index()
+        
+        for cath, wells in clf.groups.items():
+            key = (cath.name, hashable_key(cath.value))
+            group = index.get(key, dict())
+            
+            for well in wells:
+                if group.get(well) is cath:
+                    del group[well]
+            
+            if len(group) == 0 and key in index:
+                del index[key]
+    
+    def select(self, cath_name, cath_value, wells = None, display = False):
+        """
+        select the wells with a cathegory of name cath_name and value 
+        cath_value (like select_wells_cath, but using the cathegory index)
+        
+        Parameters
+        ----------
+        cath_name: string
+            cathegory.name value to search for in the selection
+        cath_value: indefined
+            cathegory.value to search for in the selection.
+            it could be a list of values
+        wells: list of Well objects
+            wells subject to selection, by default all the well_set wells.
+            The selection keeps their order.
+        display: boolean
+            if True, a list with well.wpos is print.
+        
+        Return
+        ------
+        selected_wells: list
+            list of selected Well objects
+        """
+        if type(cath_value) != list:
+            cath_value = [cath_value]
+        
+        if wells == None:
+            wells = self.wells
+        
+        index = self.caths_index()
+        
+        selected = dict()
+        for value in cath_value:
+            selected.update(index.get((cath_name, hashable_key(value)), dict()))
+        
+        selected_wells = [well for well in wells if well in selected]
+        
+        if display == True:
+            print(len(selected_wells),'wells were selected')
+            print('\nSelected Wells:')
+            print([well.wpos for well in selected_wells])
+        
+        return(selected_wells)
+    
+
+class Database:
+    def __init__(self, name, folder, filename, list_names, description = ''):
+        """
+        name = database descriptional name
+        folder = folder where database is stored
+        filename = filename of the database
+        list_names = names of lists where objects will be stored
+        description = text with description of the database
         
         """
         
@@ -394,11 +1132,94 @@ class Database:
         obj_list: list
             list with the objects to append
         """
+        added, duplicates = self.bulk_append(list_name, obj_list, display = False)
+        
+        for obj in duplicates:
+            print(str(obj),'was previously in',str(list_name)+'.','Not added again')
+    
+    def obj_key(self, obj, key = None):
+        """
+        key of obj used in the element indexes.
+        key: None, str, list of str or function
+            None --> object identity, str --> attribute value, 
+            list --> attribute values, function --> key(obj)
+        """
+        if key == None:
+            return(id(obj))
+        
+        elif callable(key):
+            return(hashable_key(key(obj)))
+        
+        elif type(key) == list:
+            return(hashable_key([getattr(obj, attr, None) for attr in key]))
+        
+        return(hashable_key(getattr(obj, key, None)))
+    
+    def list_index(self, list_name, key = None):
+        """
+        index {object key: position} of the elements[list_name] list 
+        (see obj_key). It is built in each call (one pass over the list), 
+        so it is not affected by previous modifications of the list and
+        the object ids are the ones of objects currently in it.
+        
+        Return
+        ------
+        index: dict
+        """
+        index = dict()
+        
+        for position, obj in enumerate(self.elements[list_name]):
+            index.setdefault(self.obj_key(obj, key), position)
+        
+        return(index)
+    
+    def bulk_append(self, list_name, obj_list, key = None, display = True):
+        """
+        It appends the objects of obj_list which are not in elements[list_name]
+        yet. The list is indexed once per call (see list_index), instead of 
+        search each object in the list.
+        
+        Parameters
+        ----------
+        list_name : str
+            name of the list where to add the objects in obj_list
+        obj_list: list
+            list with the objects to append
+        key: None, str, list of str or function
+            to compare the objects (see obj_key). By default objects are
+            compared by identity. e.g. key = ['fname','wpos'] for wells
+            or key = registry.register for a Well_registry
+        display: boolean
+            if True, the number of added and duplicated objects is print
+        
+        Return
+        ------
+        added: list
+            appended objects
+        duplicates: list
+            objects which were previously in the list (or repeated in obj_list)
+        """
+        elements = self.elements[list_name]
+        index = self.list_index(list_name, key)
+        
+        added = list()
+        duplicates = list()
+        
         for obj in obj_list:
-            if obj not in self.elements[list_name]:
-                self.elements[list_name].append(obj)
+            obj_key = self.obj_key(obj, key)
+            
+            if obj_key in index:
+                duplicates.append(obj)
             else:
-                print(str(obj),'was previously in',str(list_name)+'.','Not added again')
+                index[obj_key] = len(elements)
+                elements.append(obj)
+                added.append(obj)
+        
+        if display == True:
+            print(len(added),'objects were added to',str(list_name)+'.',
+                  len(duplicates),'were previously in it')
+        
+        return(added, duplicates)
     
     def save(self, folder = None, filename = None):
         """
@@ -446,6 +1267,139 @@ class Database:
 
 
 
+class Well_registry:
+    def __init__(self, name = 'wells', key_attrs = None):
+        """
+        Registry of global well keys --> stable integer ids.
+        Each well is identified by its key (experiment file, well position,
+        channel) --> by default (well.fname, well.wpos, well.reporter).
+        The same key always gets the same id, so wells of different 
+        well_sets/plates can be joined, deduplicated and used to index 
+        arrays with integer ids.
+        
+        name = registry name
+        key_attrs = list with the well attributes which define the key
+        keys = list with the registered keys, keys[well_id] is the key of well_id
+        ids = dictionary {key: well_id}
+        """
+        
+        if key_attrs == None:
+            key_attrs = ['fname', 'wpos', 'reporter']
+        
+        self.name = name
+        self.key_attrs = key_attrs
+        self.keys = list()
+        self.ids = dict()
+    
+    def description(self):
+        return f"'{self.name}' well registry with {len(self.keys)} keys ({self.key_attrs})"
+        
+    def __str__(self):
+        #to print some information instead of just the object memory location
+        return f"'{self.name}' well registry"
+    
+    def __len__(self):
+        return(len(self.keys))
+    
+    def get_attrs(self, attrs):
+        """
+        Return a list with the values of attrs
+        attrs: list of strings
+            list with the names of the attributes of interest
+        """
+        values = []
+        if type(attrs) != list:
+            attrs = [attrs]
+            
+        for attr in attrs:
+            values.append(getattr(self, attr))
+        return(values)
+    
+    def attr_names(self):
+        return(list(self.__dict__.keys()))
+    
+    def well_key(self, well):
+        """
+        key of well (hashable tuple with the key_attrs values)
+        """
+        return(tuple([hashable_key(getattr(well, attr, None)) for attr in self.key_attrs]))
+    
+    def register(self, well):
+        """
+        Return the id of well, a new one is assigned if its key is not registered
+        """
+        key = self.well_key(well)
+        well_id = self.ids.get(key)
+        
+        if well_id == None:
+            well_id = len(self.keys)
+            self.ids[key] = well_id
+            self.keys.append(key)
+        
+        return(well_id)
+    
+    def register_wells(self, wells):
+        """
+        Return np.array with the ids of wells (registering the new ones)
+        """
+        return(np.array([self.register(well) for well in wells], dtype = np.int64))
+    
+    def get_id(self, well, default = None):
+        """
+        Return the id of well or default if it is not registered
+        """
+        return(self.ids.get(self.well_key(well), default))
+    
+    def get_ids(self, wells):
+        """
+        Return np.array with the ids of wells (-1 if it is not registered)
+        """
+        return(np.array([self.ids.get(self.well_key(well), -1) for well in wells], dtype = np.int64))
+    
+    def dedupe(self, wells):
+        """
+        It removes the wells with a repeated key (the first one is kept)
+        
+        Return
+        ------
+        unique_wells: list
+        duplicates: list
+        """
+        seen = set()
+        unique_wells = list()
+        duplicates = list()
+        
+        for well, well_id in zip(wells, self.register_wells(wells)):
+            
+            if well_id in seen:
+                duplicates.append(well)
+            else:
+                seen.add(well_id)
+                unique_wells.append(well)
+        
+        return(unique_wells, duplicates)
+    
+    def join(self, wells_a, wells_b):
+        """
+        It pairs the wells of wells_a and wells_b with the same key
+        (e.g. the same well in two well_sets of the same experiment)
+        
+        Return
+        ------
+        pairs: list
+            list of (well_a, well_b) tuples, in wells_a order
+        """
+        b_wells = dict()
+        for well, well_id in zip(wells_b, self.register_wells(wells_b)):
+            b_wells.setdefault(well_id, well)
+        
+        pairs = list()
+        for well, well_id in zip(wells_a, self.register_wells(wells_a)):
+            if well_id in b_wells:
+                pairs.append((well, b_wells[well_id]))
+        
+        return(pairs)
+
 class Figure:
     def __init__(self, dset, clf, series, colors, title, x_text, y_text, ax_tsize, 
                  x_lim, y_lim, lgd_text, lgd_lines, log_scale, 
@@ -566,6 +1520,7 @@ class Data_set:
         """
         name = name of the dataset
         series = dictionary or list with the data_serie objects included in the data_set
+            or a Series_matrix when all the series share the x values
         x_name = name of x_series (e.g. Time)
         y_name = name of y_series (e.g. fluorescence)
         x_units = units of the x series
@@ -609,6 +1564,114 @@ class Data_set:
     def attr_names(self):
         return(list(self.__dict__.keys()))  
         
+class Series_matrix(dict):
+    """
+    Data_set series dictionary {well: Data_serie} for series which share 
+    the same x values (e.g. all the wells of a plate). 
+    It stores a single x vector and a 2-D y matrix (one row per serie), the 
+    Data_serie objects are lightweight views of them (serie.x is x and 
+    serie.y is a row of Y), so data_set.series[well] works as usual and 
+    whole dataset operations can be done over Y.
+    
+    x: np.array
+        shared x values
+    Y: 2-D np.array
+        y values of each serie by row
+    index: dict
+        {key: row index in Y}
+    """
+    def __init__(self, x = None, Y = None, keys = None, names = None):
+        """
+        x: list or np.array
+            shared x values
+        Y: 2-D list or np.array
+            y values, Y[i] are the y values of keys[i]
+        keys: list
+            series keys, usually Well objects
+        names: list
+            series names (by default Data_serie uses well.s_name)
+        """
+        dict.__init__(self)
+        
+        if keys == None:
+            keys = list()
+        
+        if names == None:
+            names = [None]*len(keys)
+        
+        self.x = np.asarray(x, dtype = float) if x is not None else np.zeros(0)
+        self.Y = np.asarray(Y, dtype = float) if Y is not None else np.zeros((0, len(self.x)))
+        self.index = dict()
+        
+        for row, (key, name) in enumerate(zip(keys, names)):
+            self.index[key] = row
+            dict.__setitem__(self, key, Data_serie(self.x, self.Y[row], key, name))
+    
+    def is_view(self, key):
+        """
+        True if the serie of key still is a view of x and Y
+        """
+        serie = self.get(key)
+        
+        if serie == None or key not in self.index:
+            return(False)
+        
+        return(serie.x is self.x and isinstance(serie.y, np.ndarray) and 
+               np.may_share_memory(serie.y, self.Y))
+    
+    def rows(self, keys = None):
+        """
+        Y rows of keys (all by default), as a 2-D array
+        """
+        if keys == None:
+            keys = list(self.keys())
+        
+        return(self.Y[[self.index[key] for key in keys]])
+    
+    def max_y(self):
+        """
+        maximum y value of all the series
+        """
+        views = [self.is_view(key) for key in self.keys()]
+        
+        if all(views) and len(views) == len(self.Y):
+            return(np.max(self.Y))
+        
+        return(max([np.max(serie.y) for serie in self.values()]))
+    
+    def __reduce__(self):
+        # views are stored without their x, y values, they are taken from
+        # x and Y again when the series are loaded
+        series = list()
+        
+        for key, serie in self.items():
+            if self.is_view(key):
+                attrs = {name: value for name, value in inspect(serie).items() 
+                         if name not in ['x', 'y']}
+                series.append((key, type(serie), attrs))
+            else:
+                series.append((key, serie, None))
+        
+        state = {'x': self.x, 'Y': self.Y, 'index': self.index, 'series': series}
+        
+        return(Series_matrix, (), state)
+    
+    def __setstate__(self, state):
+        series = state.pop('series')
+        self.__dict__.update(state)
+        
+        for key, serie, attrs in series:
+            if attrs != None:
+                s_class = serie
+                serie = s_class.__new__(s_class)
+                serie.x = self.x
+                serie.y = self.Y[self.index[key]]
+                
+                for name, value in attrs.items():
+                    setattr(serie, name, value)
+            
+            dict.__setitem__(self, key, serie)
+
 class Classification:
     def __init__(self, name, classes, wells, groups):#, w_caths):
         """
@@ -968,62 +2031,416 @@ class Component:
         else:
             print('There is no',sc_name,'sub-component')
         
-def inspect(obj):
+class Compact_obj:
     """
-    To display all the attributes included in the object and its values
+    Base of the compact (__slots__) versions of the most numerous objects of
+    a database (Well, Well_cath, Reading, Parameter and Data_serie).
+    Their attributes (fields) are stored in slots instead of a dictionary 
+    (objects have no __dict__), so they use less memory and they are faster 
+    to pickle/unpickle.
     
-    Parameters
-    ----------
+    New attributes can still be added with setattr(obj, new_attribute, value),
+    they are stored in the extras dictionary (_extras slot, only created 
+    when it is used).
+    """
+    __slots__ = ()
+    fields = ()
     
-    obj: object
+    def __getattr__(self, name):
+        # only called when name is not a (assigned) field
+        extras = self.extras_state()
+        
+        if extras != None and name in extras:
+            return(extras[name])
+        
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
-    Return
-    ------
-    dictionary of object attributes
-    """
+    def __setattr__(self, name, value):
+        
+        if name in self.fields:
+            object.__setattr__(self, name, value)
+        else:
+            self.extras[name] = value
     
-    return(obj.__dict__)
-
-def attr_names(obj):
-    """
-    To get the attibutes names included in the object
+    def __delattr__(self, name):
+        
+        if name in self.fields:
+            object.__delattr__(self, name)
+        
+        elif name in self.extras:
+            del self.extras[name]
+        
+        else:
+            raise AttributeError(name)
     
-    Parameters
-    ----------
+    @property
+    def extras(self):
+        """
+        dictionary with the attributes added to the object (not in fields)
+        """
+        extras = self.extras_state()
+        
+        if extras == None:
+            extras = dict()
+            object.__setattr__(self, '_extras', extras)
+        
+        return(extras)
     
-    obj: object
+    def extras_state(self):
+        """
+        extras dictionary or None if there are no extra attributes
+        """
+        try:
+            extras = object.__getattribute__(self, '_extras')
+        except AttributeError:
+            return(None)
+        
+        if extras == None or len(extras) == 0:
+            return(None)
+        
+        return(extras)
     
-    Return
-    ------
-    list of object attribute names
+    def __getstate__(self):
+        return(tuple([getattr(self, name) for name in self.fields]) + (self.extras_state(),))
+    
+    def __setstate__(self, state):
+        
+        for name, value in zip(self.fields, state):
+            object.__setattr__(self, name, value)
+        
+        if state[-1] != None:
+            object.__setattr__(self, '_extras', dict(state[-1]))
+    
+    def attr_dict(self):
+        """
+        dictionary with the attributes of the object and its values
+        (fields and extras), the equivalent of obj.__dict__
+        """
+        attrs = dict()
+        
+        for name in self.fields:
+            try:
+                attrs[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        
+        extras = self.extras_state()
+        
+        if extras != None:
+            attrs.update(extras)
+        
+        return(attrs)
+    
+    def get_attrs(self, attrs):
+        """
+        Return a list with the values of attrs
+        attrs: list of strings
+            list with the names of the attributes of interest
+        """
+        values = []
+        if type(attrs) != list:
+            attrs = [attrs]
+            
+        for attr in attrs:
+            values.append(getattr(self, attr))
+        return(values)
+    
+    def attr_names(self):
+        return(list(self.attr_dict().keys()))
+
+class Compact_well(Compact_obj):
     """
+    Compact version of Well. Same arguments and attributes.
+    """
+    fields = ('fname', 'exp', 'wpos', 's_name', 'reporter', 'target', 'data', 
+              'analysis', 'caths')
+    __slots__ = fields + ('_extras',)
     
-    keys = obj.__dict__.keys()
+    __init__ = Well.__init__
+    description = Well.description
+    __str__ = Well.__str__
     
-    return(list(keys))
+    def __setattr__(self, name, value):
+        # analysis and data are always indexed lists (by name and r_name)
+        if name == 'analysis' and type(value) == list:
+            value = Analysis_list(value)
+        
+        elif name == 'data' and type(value) == list:
+            value = Data_list(value)
+        
+        Compact_obj.__setattr__(self, name, value)
     
-def copy_obj(obj, template):
+    def __setstate__(self, state):
+        Compact_obj.__setstate__(self, state)
+        
+        # lists of objects pickled before they were indexed
+        for name in ['data', 'analysis']:
+            if type(getattr(self, name)) == list:
+                setattr(self, name, getattr(self, name))
+
+class Compact_well_cath(Compact_obj):
     """
-    It copy all the attributes of template objects and its values to obj.
-    be carefull, if the copied values are custom objects they aren´t lirerally copies 
-    but just referenced. 
-    --> any modification of that values in the copied object 
-    will modify the original ones.
-    As deepcopy is used, python regular object will be proper independe copies.
+    Compact version of Well_cath. Same arguments and attributes.
+    As in Well_cath, obj.description is the cathegory description text.
+    """
+    fields = ('name', 'value', 'description', 'spacer')
+    __slots__ = fields + ('_extras',)
     
+    __init__ = Well_cath.__init__
+    __str__ = Well_cath.__str__
+
+class Compact_reading(Compact_obj):
+    """
+    Compact version of Reading. Same arguments and attributes.
     """
+    fields = ('sheet', 'well', 'r_name', 'values', 'units', 'signal', 'd_types')
+    __slots__ = fields + ('_extras',)
     
-    attrs = template.__dict__.keys()
+    __init__ = Reading.__init__
+    description = Reading.description
+    __str__ = Reading.__str__
+
+class Compact_parameter(Compact_obj):
+    """
+    Compact version of Parameter. Same arguments and attributes.
+    As in Parameter, obj.description is the parameter description text.
+    """
+    fields = ('name', 'description', 'value', 'units', 'properties')
+    __slots__ = fields + ('_extras',)
     
-    for attr in attrs:
-        value = getattr(template, attr)
-        v_copy = deepcopy(value)
-            
-        setattr(obj, attr, v_copy)
+    __init__ = Parameter.__init__
+    __str__ = Parameter.__str__
 
-def reaction_from_template(template, name, description = ''):
+class Compact_data_serie(Compact_obj):
     """
-    it creates a new reaction based on a template reaction.
+    Compact version of Data_serie. Same arguments and attributes.
+    """
+    fields = ('x', 'y', 'well', 'name')
+    __slots__ = fields + ('_extras',)
+    
+    __init__ = Data_serie.__init__
+    description = Data_serie.description
+    __str__ = Data_serie.__str__
+
+## regular class --> compact class (see compact_obj)
+compact_classes = {Well: Compact_well, Well_cath: Compact_well_cath, 
+                   Reading: Compact_reading, Parameter: Compact_parameter, 
+                   Data_serie: Compact_data_serie}
+
+def compact_obj(obj, memo = None):
+    """
+    It returns the compact version of obj (see Compact_obj) with the same 
+    attributes values (they are not copied). Objects without a compact 
+    version are returned as they are.
+    
+    Parameters
+    ----------
+    obj: object
+        e.g. Well, Well_cath, Reading, Parameter or Data_serie object
+    memo: dict
+        {id(obj): (obj, compact obj)} of the already converted objects, 
+        to convert each object only once and keep shared references
+    
+    Return
+    ------
+    compact object
+    """
+    if memo == None:
+        memo = dict()
+    
+    if id(obj) in memo:
+        return(memo[id(obj)][1])
+    
+    c_class = compact_classes.get(type(obj))
+    
+    if c_class == None:
+        return(obj)
+    
+    c_obj = c_class.__new__(c_class)
+    
+    # fields missing in obj (e.g. old objects) are set as None
+    for name in c_class.fields:
+        setattr(c_obj, name, None)
+    
+    for name, value in obj.__dict__.items():
+        setattr(c_obj, name, value)
+    
+    memo[id(obj)] = (obj, c_obj)
+    
+    return(c_obj)
+
+def compact_graph(root, memo = None, display = True):
+    """
+    It replaces, in place, every Well, Well_cath, Reading, Parameter and 
+    Data_serie object reachable from root by its compact version.
+    Lists and dictionaries (including dictionary keys, e.g. Classification 
+    groups) and the attributes of the objects of this module are explored.
+    Shared objects are converted only once, so references between
+    objects (e.g. well.caths and Classification.groups) are kept.
+    
+    Parameters
+    ----------
+    root: list, dict or object
+        e.g. database.elements, a Well_set or a list of wells
+    memo: dict
+        {id(obj): (obj, compact obj)} see compact_obj
+    
+    Return
+    ------
+    root (or its compact version)
+    """
+    if memo == None:
+        memo = dict()
+    
+    root = compact_obj(root, memo)
+    
+    visited = set()
+    pending = [root]
+    
+    while len(pending) > 0:
+        item = pending.pop()
+        
+        if id(item) in visited:
+            continue
+        visited.add(id(item))
+        
+        if isinstance(item, list):
+            for i, value in enumerate(item):
+                c_value = compact_obj(value, memo)
+                
+                if c_value is not value:
+                    item[i] = c_value
+                pending.append(c_value)
+        
+        elif isinstance(item, dict):
+            items = list(dict.items(item))
+            c_items = [(compact_obj(key, memo), compact_obj(value, memo)) for key, value in items]
+            
+            if any(c_key is not key or c_value is not value for 
+                   (key, value), (c_key, c_value) in zip(items, c_items)):
+                
+                item.clear()
+                item.update(c_items)
+            
+            for key, value in c_items:
+                pending.append(key)
+                pending.append(value)
+            
+            # attributes of dictionaries of this module (e.g. Series_matrix.index)
+            if type(item).__module__ == __name__ and hasattr(item, '__dict__'):
+                pending.append(item.__dict__)
+        
+        elif isinstance(item, tuple):
+            pending.extend(item)
+        
+        elif isinstance(item, Compact_obj):
+            for name, value in item.attr_dict().items():
+                c_value = compact_obj(value, memo)
+                
+                if c_value is not value:
+                    setattr(item, name, c_value)
+                pending.append(c_value)
+        
+        elif type(item).__module__ == __name__ and hasattr(item, '__dict__'):
+            for name, value in list(item.__dict__.items()):
+                c_value = compact_obj(value, memo)
+                
+                if c_value is not value:
+                    item.__dict__[name] = c_value
+                pending.append(c_value)
+    
+    if display == True:
+        counts = dict()
+        for obj, c_obj in memo.values():
+            counts[type(c_obj).__name__] = counts.get(type(c_obj).__name__, 0) + 1
+        
+        for c_name, count in counts.items():
+            print(count, c_name, 'objects were created')
+    
+    return(root)
+
+def compact_database(database, display = True):
+    """
+    It converts all the Well, Well_cath, Reading, Parameter and Data_serie
+    objects stored in the database (and inside its well_sets, datasets, 
+    classifications, etc.) into their compact versions (see Compact_obj).
+    Save the database afterwards to keep the smaller version.
+    
+    Parameters
+    ----------
+    database: Database object
+    
+    Return
+    ------
+    database: Database object
+    """
+    compact_graph(database.elements, display = display)
+    
+    if display == True:
+        print('\n"'+str(database.name)+'" database was compacted')
+    
+    return(database)
+
+def inspect(obj):
+    """
+    To display all the attributes included in the object and its values
+    
+    Parameters
+    ----------
+    
+    obj: object
+    
+    Return
+    ------
+    dictionary of object attributes
+    """
+    
+    # compact objects keep their attributes in slots, not in __dict__ (see Compact_obj)
+    if isinstance(obj, Compact_obj):
+        return(obj.attr_dict())
+    
+    return(obj.__dict__)
+
+def attr_names(obj):
+    """
+    To get the attibutes names included in the object
+    
+    Parameters
+    ----------
+    
+    obj: object
+    
+    Return
+    ------
+    list of object attribute names
+    """
+    
+    keys = inspect(obj).keys()
+    
+    return(list(keys))
+    
+def copy_obj(obj, template):
+    """
+    It copy all the attributes of template objects and its values to obj.
+    be carefull, if the copied values are custom objects they aren´t lirerally copies 
+    but just referenced. 
+    --> any modification of that values in the copied object 
+    will modify the original ones.
+    As deepcopy is used, python regular object will be proper independe copies.
+    
+    """
+    
+    attrs = attr_names(template)
+    
+    for attr in attrs:
+        value = getattr(template, attr)
+        v_copy = deepcopy(value)
+            
+        setattr(obj, attr, v_copy)
+
+def reaction_from_template(template, name, description = ''):
+    """
+    it creates a new reaction based on a template reaction.
     The objects included from the template are shared --> be carfull
     with the modifications to them.
     
@@ -1075,7 +2492,8 @@ def print_list(xlist, attr = None):
         
         print('[' + str(i) + ']', value )
         
-def create_dataset(well_set, limits = [0,None], dset_name = None, append = True):
+def create_dataset(well_set, limits = [0,None], dset_name = None, append = True, 
+                   shared_x = False):
     """
     it creates and append a data_set to input well_set.
     With "limits" parameter you are able to not use the whole readings but
@@ -1096,6 +2514,10 @@ def create_dataset(well_set, limits = [0,None], dset_name = None, append = True)
         
     append: Boolean
         if True the created Data_set is append to Well_set
+    
+    shared_x: Boolean
+        if True and all the wells have the same x values, the series are
+        stored as a Series_matrix (one x vector and a 2-D y matrix)
     """
    
     wells = well_set.wells
@@ -1142,12 +2564,10 @@ def create_dataset(well_set, limits = [0,None], dset_name = None, append = True)
     
     for well in wells:
         
-        for idx in range(0,len(well.data)):
-            if data_name == well.data[idx].r_name:
-                data_id = idx
+        reading = well.data.get(data_name)
                 
-        x_values = well.data[data_id].values[x_name]
-        y_values = well.data[data_id].values[y_name]
+        x_values = reading.values[x_name]
+        y_values = reading.values[y_name]
         
         if limits[0] != None:
             x_values = x_values[limits[0]:]
@@ -1158,6 +2578,21 @@ def create_dataset(well_set, limits = [0,None], dset_name = None, append = True)
             y_values = y_values[:limits[1]]            
         
         data_series[well] = Data_serie(x_values, y_values, well)
+    
+    ## series with the same x values --> Series_matrix
+    if shared_x == True and len(data_series) > 0:
+        
+        series = list(data_series.values())
+        x_ref = np.asarray(series[0].x, dtype = float)
+        
+        if all(len(serie.x) == len(x_ref) and np.array_equal(np.asarray(serie.x, dtype = float), x_ref) 
+               for serie in series):
+            
+            Y = np.vstack([np.asarray(serie.y, dtype = float) for serie in series])
+            data_series = Series_matrix(x_ref, Y, list(data_series.keys()))
+        
+        else:
+            print('\nwells have different x values, series are not shared')
         
     ## create the Data_set
     dset = Data_set(dset_name, data_series, x_name, y_name, x_units, y_units)
@@ -1187,30 +2622,35 @@ def create_classification(well_set, wells, w_cath_values, clf_name,
     
     """
     ## first of all, check if wells are part of well_set ##
+    set_wells = set([id(well) for well in well_set.wells])
+    
     for well in wells:
-        if well not in well_set.wells:
+        if id(well) not in set_wells:
             return
     
     # create non-redundant cathegory object (i.e. one per cathegory value)
     nr_caths_objs = create_cathegories(clf_name, w_cath_values, spacer = spacer) 
     
+    # {cathegory value: cath_obj}
+    value_caths = dict()
+    for cath_obj in nr_caths_objs:
+        value_caths.setdefault(unique_key(cath_obj.value), cath_obj)
+    
     class_groups = {}   #{cath_obj: [wells]}
-    w_caths = []        # used to append Well_cath to each well at the end
     
     for cath, well in zip(w_cath_values , wells):
         #create the dictionary with list of elements in each cathegory
-        for cath_obj in nr_caths_objs:
-            if cath_obj.value == cath:
-                
-                w_caths.append(cath_obj)
-                
-                #to create each cath list just one time
-                if cath_obj not in list(class_groups.keys()):  
+        cath_obj = value_caths.get(unique_key(cath))
         
-                    class_groups[cath_obj] = []
-                
-                #append the well to the classification list
-                class_groups[cath_obj].append(well) 
+        if cath_obj != None:
+            
+            #to create each cath list just one time
+            if cath_obj not in class_groups:  
+    
+                class_groups[cath_obj] = []
+            
+            #append the well to the classification list
+            class_groups[cath_obj].append(well) 
                 
     # create the classification #
     classification = Classification(clf_name, nr_caths_objs, wells, class_groups)#, w_caths)
@@ -1237,9 +2677,8 @@ def create_classification(well_set, wells, w_cath_values, clf_name,
         print("\n'"+str(classification.name)+"' classification "\
         "was append to '"+str(well_set.name)+"' well_set")
         
-        # append cathegory object to the proper well object
-        for cath_obj, well in zip(w_caths , wells):
-            well.caths.append(cath_obj)
+        # append cathegory object to the proper well object (and index it)
+        well_set.index_clf(classification)
         
     else:
         return(classification)
@@ -1298,15 +2737,17 @@ def join_clfs(well_set, wells, clfs_idx, clf_name, append =True, spacer = '&'):
     
     w_cath_values = []
     
+    # Well_cath objects of each classification
+    clfs_caths = [set([id(cath) for cath in well_set.clfs[idx].classes]) for idx in clfs_idx]
+    
     for well in wells:
         caths_join_value = ''
         
-        for idx in clfs_idx:      
-            caths = well_set.clfs[idx].classes
+        for caths in clfs_caths:      
             
             # search which cathegory is in well and join its value
-            for cath in caths:
-                if cath in well.caths:
+            for cath in well.caths:
+                if id(cath) in caths:
                     
                     if caths_join_value == '':
                         caths_join_value = str(cath.value)
@@ -1424,13 +2865,15 @@ def get_current_labels(clf):
     
     return(labels)
     
-def assign_caths_to_wells(cathegory_objects, wells):
+def assign_caths_to_wells(cathegory_objects, wells, well_set = None):
     """
     it assumes cathegory_values and wells are same lenght and are in the desired order. 
     i.e. cathegory_objects[i] is assigned to wells[i]
     
     cathegory_objects: cathegory objects of each well. List of objects
     wells: wells objects to assign the cathegory values. List of objects
+    well_set: Well_set object of the wells (optional)
+        if it is given, its cathegory index is updated (see Well_set.add_caths)
     
     """
     if type(cathegory_objects) != list:
@@ -1453,7 +2896,10 @@ def assign_caths_to_wells(cathegory_objects, wells):
         
         if previous == False:
             
-            well.caths.append(cath)
+            if well_set != None:
+                well_set.add_caths([cath], [well])
+            else:
+                well.caths.append(cath)
 
 def well_param_assignation(param_obj, well, ask = False):
     """
@@ -1472,40 +2918,30 @@ def well_param_assignation(param_obj, well, ask = False):
             
     """
     ## check if there is a previous version and replace it
-    assigned = False
-    if well.analysis:
-        for i in range(0,len(well.analysis)):
-            param_i = well.analysis[i]
-            if param_obj.name == param_i.name:
-                
-                if ask == True:
-                    
-                    print('\nThere is a previous version of '+str(param_obj.name))
-                    replace = input('\nIt will be replaced. Please confirm (y/n): ')
-                    
-                    while not (replace  == 'y' or replace == 'n'):
-                        print('\n invalud input')
-                        replace = input('\nIt will be replaced. Please confirm (y/n): ')
-                    
-                    if replace == 'y':
-                        well.analysis[i] = param_obj # --> well assignation
-                        assigned = True
-                        print("Parameter assigned")
-                        break
-                    else:
-                        # old version is keep and the new one is lost
-                        assigned = True
-                        print("Old version parameter was keep and the new discarded")
-                        break
-                
-                else:
-                    #replace withput ask confirmation
-                    well.analysis[i] = param_obj # --> well assignation
-                    assigned = True
-                    break
-
-    if assigned == False:
+    i = well.analysis.position(param_obj.name)
+    
+    if i == None:
         well.analysis.append(param_obj) # --> well assignation
+    
+    elif ask == True:
+        
+        print('\nThere is a previous version of '+str(param_obj.name))
+        replace = input('\nIt will be replaced. Please confirm (y/n): ')
+        
+        while not (replace  == 'y' or replace == 'n'):
+            print('\n invalud input')
+            replace = input('\nIt will be replaced. Please confirm (y/n): ')
+        
+        if replace == 'y':
+            well.analysis[i] = param_obj # --> well assignation
+            print("Parameter assigned")
+        else:
+            # old version is keep and the new one is lost
+            print("Old version parameter was keep and the new discarded")
+    
+    else:
+        #replace withput ask confirmation
+        well.analysis[i] = param_obj # --> well assignation
 
 def dset_assignation(wset, n_dset, attr = 'name', ask = False):
     """
@@ -1538,49 +2974,44 @@ def dset_assignation(wset, n_dset, attr = 'name', ask = False):
     
     ## seach previos if there is a previous version of n_dset
     dsets = wset.dsets
-    for i in range(0,len(dsets)):
+    
+    if attr == 'name' and isinstance(dsets, Dset_list):
+        # datasets indexed by name, if there are duplicated names the
+        # indexed one (the last, as find_dataset) is replaced
+        i = dsets.position(n_dset_attr)
+    else:
+        i = next((j for j in range(0,len(dsets)) if getattr(dsets[j],attr) == n_dset_attr), None)
+    
+    if i != None:
         
-        dset_attr = getattr(dsets[i],attr)
-                
-        if dset_attr == n_dset_attr:
-            
-            
-            if ask == True:
-
-                print('\nThere is a previous version of "'+str(n_dset_attr)+'"')
-                replace = input('\nIt will be replaced. Please confirm (y/n): ')
+        prev = True
+        
+        if ask == True:
 
-                while not (replace  == 'y' or replace == 'n'):
-                    print('\n invalid input')
-                    replace = input('\nIt will be replaced. Please confirm (y/n): ')
+            print('\nThere is a previous version of "'+str(n_dset_attr)+'"')
+            replace = input('\nIt will be replaced. Please confirm (y/n): ')
 
-                if replace == 'y':
-                    wset.dsets[i] = n_dset
-                    prev = True
-                    print("Dataset replaced/actualized")
-                    break
-                
-                else:
-                    # old version is keep and the new one is lost
-                    prev = True
-                    print("Old version was keep and the new discarded")
-                    break
+            while not (replace  == 'y' or replace == 'n'):
+                print('\n invalid input')
+                replace = input('\nIt will be replaced. Please confirm (y/n): ')
 
+            if replace == 'y':
+                wset.dsets[i] = n_dset
+                print("Dataset replaced/actualized")
+            
             else:
-                #replace without ask confirmation
-                wset.dsets[i] = n_dset 
-                print('Dataset "'+str(n_dset_attr)+'"'+' replaced/actualized')
-                prev = True
-                break
+                # old version is keep and the new one is lost
+                print("Old version was keep and the new discarded")
+
+        else:
+            #replace without ask confirmation
+            wset.dsets[i] = n_dset 
+            print('Dataset "'+str(n_dset_attr)+'"'+' replaced/actualized')
 
     if prev == False:
         wset.dsets.append(n_dset)
         
-        try:
-            print('Dataset "'+str(n_dset_attr)+'"'+' assigned in position',i+1)
-        
-        except:
-            print('Dataset "'+str(n_dset_attr)+'"'+' assigned in position 0')
+        print('Dataset "'+str(n_dset_attr)+'"'+' assigned in position',len(wset.dsets)-1)
            
 
 def copy_figure(figure):
@@ -1690,16 +3121,116 @@ def reset_wells_data(wells):
     for well in wells:
         well.data = list()
 
+def unique_key(element):
+    """
+    it returns the key used to compare elements in unique_list.
+    All the NaN values have the same key, np.arrays are compared by their 
+    values and other unhashable elements by hashable_key.
+    """
+    if isinstance(element, np.ndarray):
+        return(('np.array', element.dtype.str, element.shape, element.tobytes()))
+    
+    elif isinstance(element, (float, np.floating)) and element != element:
+        return('NaN element')
+    
+    try:
+        hash(element)
+        return(element)
+    except TypeError:
+        return(('unhashable', hashable_key(element)))
+
+def unique_list(a_list, return_inverse = False):
+    """
+    It gives the non redundant elements of a_list keeping their order of 
+    appearance (hash based --> linear time).
+    Elements are compared by unique_key.
+    
+    Parameters
+    ----------
+    a_list: list or np.array
+        any list
+    return_inverse: boolean
+        if True, also return the inverse indexes 
+        (i.e. a_list[i] is nr_elements[inverse[i]]), useful to group values
+        in one pass
+    
+    Return
+    ------
+    nr_elements: list
+        non redundant elements of a_list
+    inverse: np.array
+        only if return_inverse == True
+    """
+    ## numeric arrays --> numpy unique reordered by first appearance
+    if isinstance(a_list, np.ndarray) and a_list.ndim == 1 and a_list.dtype.kind in 'biuf':
+        
+        u_values, first, inverse = np.unique(a_list, return_index = True, return_inverse = True)
+        
+        order = np.argsort(first)
+        rank = np.empty(len(order), dtype = np.int64)
+        rank[order] = np.arange(len(order))
+        
+        nr_elements = [a_list[i] for i in first[order]]
+        
+        if return_inverse == True:
+            return(nr_elements, rank[inverse.reshape(-1)])
+        
+        return(nr_elements)
+    
+    ## any list --> {element key: position}
+    keys = dict()
+    nr_elements = []
+    inverse = []
+    
+    for element in a_list:
+        
+        key = unique_key(element)
+        position = keys.get(key)
+        
+        if position == None:
+            position = len(nr_elements)
+            keys[key] = position
+            nr_elements.append(element)
+        
+        inverse.append(position)
+    
+    if return_inverse == True:
+        return(nr_elements, np.array(inverse, dtype = np.int64))
+    
+    return(nr_elements)
+
+def group_values(values, inverse, n_groups):
+    """
+    It splits values in groups in one pass.
+    
+    Parameters
+    ----------
+    values: np.array
+        values to group
+    inverse: np.array
+        group index of each value (e.g. from unique_list)
+    n_groups: int
+        number of groups
+    
+    Return
+    ------
+    groups: list
+        groups[i] is an np.array with values[inverse == i]
+    """
+    values = np.asarray(values)
+    inverse = np.asarray(inverse, dtype = np.int64)
+    
+    order = np.argsort(inverse, kind = 'stable')
+    counts = np.bincount(inverse, minlength = n_groups)
+    
+    return(np.split(values[order], np.cumsum(counts)[:-1]))
+
 def nr_list(a_list, display = True):
     """
     a_list = any list
     display = if True the non redundant list is printed
     """
-    nr_list = []
-    for element in a_list:
-        
-        if element not in nr_list:
-            nr_list.append(element)
+    nr_list = unique_list(a_list)
             
     if display == True:
         print('non redundant list: \n')
@@ -1754,6 +3285,7 @@ def select_objects(obj_list, att_name, att_values, not_in = False):
           over the output list obtained with the first att_name 
         - for OR logic selection, run the function for each att_name over the 
           well_list. Then use nr_list function over them.
+      or use select_query, which does it in one pass.
     
     well_list = list of well objects
     att_name = attribute name to select the wells
@@ -1790,42 +3322,398 @@ def select_objects(obj_list, att_name, att_values, not_in = False):
     
     return(selected_objs)
 
-def f_10exp_lineal(x, params, inverse = False):
-    
+def attr_columns(obj_list, att_names):
     """
-    compute the exponential -linear exponent- function value with given parameters
-
+    It gives the values of the attributes of the objects as columns 
+    (one np.array per attribute, objects without the attribute have None).
+    
     Parameters
     ----------
-        x: int or vector
-            independent variable values
-        params: list
-            it shpuld contain next paramters:
-            a: double
-
-            b: double
-                slope parameter
-
-            n: double 
-                normalization paramater
-
-    Returns
-    -------
-    evaluated exponential with linear exponent function with the given parameters for the given x
-    """
-    a = params[0]
-    b = params[1]
-    n = params[2]
+    obj_list: list
+        e.g. list of Well objects
+    att_names: list of strings
+        attribute names. ('cath', cath_name) gives the value of the Well_cath
+        with name cath_name of each object (well.caths)
     
-    if inverse  == False:
-        fx = n*10**(a*x+b)
+    Return
+    ------
+    columns: dict
+        {att_name: np.array (dtype object)}
+    """
+    columns = dict()
     
-    if inverse == True:
-        fx = (np.log10(x/n)-b)/a      #inverse function
+    for att_name in att_names:
+        
+        column = np.empty(len(obj_list), dtype = object)
+        
+        if type(att_name) == tuple and att_name[0] == 'cath':
+            
+            for i, obj in enumerate(obj_list):
+                for cath in getattr(obj, 'caths', list()):
+                    if cath.name == att_name[1]:
+                        column[i] = cath.value
+                        break
+        
+        else:
+            for i, obj in enumerate(obj_list):
+                column[i] = getattr(obj, att_name, None)
+        
+        columns[att_name] = column
+    
+    return(columns)
+
+def compile_query(conditions, logic = 'and'):
+    """
+    It compiles a compound selection over several attributes, to use it 
+    with select_query. 
+    
+    Parameters
+    ----------
+    conditions: list
+        list of (att_name, operator, value) conditions. Operators:
+            '==', '!=': equal (or not) to value. if value is a list, 
+                equal to any of them
+            'in', 'not in': value is part or equal to the attribute value
+                (as select_objects). if value is a list, any of them
+            'isin': attribute value is one of value list
+            'range': value[0] <= attribute value <= value[1] (None = no limit)
+            '<', '<=', '>', '>=': numerical comparison with value
+            'cath': the object has a Well_cath with name att_name and 
+                value (or one of value list)
+        e.g. [('target','==','N gene'), ('conc','range',[0.1, 10]), 
+              ('Enzymes','cath',['Bst','Bsm'])]
+    logic: str
+        'and' or 'or' to join the conditions
+    
+    Return
+    ------
+    query: function
+        query(obj_list) --> boolean np.array (mask) of the selected objects.
+        query.att_names has the used attribute names
+    """
+    if type(conditions) == tuple:
+        conditions = [conditions]
+    
+    if logic not in ['and', 'or']:
+        raise ValueError("logic has to be 'and' or 'or'")
+    
+    def part_of(value, obj_value):
+        try:
+            return(value in obj_value)
+        except TypeError:
+            return(False)
+    
+    tests = list()
+    att_names = list()
+    
+    for att_name, operator, value in conditions:
+        
+        values = value if type(value) == list else [value]
+        
+        if operator == 'cath':
+            att_name = ('cath', att_name)
+            operator = 'isin'
+        
+        if operator in ['==', '!=', 'isin']:
+            keys = set([unique_key(v) for v in values])
+            test = lambda column, keys = keys: np.array([unique_key(v) in keys for v in column], dtype = bool)
+            
+            if operator == '!=':
+                test = lambda column, test = test: ~test(column)
+        
+        elif operator in ['in', 'not in']:
+            test = lambda column, values = values: np.array([any(part_of(v, obj_v) for v in values) 
+                                                             for obj_v in column], dtype = bool)
+            if operator == 'not in':
+                test = lambda column, test = test: ~test(column)
+        
+        elif operator == 'range':
+            low = -np.inf if value[0] == None else value[0]
+            high = np.inf if value[1] == None else value[1]
+            test = lambda column, low = low, high = high: (lambda x: (x >= low) & (x <= high))(
+                np.array([to_float(v) for v in column], dtype = float))
+        
+        elif operator in ['<', '<=', '>', '>=']:
+            compare = {'<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal}[operator]
+            test = lambda column, compare = compare, value = value: compare(
+                np.array([to_float(v) for v in column], dtype = float), value)
+        
+        else:
+            raise ValueError('unknown operator: '+str(operator))
+        
+        tests.append((att_name, test))
+        
+        if att_name not in att_names:
+            att_names.append(att_name)
+    
+    def query(obj_list):
+        
+        columns = attr_columns(obj_list, att_names)
+        
+        if logic == 'and':
+            mask = np.ones(len(obj_list), dtype = bool)
+            for att_name, test in tests:
+                mask &= test(columns[att_name])
+        else:
+            mask = np.zeros(len(obj_list), dtype = bool)
+            for att_name, test in tests:
+                mask |= test(columns[att_name])
+        
+        return(mask)
+    
+    query.att_names = att_names
+    
+    return(query)
+
+def select_query(obj_list, conditions, logic = 'and', mask = False, display = True):
+    """
+    select the objects from obj_list which fulfill the conditions, in one 
+    pass over the attributes values (see compile_query).
+    e.g. select_query(wells, [('target','==','N gene'), ('Enzymes','cath','Bst')])
+    
+    Parameters
+    ----------
+    obj_list: list
+        e.g. list of Well objects
+    conditions: list or function
+        list of (att_name, operator, value) conditions (see compile_query)
+        or a query already compiled with compile_query
+    logic: str
+        'and' or 'or' to join the conditions
+    mask: Boolean
+        if True, return the boolean mask instead of the objects
+    display: Boolean
+        if True, the number of selected objects is print
+    
+    Return
+    ------
+    selected_objs: list
+        list of selected objects (or boolean np.array if mask == True)
+    """
+    if callable(conditions):
+        query = conditions
+    else:
+        query = compile_query(conditions, logic)
+    
+    s_mask = query(obj_list)
+    
+    if display == True:
+        print(str(int(s_mask.sum())),'objects were selected based on',str(query.att_names),'attributes\n')
+    
+    if mask == True:
+        return(s_mask)
+    
+    return([obj for obj, selected in zip(obj_list, s_mask) if selected])
+
+def f_10exp_lineal(x, params, inverse = False):
+    
+    """
+    compute the exponential -linear exponent- function value with given parameters
+
+    Parameters
+    ----------
+        x: int or vector
+            independent variable values
+        params: list
+            it shpuld contain next paramters:
+            a: double
+
+            b: double
+                slope parameter
+
+            n: double 
+                normalization paramater
+
+    Returns
+    -------
+    evaluated exponential with linear exponent function with the given parameters for the given x
+    """
+    a = params[0]
+    b = params[1]
+    n = params[2]
+    
+    if inverse  == False:
+        fx = n*10**(a*x+b)
+    
+    if inverse == True:
+        fx = (np.log10(x/n)-b)/a      #inverse function
     
     return(fx)
 
 
+def crossing_time(x, y, thr):
+    """
+    it computes the x value where the serie crosses the threshold for the
+    first time, by linear interpolation between the measured points.
+    
+    Parameters
+    ----------
+    x: array
+        independent variable values (e.g. cycles or time)
+    
+    y: array
+        serie values
+    
+    thr: float
+        threshold value
+    
+    Returns
+    -------
+    x value of the crossing (Tt or Ct) or None if the serie never crosses thr
+    
+    """
+    x = np.asarray(x, dtype = np.float64)
+    y = np.asarray(y, dtype = np.float64)
+    
+    above = np.flatnonzero(y > thr)
+    
+    if len(above) == 0:
+        return(None)
+    
+    i = above[0]
+    
+    if i == 0:
+        return(x[0])
+    
+    return(x[i-1] + (thr - y[i-1])*(x[i] - x[i-1])/(y[i] - y[i-1]))
+
+def crossing_matrix(x, Y, thr, lengths = None):
+    """
+    crossing_time of all the series of a matrix at once: the x value where 
+    each serie (row) crosses the threshold for the first time, by linear 
+    interpolation between the measured points.
+    
+    Parameters
+    ----------
+    x: array
+        independent variable values, 1-D (shared) or 2-D (by row)
+    Y: 2-D array
+        serie values by row
+    thr: float
+        threshold value
+    lengths: array of int
+        number of valid points of each row, when series have different
+        lengths (rows padded at the end). By default all the row.
+    
+    Returns
+    -------
+    Xt: np.array
+        crossing x value of each serie (nan if it never crosses thr)
+    """
+    Y = np.atleast_2d(np.asarray(Y, dtype = np.float64))
+    X = np.broadcast_to(np.asarray(x, dtype = np.float64), Y.shape)
+    n_series, n_points = Y.shape
+    
+    above = Y > thr
+    
+    if lengths is not None:
+        above &= np.arange(n_points)[np.newaxis,:] < np.asarray(lengths)[:,np.newaxis]
+    
+    cross = above.any(axis = 1)
+    i = np.argmax(above, axis = 1)
+    i_prev = np.maximum(i - 1, 0)
+    rows = np.arange(n_series)
+    
+    x1, x2 = X[rows, i_prev], X[rows, i]
+    y1, y2 = Y[rows, i_prev], Y[rows, i]
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        Xt = np.where(i == 0, x2, x1 + (thr - y1)*(x2 - x1)/(y2 - y1))
+    
+    return(np.where(cross, Xt, np.nan))
+
+def threshold_times(thr, data_set, function = f_10exp_lineal, attr_name = 'exponential', 
+                    use_params = True, assign = False, ct_label = 'C'):
+    """
+    Headless and vectorized computation of the Threshold_Time (Tt) or 
+    Cycle_Threshold (Ct) of all the series of a data_set (without figures, 
+    see explore_thr to display them).
+    Series with fitted parameters (data_set.attr_name, e.g. from 
+    exponential_region) use the function inverse, the others the first 
+    crossing of the raw serie (linear interpolation, see crossing_matrix).
+    Inverse values which are not finite (e.g. NTC wells with a = 0) or out
+    of the serie x range are not crossings of the serie, so they are nan.
+    
+    Parameters
+    ----------
+    thr: float
+        threshold value
+    data_set: Data_set object
+    function: function
+        function with the inverse definition (function(thr, params, inverse = True))
+    attr_name: str
+        data_set attribute with the well parameters for function  
+    use_params: boolean
+        if False, all the series use the raw serie crossing
+    assign: boolean
+        if True, the values are assigned as 'Ct' well parameters (as assign_Ct)
+    ct_label: string
+        Cycle('C') or Time('T') threshold label, used in the parameter description
+    
+    Return
+    ------
+    keys: list
+        series keys (e.g. wells), in data_set.series order
+    Cts: np.array
+        Tt or Ct value of each serie (nan if it does not cross thr)
+    """
+    series = data_set.series
+    keys = list(series.keys())
+    
+    Cts = np.full(len(keys), np.nan)
+    
+    ## series with parameters --> function inverse ##
+    fwells_params = getattr(data_set, attr_name, dict()) if use_params == True else dict()
+    
+    with_params = [i for i, key in enumerate(keys) 
+                   if key in fwells_params and fwells_params[key].value is not None]
+    
+    if len(with_params) > 0:
+        params = np.array([fwells_params[keys[i]].value[0:3] for i in with_params], dtype = float)
+        
+        with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+            f_Cts = np.asarray(function(thr, params.T, inverse = True), dtype = float)
+        
+        x_min = np.array([np.min(series[keys[i]].x) for i in with_params], dtype = float)
+        x_max = np.array([np.max(series[keys[i]].x) for i in with_params], dtype = float)
+        
+        with np.errstate(invalid = 'ignore'):
+            inside = np.isfinite(f_Cts) & (f_Cts >= x_min) & (f_Cts <= x_max)
+        
+        Cts[with_params] = np.where(inside, f_Cts, np.nan)
+    
+    ## other series --> crossing of the raw serie ##
+    fitted = set(with_params)
+    raw = [i for i in range(len(keys)) if i not in fitted]
+    
+    if len(raw) > 0:
+        
+        if isinstance(series, Series_matrix) and all([series.is_view(keys[i]) for i in raw]):
+            rows = [series.index[keys[i]] for i in raw]
+            Cts[raw] = crossing_matrix(series.x, series.Y[rows], thr)
+        
+        else:
+            lengths = np.array([len(series[keys[i]].y) for i in raw], dtype = np.int64)
+            X = np.zeros((len(raw), lengths.max()))
+            Y = np.full((len(raw), lengths.max()), -np.inf)
+            
+            for j, i in enumerate(raw):
+                X[j,:lengths[j]] = series[keys[i]].x
+                Y[j,:lengths[j]] = series[keys[i]].y
+            
+            Cts[raw] = crossing_matrix(X, Y, thr, lengths)
+    
+    if assign == True:
+        p_description = ct_label + 't parameter. Intersection between threshold '\
+        'line and signal fited function (or interpolated serie)'
+        
+        for key, Ct in zip(keys, Cts):
+            Ct_parameter = Parameter('Ct', p_description, units = '', 
+                                     value = None if np.isnan(Ct) else Ct, properties = '') 
+            well_param_assignation(Ct_parameter, series[key].well, ask = False)
+    
+    return(keys, Cts)
+
 def explore_thr(thr, data_set, function = f_10exp_lineal, 
                attr_name='exponential', lp_name='Amplification response region',
                clf = None, save = False, ct_label = 'T', int_mode = 'quadratic'):
@@ -1885,9 +3773,7 @@ def explore_thr(thr, data_set, function = f_10exp_lineal,
         lgd_lines = [pd]
         
         #search the required well parameter values
-        for param in well.analysis:
-            if param.name == lp_name:
-                f_lims = param.value
+        f_lims = get_well_param(well, lp_name)
       
         f_params = fwells_params[well].value
         
@@ -1926,40 +3812,26 @@ def explore_thr(thr, data_set, function = f_10exp_lineal,
             
             # Get the "Ct" value
             
-            cross = False  #become True if thr cross the serie
+            # find the neighbour of Ct (first interpolated point over thr)
+            above = np.flatnonzero(y_itp > thr)
             
-            # find the neighbour of Ct
-            yt_1 = 0
-            yt_2 = 0
-            
-            for yi in y_itp:
-                
-                if yi > thr:
-                    yt_2 = yi
-                    cross = True
-                    break
-                
-                yt_1 = yi
-            
-            if cross == True:
-                # Refinate the neighbour and assign Ct
+            if len(above) > 0 and above[0] > 0:
+                # Refinate the neighbour (over x) and assign Ct
                 resolution  = 1000
                 
-                x_thr = np.linspace(yt_1,yt_2,resolution)
+                x_thr = np.linspace(x_itp[above[0]-1], x_itp[above[0]], resolution)
                 y_thr = f_amp(x_thr)
                 
-                Ct = 0
-                
-                for i in range(0,resolution):
-                    yi = y_thr[i]
-                    
-                    if yi > thr:
-                        break
-                    
-                    Ct = yi    #use the inferior nearest element
+                #use the inferior nearest element
+                Ct = x_thr[max(np.argmax(y_thr > thr) - 1, 0)]
+            
+            elif len(above) > 0:
+                Ct = x_itp[0]
+            
             else:
                 Ct = None
             
+            Cts[well] = Ct
             
 
         ph = plt.axhline(thr , color='k', ls ='--', label = 'Threshold')
@@ -2039,10 +3911,7 @@ def assign_Ct(thr, well, function = f_10exp_lineal, fp_name=['a','b','N']):
     
     ## Compute the Ct value
         
-    for param in well.analysis:
-
-        if param.name == fp_name:
-            param_value = param.value
+    param_value = get_well_param(well, fp_name)
     
     Ct = function(thr, param_value, inverse = True)  #use the inverse function
     
@@ -2216,6 +4085,133 @@ def function_fit(xdata, ydata, init=0, end=':', func=f_linear, p_start=[0.25,-1]
     return(x_fx, z, R2)
     
     
+def second_derivative(x, y, derivative = 'forward'):
+    """
+    compute the second derivative of a serie, as used in exponential_region
+    
+    Parameters
+    ----------
+    x: array
+        independent variable values
+    
+    y: array
+        serie values. It can be a 2-D array with a serie by row 
+        (e.g. Series_matrix.Y), then ddy is computed for all of them
+    
+    derivative: str
+        second derivate mode {'forward','central','backward'}.
+        In case of other input, default (forward) is used
+    
+    Returns
+    -------
+    ddx: array
+        x range corrected to the derivative mode
+    
+    ddy: array
+        second derivative values (2 elements shorter than y, by row)
+    
+    delay: int
+        index correction between ddy and y (i.e. ddy[i] --> y[i+delay])
+    
+    """
+    if derivative == 'central':
+        delay = 1
+        
+    elif derivative == 'backward': 
+        delay = 2
+    
+    else:
+        # in case of other input,default (forward) is used
+        delay = 0
+    
+    ddy= (y[...,0:-2]+y[...,2:]-2*y[...,1:-1])/4   # second derivative
+    ddx = x[0+delay:-2+delay]          # x range corrected
+    
+    return(ddx, ddy, delay)
+
+def response_region_points(ddy, delay, n_points):
+    """
+    it approximates the response region limits using the second derivative
+    of a serie: p1 is the ddy maximum point, p2 is the ddy minimum point
+    after the maximum and p3 (plateau region beggining) is 2 points after p2.
+    
+    Parameters
+    ----------
+    ddy: array
+        second derivative values (see second_derivative)
+    
+    delay: int
+        index correction between ddy and the serie
+    
+    n_points: int
+        length of the serie
+    
+    Returns
+    -------
+    p1, p2, p3: int
+        serie vector index of the response region limits
+    
+    """
+    # second derivative min and max indexs
+    p1_ddy = np.where(ddy== ddy.max())[0][0]        # ddy maximum point
+    p2_ddy = np.where(ddy== ddy[p1_ddy:].min())[0][0]  # ddy minimum point after the maximum
+    
+    # serie data min and max index
+    p1 = p1_ddy + delay   # the derivative value is used to correct the index.
+    p2 = p2_ddy + delay
+    
+    p3 = p2 + 2      #  default plateu region beggining
+    while p3 >= n_points:  # check to be inside boundaries
+        p3 = p3 - 1
+    
+    return(p1, p2, p3)
+
+def response_region_matrix(x, Y, derivative = 'forward'):
+    """
+    response_region_points of all the series of a matrix at once (e.g. all
+    the wells of a plate, Series_matrix.Y), with the same results as serie 
+    by serie (second_derivative + response_region_points).
+    
+    Parameters
+    ----------
+    x: array
+        independent variable values (shared by all the series)
+    
+    Y: 2-D array
+        serie values by row (wells x cycles)
+    
+    derivative: str
+        second derivate mode {'forward','central','backward'}
+    
+    Returns
+    -------
+    P1, P2, P3: np.array of int
+        vector index of the response region limits of each serie (row)
+    
+    """
+    Y = np.atleast_2d(np.asarray(Y))
+    n_points = Y.shape[1]
+    
+    ddx, ddy, delay = second_derivative(np.asarray(x), Y, derivative)
+    
+    # ddy maximum point (first one)
+    p1_ddy = np.argmax(ddy, axis = 1)
+    
+    # ddy minimum after the maximum --> masked before p1_ddy 
+    cols = np.arange(ddy.shape[1])
+    tail = np.where(cols[np.newaxis,:] >= p1_ddy[:,np.newaxis], ddy, np.inf)
+    tail_min = tail.min(axis = 1)
+    
+    # as in response_region_points, the first point with that value 
+    # (searched in the whole ddy)
+    p2_ddy = np.argmax(ddy == tail_min[:,np.newaxis], axis = 1)
+    
+    P1 = p1_ddy + delay
+    P2 = p2_ddy + delay
+    P3 = np.minimum(P2 + 2, n_points - 1)
+    
+    return(P1, P2, P3)
+
 def exponential_region(data_set, 
                    p_name = 'Amplification response region', 
                    p_description = 'x vector index of exponential response region of the well amplification data',
@@ -2471,7 +4467,10 @@ def exponential_region(data_set,
     
     wells = data_set.series.keys()
     
-    y_max_all = max([max(data_set.series[well].y) for well in wells ])   
+    if isinstance(data_set.series, Series_matrix):
+        y_max_all = data_set.series.max_y()
+    else:
+        y_max_all = max([max(data_set.series[well].y) for well in wells ])   
     
     ##############################
     ### start dataset analysis ###
@@ -2482,23 +4481,7 @@ def exponential_region(data_set,
         y = np.asarray(serie.y)
         
         
-        delay = 0  # variable to correct the x range for the derivatives
-        
-        if derivative == 'forward':    
-            delay = 0
-            
-        elif derivative == 'central':
-            delay = 1
-            
-        elif derivative == 'backward': 
-            delay = 2
-        
-        else:
-            # in case of other input,default (forward) is used
-            delay = 0
-        
-        ddy= (y[0:-2]+y[2:]-2*y[1:-1])/4   # second derivative
-        ddx = x[0+delay:-2+delay]          # x range corrected
+        ddx, ddy, delay = second_derivative(x, y, derivative)
         
         ## normalization to ]-inf,1]  ##
         
@@ -2511,55 +4494,47 @@ def exponential_region(data_set,
         nddy = ddy/ddymax
         
         # then use the 2nd derivative as approximation
-
+        p1_y, p2_y, p3 = response_region_points(ddy, delay, len(x))
+        
         # second derivative min and max indexs
-        p1_ddy = np.where(ddy== ddy.max())[0][0]        # ddy maximum point
-        p2_ddy = np.where(ddy== ddy[p1_ddy:].min())[0][0]  # ddy minimum point after the maximum
-
-        # serie data min and max index
-        p1_y = p1_ddy + delay   # the derivative value is used to correct the index.
-        p2_y = p2_ddy + delay
-
-        p3 = p2_y + 2      #  default plateu region beggining
-        while p3 >= len(x):  # check to be inside boundaries
-            p3 = p3 - 1
+        p1_ddy = p1_y - delay
+        p2_ddy = p2_y - delay
         
         ## check if there is a previous versión of the parameters ##
-        if serie.well.analysis:
-            for parameter in serie.well.analysis:
-                if parameter.name == p_name:
-                    
-                    print('\nThere is a stored '+str(p_name)+'\n')
-                    print('\n** if you change it, this version will be replaced **\n')
-                    
-                    p1s_y = parameter.value[0]
-                    p2s_y = parameter.value[1]
-                    p3s = parameter.value[2]
-                    
-                    #check to be inside superior boundary
-                    if p1s_y <= len(x):
-                        p1_y = p1s_y
-                        
-                        # correct the index because 2nd derivative range is shorter
-                        p1_ddy = p1_y - delay
-                    
-                    else:
-                        print('Stored P1 value out of boundaries. New value was computed')
-                    
-                    if p2s_y <= len(x):
-                        p2_y = p2s_y
-                        
-                        # correct the index because 2nd derivative range is shorter
-                        p2_ddy = p2_y - delay
-                    
-                    else:
-                        print('Stored P2 value out of boundaries. New value was computed')
-                    
-                    if p3s <= len(x):
-                        p3 = p3s
-                    
-                    else:
-                        print('Stored P1 value out of boundaries. New value was computed')
+        parameter = serie.well.analysis.get(p_name)
+        if parameter != None:
+            
+            print('\nThere is a stored '+str(p_name)+'\n')
+            print('\n** if you change it, this version will be replaced **\n')
+            
+            p1s_y = parameter.value[0]
+            p2s_y = parameter.value[1]
+            p3s = parameter.value[2]
+            
+            #check to be inside superior boundary
+            if p1s_y <= len(x):
+                p1_y = p1s_y
+                
+                # correct the index because 2nd derivative range is shorter
+                p1_ddy = p1_y - delay
+            
+            else:
+                print('Stored P1 value out of boundaries. New value was computed')
+            
+            if p2s_y <= len(x):
+                p2_y = p2s_y
+                
+                # correct the index because 2nd derivative range is shorter
+                p2_ddy = p2_y - delay
+            
+            else:
+                print('Stored P2 value out of boundaries. New value was computed')
+            
+            if p3s <= len(x):
+                p3 = p3s
+            
+            else:
+                print('Stored P1 value out of boundaries. New value was computed')
         
         # plotting setting
         xp = x
@@ -2699,7 +4674,9 @@ def exponential_region(data_set,
 
         p_value = [p1[0],p2[0],p3]  # vector index of response region points
         
-        rr_parameter = Parameter(p_name, p_description, units = '', value=p_value, properties='') 
+        # reviewed by the user (see exponential_region_auto)
+        rr_parameter = Parameter(p_name, p_description, units = '', value=p_value, 
+                                 properties={'points': len(x), 'reviewed': True}) 
         
         well_param_assignation(rr_parameter, serie.well, ask = False)
 
@@ -2733,10 +4710,472 @@ def exponential_region(data_set,
 
     return(thr_limits, rr_limits) 
 
-def save_obj(obj, name, folder ):
+def batch_loglinear_fit(x, NY, P1, P2, P3, lengths = None):
     """
-    To save a .pkl object in a desired folder
-
+    It fits, for all the series at once, the exponential region 
+    (log10(ny) = a*x + b between P1 and P2, with a >= 0 and b <= 0) and the 
+    plateau flat line (ny = m from P3, with m <= 1.5), as the curve_fit 
+    fittings of exponential_region (see response_reg_plot),
+    but solving the least squares normal equations of all the series 
+    together. Bounds are applied by checking the solutions over the 
+    boundaries when the free solution is out of them.
+    
+    Parameters
+    ----------
+    x: array
+        independent variable values, 1-D (shared) or 2-D (by row)
+    NY: 2-D array
+        normalized serie values by row (wells x points)
+    P1, P2, P3: arrays of int
+        vector index of the response region limits of each serie 
+        (-1 = no exponential region or maximum value as plateau, see exponential_region)
+    lengths: array of int
+        number of valid points of each row, when series have different
+        lengths (rows padded at the end). By default all the row.
+    
+    Returns
+    -------
+    A, B: np.array
+        exponential region fitted parameters (nan if they can not be fitted)
+    R2: np.array
+        R-squared of the exponential fitting (0 if it can not be fitted)
+    M: np.array
+        normalized maximum signal value (plateau fitting)
+    """
+    NY = np.atleast_2d(np.asarray(NY, dtype = float))
+    n_series, n_points = NY.shape
+    
+    X = np.broadcast_to(np.asarray(x, dtype = float), NY.shape)
+    P1 = np.asarray(P1, dtype = np.int64)
+    P2 = np.asarray(P2, dtype = np.int64)
+    P3 = np.asarray(P3, dtype = np.int64)
+    
+    if lengths is None:
+        lengths = np.full(n_series, n_points)
+    lengths = np.asarray(lengths, dtype = np.int64)
+    
+    cols = np.arange(n_points)[np.newaxis,:]
+    valid = cols < lengths[:,np.newaxis]
+    
+    #### exponential region: log10(ny) = a*x + b ####
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        LY = np.log10(NY)
+    
+    #replace "nan" values with a number 1 order of magnitud lower than min
+    finite = np.isfinite(LY) & valid
+    row_min = np.min(np.where(finite, LY, np.inf), axis = 1)
+    LY = np.where(finite, LY, (row_min - 1)[:,np.newaxis])
+    
+    has_region = (P1 != -1) & (P2 != -1) & np.isfinite(row_min)
+    W = ((cols >= P1[:,np.newaxis]) & (cols <= P2[:,np.newaxis]) & valid & has_region[:,np.newaxis])
+    
+    Xw = np.where(W, X, 0.0)
+    Yw = np.where(W, LY, 0.0)
+    
+    n = W.sum(axis = 1).astype(float)
+    Sx = Xw.sum(axis = 1)
+    Sy = Yw.sum(axis = 1)
+    Sxx = (Xw*Xw).sum(axis = 1)
+    Sxy = (Xw*Yw).sum(axis = 1)
+    Syy = (Yw*Yw).sum(axis = 1)
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        
+        det = n*Sxx - Sx*Sx
+        
+        # free solution
+        A = (n*Sxy - Sx*Sy)/det
+        B = (Sy - A*Sx)/n
+        
+        # solutions over the boundaries (a = 0 or b = 0) 
+        b_a0 = np.minimum(Sy/n, 0)
+        a_b0 = np.maximum(Sxy/Sxx, 0)
+        
+        sse = lambda a, b: Syy - 2*a*Sxy - 2*b*Sy + a*a*Sxx + 2*a*b*Sx + n*b*b
+        
+        candidates = [(np.zeros(n_series), b_a0), (a_b0, np.zeros(n_series))]
+        c_sse = np.vstack([sse(a, b) for a, b in candidates])
+        best = np.argmin(c_sse, axis = 0)
+        
+        out = ~((A >= 0) & (B <= 0))
+        A = np.where(out, np.where(best == 0, 0.0, a_b0), A)
+        B = np.where(out, np.where(best == 0, b_a0, 0.0), B)
+        
+        fitted = has_region & (n >= 2) & (det > 0)
+        A = np.where(fitted, A, np.nan)
+        B = np.where(fitted, B, np.nan)
+        
+        # R-squared
+        residuals = np.where(W, LY - (A[:,np.newaxis]*X + B[:,np.newaxis]), 0.0)
+        ss_res = (residuals**2).sum(axis = 1)
+        ss_tot = (np.where(W, LY - (Sy/n)[:,np.newaxis], 0.0)**2).sum(axis = 1)
+        R2 = 1 - ss_res/ss_tot
+    
+    R2 = np.where(fitted & np.isfinite(R2), R2, 0.0)
+    
+    #### plateau: flat line from P3 (mean value, with upper bound 1.5) ####
+    Wm = (cols >= P3[:,np.newaxis]) & valid
+    n_m = Wm.sum(axis = 1)
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        mean_m = np.minimum(np.where(Wm, NY, 0.0).sum(axis = 1)/n_m, 1.5)
+    
+    last = NY[np.arange(n_series), lengths - 1]
+    max_ny = np.max(np.where(valid, NY, -np.inf), axis = 1)
+    
+    M = np.where(n_m > 1, mean_m, last)
+    M = np.where(P3 == -1, max_ny, M)
+    
+    return(A, B, R2, M)
+
+def stored_region(parameter, n_points):
+    """
+    True if a stored response region Parameter can be used as it is:
+    it was reviewed by the user (properties['reviewed']) or it was computed
+    from a serie with n_points values and it is not provisional
+    (properties['points'], see update_running_wells).
+    Regions without that information (properties = '') are not used.
+    """
+    if parameter == None or parameter.value is None:
+        return(False)
+    
+    properties = parameter.properties
+    
+    if not isinstance(properties, dict):
+        return(False)
+    
+    if properties.get('reviewed') == True:
+        return(True)
+    
+    return(properties.get('points') == n_points and properties.get('provisional') != True)
+
+def exponential_region_auto(data_set, 
+                            p_name = 'Amplification response region', 
+                            p_description = 'x vector index of exponential response region of the well amplification data',
+                            derivative = 'forward', use_stored = True, ne_amplitude = None, 
+                            min_score = 0.9, display = True):
+    """
+    Non interactive version of exponential_region (without figures nor inputs), 
+    to analyse whole plates in batch jobs. 
+    The response region limits of each serie are the second derivative 
+    approximation (exponential_region default values) or the stored ones,
+    and the same well parameters (p_name, 'max signal', ['a','b','N']) and 
+    data_set attributes (max_signal, exponential, wthr_lims, y_max) are assigned.
+    
+    The fittings of all the series are done together (batch_loglinear_fit).
+    
+    Each well also gets a confidence score [0,1] (the R^2 of the exponential 
+    fitting, reduced when the response region has less than 3 points), stored
+    in data_set.region_score. Wells below min_score are listed for an optional 
+    review (e.g. with exponential_region over a Data_set with just them).
+    Wells without exponential region (e.g. flagged by ne_amplitude) have 
+    score nan and they are not listed.
+    
+    Parameters
+    ----------
+    data_set = Data_set object with list of values series inside it
+    
+    p_name = str 
+        name with which save the response region limits Parameter object in each well
+    
+    p_description = str
+        description Parameter object created
+    
+    derivative = str
+        second derivate mode {'forward','central','backward'}
+    
+    use_stored: Boolean
+        if True, stored response region limits are used if they were reviewed 
+        by the user (exponential_region) or computed with the current number 
+        of points (see stored_region). Others (e.g. provisional regions of 
+        a run in progress) are computed again.
+    
+    ne_amplitude: float or None
+        if it is a number, series with (max - min)/y_max lower than it are 
+        considered without exponential region (as 'NE' in exponential_region)
+    
+    min_score: float
+        wells with lower confidence score are listed to review
+    
+    display: Boolean
+        if True, the number of wells to review is printed
+    
+    Return
+    ------
+    thr_limits : list
+        [min_threshold, max_threshold] of each well
+        
+    rr_limits: list
+        [init_exponential, end_exponential, init_max] of each well
+    
+    review: list
+        wells whose confidence score is lower than min_score
+    """
+    rr_limits = []
+    thr_limits = []
+    review = []
+    
+    max_params = dict()
+    exp_params = dict()
+    wthr_params = dict()
+    scores = dict()
+    
+    wells = data_set.series.keys()
+    
+    if isinstance(data_set.series, Series_matrix):
+        y_max_all = data_set.series.max_y()
+    else:
+        y_max_all = max([max(data_set.series[well].y) for well in wells ])   
+    
+    norm_val = y_max_all   # -> normlized by the maximum of all series in data_set
+    
+    ## shared x series --> response regions of all of them at once
+    points = dict()
+    series = data_set.series
+    
+    if isinstance(series, Series_matrix) and len(series.Y) > 0:
+        P1, P2, P3 = response_region_matrix(series.x, series.Y, derivative)
+        
+        for key in series.keys():
+            if series.is_view(key):
+                row = series.index[key]
+                points[key] = (int(P1[row]), int(P2[row]), int(P3[row]))
+    
+    ## response region limits of each serie ##
+    regions = list()
+    reviewed = list()   # True if the user reviewed the stored region used
+    
+    for well in wells:
+        
+        serie = data_set.series[well]
+        x = np.asarray(serie.x)
+        y = np.asarray(serie.y)
+        
+        if well in points:
+            p1, p2, p3 = points[well]
+        
+        else:
+            ddx, ddy, delay = second_derivative(x, y, derivative)
+            p1, p2, p3 = response_region_points(ddy, delay, len(x))
+        
+        ## stored (reviewed) values ##
+        parameter = serie.well.analysis.get(p_name)
+        stored = use_stored == True and stored_region(parameter, len(x))
+        
+        if stored == True:
+            
+            p1s, p2s, p3s = parameter.value[0:3]
+            
+            if p1s <= len(x):
+                p1 = p1s
+            if p2s <= len(x):
+                p2 = p2s
+            if p3s <= len(x):
+                p3 = p3s
+        
+        elif ne_amplitude != None and (np.max(y) - np.min(y))/norm_val < ne_amplitude:
+            p1 = -1
+            p2 = -1
+        
+        regions.append([p1, p2, p3])
+        reviewed.append(stored == True and parameter.properties.get('reviewed') == True)
+    
+    ## linear fits of all the series together (rows padded to the longest one) ##
+    keys = list(wells)
+    lengths = np.array([len(data_set.series[well].x) for well in keys], dtype = np.int64)
+    n_points = lengths.max() if len(keys) > 0 else 0
+    
+    X = np.zeros((len(keys), n_points))
+    NY = np.ones((len(keys), n_points))
+    
+    for i, well in enumerate(keys):
+        serie = data_set.series[well]
+        X[i,:lengths[i]] = serie.x
+        NY[i,:lengths[i]] = np.asarray(serie.y)/norm_val
+    
+    P = np.array(regions, dtype = np.int64).reshape(-1, 3)
+    A, B, R2s, M = batch_loglinear_fit(X, NY, P[:,0], P[:,1], P[:,2], lengths)
+    
+    for i, well in enumerate(keys):
+        
+        serie = data_set.series[well]
+        y = np.asarray(serie.y)
+        p1, p2, p3 = regions[i]
+        
+        m_s = M[i]
+        max_signal = [m_s, m_s*norm_val]
+        
+        if p1 != -1 and p2 != -1:
+            
+            if np.isnan(A[i]):
+                exp_linear = None
+            else:
+                exp_linear = [A[i], B[i], norm_val]
+            
+            # failed fittings (nan R^2) have score 0
+            score = float(np.clip(np.nan_to_num(R2s[i], nan = 0.0), 0.0, 1.0))
+            if p2 - p1 < 2:
+                score = score*0.5
+        
+        else:
+            # no exponential region (e.g. ne_amplitude), there is not a fitting to score
+            exp_linear = None
+            score = np.nan
+        
+        ## create the parameter objects (as exponential_region)
+        maxS_name = "max signal"
+        maxS_descrip = "maximum signal value [normalized, original]"
+        maxS_p = Parameter(maxS_name, maxS_descrip, units = '', value=max_signal, properties='')
+        
+        exp_name = ['a','b','N']
+        exp_descrip = "linear exponent parameters 'a','b', and the normalization parameter 'N'. \
+        f(x) = N*10^(a*x+b)"
+        exp_p = Parameter(exp_name, exp_descrip, units = '', value=exp_linear, properties='')
+        
+        max_params[well] = maxS_p
+        exp_params[well] = exp_p
+        scores[well] = score
+        
+        well_param_assignation(maxS_p, serie.well, ask = False)
+        well_param_assignation(exp_p, serie.well, ask = False)
+        
+        p_value = [p1, p2, p3]  # vector index of response region points
+        
+        rr_properties = {'points': len(y)}
+        
+        if reviewed[i] == True:
+            rr_properties['reviewed'] = True
+        
+        rr_parameter = Parameter(p_name, p_description, units = '', value=p_value, 
+                                 properties=rr_properties) 
+        well_param_assignation(rr_parameter, serie.well, ask = False)
+        
+        rr_limits.append(p_value)
+        
+        ## evaluate the threshold limits
+        if p1 != -1  and p2 != -1:
+            well_thrs = [y[p1], y[p2]]
+        else:
+            well_thrs = [np.amin(y), np.inf]
+        
+        thr_limits.append(well_thrs)
+        
+        wthr_name = "well threshold limits"
+        wthr_descrip = "well threshold limits [thr_min, thr_max]"
+        wthr_p = Parameter(wthr_name, wthr_descrip, units = '', value=well_thrs, properties='')
+        wthr_params[well] = wthr_p 
+        
+        if score < min_score:
+            review.append(well)
+    
+    # assign the data_set attibutes
+    setattr(data_set, 'max_signal', max_params)
+    setattr(data_set, 'exponential', exp_params)
+    setattr(data_set, 'wthr_lims', wthr_params)
+    setattr(data_set, 'y_max', y_max_all)
+    setattr(data_set, 'region_score', scores)
+    
+    if display == True:
+        print(len(rr_limits),'series were analysed.',len(review),'wells to review (score <',str(min_score)+')')
+        if len(review) > 0:
+            print([well.wpos for well in review])
+    
+    return(thr_limits, rr_limits, review)
+
+def update_running_wells(wells, reading_name, x_name, y_name, thr, derivative = 'forward',
+                         p_name = 'Running response region', 
+                         p_description = 'provisional x vector index of exponential response region of the well amplification data (run in progress)',
+                         display = True):
+    """
+    It recomputes the per well results which change when new cycles are 
+    appended to the readings of a run in progress (see extend_readings):
+    the response region limits approximated by the second derivative 
+    (as exponential_region default values) and the threshold crossing.
+    Both are assigned as well parameters (p_name and 'Ct').
+    The response region is provisional, so it is stored under its own p_name
+    (not the reviewed 'Amplification response region' of exponential_region)
+    and marked with properties {'points': n, 'provisional': True}.
+    
+    e.g. to call the positive wells during the run:
+        updated = extend_readings(wells, stream_readings(...))
+        Cts = update_running_wells(updated, 'Amplification data', 'Cycle', 'ΔRn', thr)
+    
+    Parameters
+    ----------
+    wells: list
+        list of well objects to update (e.g. output of extend_readings)
+    
+    reading_name: str
+        name of the reading (Reading.r_name)
+    
+    x_name: str
+        x serie name in the reading (e.g. 'Cycle' or 'Time')
+    
+    y_name: str
+        y serie name in the reading (e.g. 'ΔRn')
+    
+    thr: float
+        threshold value
+    
+    derivative: str
+        second derivate mode {'forward','central','backward'}
+    
+    p_name: str
+        name of the response region limits Parameter
+    
+    p_description: str
+        description of the response region limits Parameter
+    
+    display: boolean
+        if True, the crossing value of each well is printed
+    
+    Return
+    ------
+    Cts: dict
+        {well: Tt or Ct value}. None if the threshold was not crossed yet
+    
+    """
+    Cts = dict()
+    
+    for well in wells:
+        
+        reading = well.data.get(reading_name)
+        
+        if reading == None:
+            continue
+        
+        x = np.asarray(reading.values[x_name], dtype = np.float64)
+        y = np.asarray(reading.values[y_name], dtype = np.float64)
+        
+        ## response region ##
+        if len(y) > 2:
+            
+            _, ddy, delay = second_derivative(x, y, derivative)
+            p_value = list(response_region_points(ddy, delay, len(x)))
+            
+            rr_parameter = Parameter(p_name, p_description, units = '', value=p_value, 
+                                     properties={'points': len(y), 'provisional': True}) 
+            well_param_assignation(rr_parameter, well, ask = False)
+        
+        ## threshold crossing ##
+        Ct = crossing_time(x, y, thr)
+        Cts[well] = Ct
+        
+        p_description_ct = 'Cycle threshold parameter. Intersection between \
+        threshold line and the signal linear interpolation'
+        Ct_parameter = Parameter('Ct', p_description_ct, units = '', value= Ct, 
+                                 properties={'points': len(y), 'threshold': thr})
+        well_param_assignation(Ct_parameter, well, ask = False)
+        
+        if display == True:
+            print(well.wpos, ':', str(Ct), '('+str(len(y)), 'points)')
+    
+    return(Cts)
+
+def save_obj(obj, name, folder ):
+    """
+    To save a .pkl object in a desired folder
+
     Parameters
     ----------
     obj : python object
@@ -2925,10 +5364,10 @@ def get_well_param(well, param_name):
         name of the parameter in well.analysis
     
     """
-    for i in range(0, len(well.analysis)):
-        param = well.analysis[i]
-        if param.name == param_name:
-            return(well.analysis[i].value)
+    param = well.analysis.get(param_name)
+    
+    if param != None:
+        return(param.value)
 
 def get_well_reading(well, reading_name, serie_name = None):
     """
@@ -2961,33 +5400,43 @@ def get_well_reading(well, reading_name, serie_name = None):
         well.data.units[serie_name]
     
     """
-    for data in well.data:
-        if data.r_name == reading_name:
-            
-            if serie_name == None:
-                return(data)
-            
-            else:
-                try:
-                    values = data.values[serie_name]
-                    units = data.units[serie_name]
-                    return(values, units)
-                except:
-                    print('\n',str(serie_name), 'cannot be found in',reading_name)
-                    return(None)
+    data = well.data.get(reading_name)
+    
+    if data == None:
+        print('\n',reading_name, 'cannot be found')
+        return(None)
+    
+    if serie_name == None:
+        return(data)
     
-    print('\n',reading_name, 'cannot be found')
+    else:
+        try:
+            values = data.values[serie_name]
+            units = data.units[serie_name]
+            return(values, units)
+        except:
+            print('\n',str(serie_name), 'cannot be found in',reading_name)
+            return(None)
 
 def find_dataset(datasets, ds_name):
     """
-    return the data_set with self.name  = ds_name
+    return the data_set with self.name  = ds_name 
+    or None if there is not (datasets can be a Well_set.dsets list)
     """
     
-    for i in range(0, len(datasets)):
-        if ds_name == datasets[i].name:
-            ds_num = i
+    if isinstance(datasets, Dset_list):
+        dataset = datasets.get(ds_name)
+    
+    else:
+        dataset = None
+        for dset in datasets:
+            if ds_name == dset.name:
+                dataset = dset
+    
+    if dataset == None:
+        print('\n"'+str(ds_name)+'" dataset cannot be found')
             
-    return(datasets[ds_num])  
+    return(dataset)  
 
 
 def f_reciprocal(x, a, b, c, inverse = False):
@@ -3223,15 +5672,10 @@ def param_data_serie(clf, yp_name, x_att_name, ds_name, p_pos = 0):
     
     for well in clf.wells:
         
-        for param in well.analysis:
-                if param.name == yp_name:
-                    
-                    y = param.value
-                    
-                    if type(y) == list:
-                        y = y[int(p_pos)]
-                    
-                    break
+        y = get_well_param(well, yp_name)
+        
+        if type(y) == list:
+            y = y[int(p_pos)]
 
         
         x = getattr(well, x_att_name)
@@ -3327,53 +5771,242 @@ def fit_Ct_Bst(d_set, s_keys = all, s_attr_name= 'series',
     return(p_fit)
     
 
-## function to complete some properties and informatio
-def attr_to_new(obj,key,attr,na_name, na_value, ask = True):
+def fit_one(x, y, model, p0, bounds):
     """
-    it search key in attr value and creates a new attr with the indicated value
-    It is used to complete the object information or translate coded information
-    into well defined attributes.
+    curve_fit of model to (x, y) without prints, plots nor warnings.
     
-    Parameters:
-    obj: object
+    Return
+    ------
+    params, cov: np.array
+        fitted parameters and their covariance (nan if it failed)
+    R2: float
+        R squared goodness of fit value (nan if it failed)
+    success: boolean
+    """
+    x = np.asarray(x, dtype = float)
+    y = np.asarray(y, dtype = float)
     
-    key: str, int, 
-        indicator element to seach in attr
-    na_name: string
-        name of the new attribute
+    if bounds == None:
+        bounds = (-np.inf, np.inf)
     
-    na_value: any
-        value assigned to new attribute
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            
+            with np.errstate(all = 'ignore'):
+                params, cov = curve_fit(model, x, y, p0 = p0, bounds = bounds)
+                R2 = R_squared(x, y, model, *params)
         
-    ask: boolean
-        To confirm replace in case there is a previuos version of "new parameter"
+        return(params, cov, R2, True)
     
+    except (ValueError, RuntimeError, TypeError, np.linalg.LinAlgError):
+        n_params = len(p0) if p0 is not None else 0
+        return(np.full(n_params, np.nan), np.full((n_params, n_params), np.nan), np.nan, False)
+
+def fit_chunk(jobs, warm_start = True):
     """
+    It runs fit_one for each job of a list, one after the other (see fit_jobs).
+    With warm_start, each job starts from the parameters fitted for the 
+    previous one (same model) and from its own p0 if that fails.
+    """
+    results = list()
+    previous = None      # (model, params) of the last successful fitting
     
-    attr_value = getattr(obj, attr)
-    
-    if key in attr_value:
+    for job in jobs:
+        x, y, model = job[0:3]
+        p0 = job[3] if len(job) > 3 else None
+        bounds = job[4] if len(job) > 4 else None
         
-        #  check there is not a preious version
-        if ask == True:
-            if na_name in obj.__dict__.keys():
-
-                print('\nThere is a previous version of "'+str(na_name)+ '" for', str(obj))
-                replace = input('\nIt will be replaced. Please confirm (y/n): ')
-
-                while not (replace  == 'y' or replace == 'n'):
-                    print('\n invalud input')
-                    replace = input('\nIt will be replaced. Please confirm (y/n): ')
+        result = None
+        
+        if warm_start == True and previous != None and previous[0] is model:
+            
+            w_p0 = previous[1]
+            
+            # warm start has to be inside the bounds
+            if bounds != None:
+                w_p0 = np.clip(w_p0, *[np.broadcast_to(np.asarray(b, dtype = float), w_p0.shape) 
+                                       for b in bounds])
+                
+            if p0 is None or len(w_p0) == len(p0):
+                result = fit_one(x, y, model, w_p0, bounds)
+                
+                if result[3] == False:
+                    result = None
+        
+        if result == None:
+            result = fit_one(x, y, model, p0, bounds)
+        
+        if result[3] == True:
+            previous = (model, result[0])
+        
+        results.append(result)
+    
+    return(results)
 
-                if replace == 'y':
-                    setattr(obj, na_name, na_value)
-                    print("\nAttribute assigned")
-                    
-                else:
-                    # old version is keep and the new one is lost
-                    print("\nOld attribute version was keep and the new lost")
-            else:
-                setattr(obj, na_name, na_value)
+def fit_jobs(jobs, processes = None, warm_start = True, chunk_size = None):
+    """
+    It fits many models at once (e.g. f_sigma to the whole curve of each 
+    well of a plate), sharing the jobs between processes. Nothing is printed
+    nor plotted.
+    Neighbouring jobs (consecutive in the list, e.g. neighbouring wells) are 
+    run in the same process and, with warm_start, each one uses the previous
+    fitted parameters as initial guess.
+    
+    Obs: as in load_plates, the models have to be importable functions
+    (e.g. f_sigma, f_reciprocal or functions of a module), not lambdas.
+    
+    Parameters
+    ----------
+    jobs: list
+        list of (x, y, model, p0, bounds) tuples. p0 and bounds are optional
+        (bounds as in curve_fit, e.g. ([0,0,0],[np.inf,np.inf,np.inf]))
+    processes: int
+        number of processes. If None, the number of CPUs is used.
+        If 1, jobs are run in this process.
+    warm_start: boolean
+        if True, initial guesses are taken from the previous job fitting
+    chunk_size: int
+        number of consecutive jobs run in each process task.
+        By default jobs are shared equally between processes.
+    
+    Return
+    ------
+    params: np.array or list
+        fitted parameters of each job (2-D array if all of them have the same
+        number of parameters, nan if the fitting failed)
+    covs: list
+        covariance matrix of each job
+    R2: np.array
+        R squared of each job
+    success: np.array
+        boolean, if the fitting of each job succeeded
+    """
+    jobs = list(jobs)
+    
+    if processes == None:
+        processes = os.cpu_count() or 1
+    
+    if chunk_size == None:
+        chunk_size = max(1, int(np.ceil(len(jobs)/processes)))
+    
+    chunks = [jobs[i:i+chunk_size] for i in range(0, len(jobs), chunk_size)]
+    
+    if processes == 1 or len(chunks) < 2:
+        c_results = [fit_chunk(chunk, warm_start) for chunk in chunks]
+    
+    else:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            c_results = list(executor.map(fit_chunk, chunks, [warm_start]*len(chunks)))
+    
+    results = [result for c_result in c_results for result in c_result]
+    
+    params = [result[0] for result in results]
+    covs = [result[1] for result in results]
+    R2 = np.array([result[2] for result in results], dtype = float)
+    success = np.array([result[3] for result in results], dtype = bool)
+    
+    if len(params) > 0 and len(set([len(p) for p in params])) == 1:
+        params = np.vstack(params)
+    
+    return(params, covs, R2, success)
+
+def fit_series_parallel(d_set, s_keys = all, s_attr_name = 'series', function = f_sigma, 
+                        p_start = [1,-20,0.5], param_bounds = None, processes = None, 
+                        warm_start = True, display = True):
+    """
+    It fits function to each serie of d_set with fit_jobs 
+    (e.g. sigmoid fitting of the whole amplification curve of every well).
+    
+    Parameters
+    ----------
+    d_set: Data_set object
+        Data_set to obtain the series
+    s_keys: list
+        keys of the series to fit (all by default)
+    s_attr_name: string
+        name of the Data_set attribute which contain the series
+    function: callable function object
+        function to perform the fitting (importable, see fit_jobs)
+    p_start: list
+        initial parameter values
+    param_bounds: tuple
+        parameter bounds, as in curve_fit
+    processes, warm_start:
+        see fit_jobs
+    display: Boolean
+        if True, the number of failed fittings is printed
+    
+    Return
+    ------
+    fits: dict
+        {serie key: [params, cov, R2, success]}
+    """
+    series = getattr(d_set, s_attr_name)
+    
+    if s_keys == all:
+        s_keys = list(series.keys())
+    
+    jobs = [(series[key].x, series[key].y, function, p_start, param_bounds) for key in s_keys]
+    
+    params, covs, R2, success = fit_jobs(jobs, processes = processes, warm_start = warm_start)
+    
+    fits = dict()
+    for i, key in enumerate(s_keys):
+        fits[key] = [params[i], covs[i], R2[i], success[i]]
+    
+    if display == True:
+        print(len(s_keys),'series were fitted.', int((~success).sum()),'fittings failed')
+    
+    return(fits)
+
+## function to complete some properties and informatio
+def attr_to_new(obj,key,attr,na_name, na_value, ask = True):
+    """
+    it search key in attr value and creates a new attr with the indicated value
+    It is used to complete the object information or translate coded information
+    into well defined attributes.
+    
+    Parameters:
+    obj: object
+    
+    key: str, int, 
+        indicator element to seach in attr
+    na_name: string
+        name of the new attribute
+    
+    na_value: any
+        value assigned to new attribute
+        
+    ask: boolean
+        To confirm replace in case there is a previuos version of "new parameter"
+    
+    """
+    
+    attr_value = getattr(obj, attr)
+    
+    if key in attr_value:
+        
+        #  check there is not a preious version
+        if ask == True:
+            if na_name in attr_names(obj):
+
+                print('\nThere is a previous version of "'+str(na_name)+ '" for', str(obj))
+                replace = input('\nIt will be replaced. Please confirm (y/n): ')
+
+                while not (replace  == 'y' or replace == 'n'):
+                    print('\n invalud input')
+                    replace = input('\nIt will be replaced. Please confirm (y/n): ')
+
+                if replace == 'y':
+                    setattr(obj, na_name, na_value)
+                    print("\nAttribute assigned")
+                    
+                else:
+                    # old version is keep and the new one is lost
+                    print("\nOld attribute version was keep and the new lost")
+            else:
+                setattr(obj, na_name, na_value)
                 print('\n',str(na_name),'=',str(na_value), '. Assigned to', str(obj) ) 
                     
         else:
@@ -3479,6 +6112,145 @@ def create_readings(wells, sheet_df, sheet_name, headers, r_headers, c_well, dat
         values=value_list, units='', signal=signal_name)
         """
 
+def sheet_well_rows(s_sheet, headers, r_headers, c_well):
+    """
+    It groups the data rows of a sheet by its well column in a single pass.
+    Data rows are the ones next to the headers row until the end of the sheet
+    or until the first null value of c_well column (as in create_readings).
+
+    Parameters
+    ----------
+    s_sheet: data frame
+        pandas data frame of the selected sheet
+
+    headers: list
+        list with the headers of the included readings data
+
+    r_headers: int
+        headers row
+
+    c_well : string
+        well column header
+
+    Return
+    ------
+    block: data frame
+        data rows of s_sheet
+
+    well_rows: dict
+        {well_name: array with the row positions of that well in block}
+        wells are in order of appearance
+
+    """
+    w_col = s_sheet.iloc[r_headers+1:, headers.index(c_well)]
+
+    # the data rows end at the first null value of the well column
+    null_rows = np.flatnonzero(w_col.isnull().to_numpy())
+
+    if len(null_rows) > 0:
+        w_col = w_col.iloc[:null_rows[0]]
+
+    block = s_sheet.iloc[r_headers+1:r_headers+1+len(w_col)]
+
+    well_rows = w_col.groupby(w_col.to_numpy(), sort = False).indices
+
+    return(block, well_rows)
+
+def create_readings_bulk(wells, sheet_df, sheet_name, headers, r_headers, c_well, data_headers,
+                         reading_name, signal_name, d_units='', display = True):
+    """
+    Bulk version of create_readings. The sheet is grouped by the well column once
+    and the values of each well are taken from a float array of the data columns,
+    instead of scanning the whole sheet cell by cell for each well.
+
+    Created readings are the same as create_readings ones, but each
+    Reading.values[header] is a contiguous float array instead of a list
+    (non numerical cells, e.g. 'Undetermined', are nan).
+
+    Parameters are the same as in create_readings
+
+    wells: list
+        list of well objects to assign the readins
+
+    sheet_df: data frame
+        pandas data frame with the data sheets
+
+    sheet_name : str
+        name of the selected sheet
+
+    headers: list
+        list with the headers of the included readings data
+
+    r_headers: int
+        headers row
+
+    c_well : string
+        well column header
+
+    data_headers: list
+        list with the headers of the selected data
+
+    reading_name: string
+        name of the reading
+
+    signal_name: string
+        name or description of the signal registered in the reading
+
+    d_units: list
+        list with the units of the included data. In the same order as data_headers
+
+    display: boolean
+        to display or not the performed reading creation and assignation
+
+    """
+    s_sheet = sheet_df[sheet_name]
+
+    units = {}
+
+    for i in range(0,len(data_headers)):
+        try:
+            units[data_headers[i]] = d_units[i]
+        except:
+            units[data_headers[i]] = ''
+
+    block, well_rows = sheet_well_rows(s_sheet, headers, r_headers, c_well)
+
+    # data columns as a single float array --> [rows, data_headers]
+    d_cols = [headers.index(header) for header in data_headers]
+    d_block = block.iloc[:, d_cols].to_numpy()
+    
+    try:
+        d_array = d_block.astype(np.float64)
+    except (ValueError, TypeError):
+        # text cells (e.g. 'Undetermined') become nan
+        d_array = np.vectorize(to_float, otypes = [np.float64])(d_block)
+
+    empty = np.array([], dtype = np.float64)
+
+    for well in wells:           # only create the readings for the given wells
+        well_name = well.wpos
+
+        w_rows = well_rows.get(well_name)
+
+        values = {}                 # {header : array of values}
+        for j, header in enumerate(data_headers):
+
+            if w_rows is None:
+                values[header] = empty.copy()
+            else:
+                values[header] = np.ascontiguousarray(d_array[w_rows, j])
+
+        ## Create the Reading object:
+
+        obj = Reading(sheet = sheet_name, well = well_name, r_name = reading_name,
+                values=values, units = units, signal=signal_name)
+
+        # Assign the reading to the Well as an attribute
+        well.data.append(obj)
+
+        if display == True:
+            print(reading_name,' was added to ', well_name,' in position ', len(well.data)-1)
+
 def melting_readings(wells, sheets_df, sheet_names, c_well, c_data, data_names, 
                     reading_name, signal_name, d_units='', display = True):
     """
@@ -3574,40 +6346,1404 @@ def melting_readings(wells, sheets_df, sheet_names, c_well, c_data, data_names,
         if display == True:
             print(reading_name,' was added to ', well_name,' in position ', len(well.data))
 
-def add_time(wells, reading_name, cycle_key, t_per_c, t_unit, time_key = 'Time'):
+def find_header(s_sheet, c_well):
     """
-    This function add time serie to a reading object based on 
-    the cicle data serie.
-    
+    It search the c_well header cell in a sheet with a vectorized comparison.
+    As in melting_readings, if c_well is in more than one cell the last one
+    (row by row) is used.
+
     Parameters
     ----------
+    s_sheet: data frame
+        pandas data frame of the sheet
+
+    c_well : string
+        well column header
+
+    Return
+    ------
+    [row, column] of the header cell or None if it cannot be found
+
+    """
+    cells = np.argwhere((s_sheet == c_well).to_numpy())
+
+    if len(cells) == 0:
+        return(None)
+
+    return(list(cells[-1]))
+
+def melting_readings_indexed(wells, sheets_df, sheet_names, c_well, c_data, data_names,
+                             reading_name, signal_name, d_units='', display = True):
+    """
+    Indexed version of melting_readings. For each sheet the c_well header is
+    found with a vectorized search and a {well: row} map is built once.
+    Then the melt values of each well are sliced from the sheet data array
+    (i.e. Reading.values[data_name] is a float array instead of a list).
+
+    Parameters are the same as in melting_readings
+
     wells: list
-        list with the well objects to be modified
-    reading_name: str
-        name of the reading object to be modified for each well
-        (reading.r_name)
-    cycle_key: str
-        key of the cycle values in the reading data serie.
-    t_per_c: int
-        time per cyle (time elapsed between each cycle measurement)
-    t_units: str
-        measurement unit of the time serie
+        list of well objects to assign the readins
+
+    sheets_df: data frame
+        pandas data frame with the data sheets
+
+    sheet_names : list
+        list with the name of the selected sheets
+
+    c_well : string
+        well column header
+
+    c_data: int
+        column index where data if interest starts
+
+    data_names: list
+        list with the names of the data series
+
+    reading_name: string
+        name of the reading
+
+    signal_name: string
+        name or description of the signal registered in the reading
+
+    d_units: list
+        list with the units of the included data. In the same order as data_headers
+
+    display: boolean
+        to display or not the performed reading creation and assignation
     """
-    
-    for well in wells:
-        w_data = well.data
-        
-        for idx in range(0,len(w_data)):
-            reading = w_data[idx] 
-            if reading_name == reading.r_name:
-                
-                t_list = [t_per_c*cycle for cycle in reading.values[cycle_key]]
-                
-                well.data[idx].values[time_key] = t_list
-                well.data[idx].units[time_key] = t_unit
-                well.data[idx].d_types.append(time_key)
-                
-                print('Time serie was added to', well.s_name,'in data',str(idx))
+    units = {}
+
+    for i in range(0,len(data_names)):
+        try:
+            units[data_names[i]] = d_units[i]
+        except:
+            units[data_names[i]] = ''
+
+    d_arrays = {}    # {sheet name: data array}
+    w_rows = {}      # {sheet name: {well name: row in data array}}
+
+    for s_name in sheet_names:
+        s_sheet = sheets_df[s_name]
+
+        h_cell = find_header(s_sheet, c_well)
+
+        if h_cell == None:
+            print('"'+str(c_well)+ '" cannot be found')
+            print('No reading was created')
+            return()
+
+        h_row, h_col = h_cell
+
+        w_names = s_sheet.iloc[h_row+1:, h_col].to_numpy()
+
+        # the last row of each well is kept (as in melting_readings)
+        w_rows[s_name] = {wname: i for i, wname in enumerate(w_names)}
+        
+        d_sheet = s_sheet.iloc[h_row+1:, c_data:].to_numpy()
+        
+        try:
+            d_arrays[s_name] = d_sheet.astype(np.float64)
+        except (ValueError, TypeError):
+            # text cells (e.g. footer rows below the table) become nan
+            d_arrays[s_name] = np.vectorize(to_float, otypes = [np.float64])(d_sheet)
+
+    for well in wells:           # only create the readings for the given wells
+        well_name = well.wpos
+        values = dict()
+
+        for s_name,d_name in zip(sheet_names,data_names):
+
+            irow = w_rows[s_name].get(well_name)
+
+            if irow is not None:
+                values[d_name] = d_arrays[s_name][irow]
+
+        ## Create the Reading object:
+
+        obj = Reading(sheet = sheet_names, well = well_name, r_name = reading_name,
+                values=values, units = units, signal=signal_name)
+
+        # Assign the reading to the Well as an attribute
+        well.data.append(obj)
+
+        if display == True:
+            print(reading_name,' was added to ', well_name,' in position ', len(well.data))
+
+def iter_export_rows(filename, sheet_name = None, chunk_size = 1000):
+    """
+    It reads the rows of an instrument export file in chunks, without load
+    the whole file (or workbook) in memory.
+
+    Parameters
+    ----------
+    filename: str
+        export file. Excel workbooks (.xlsx, .xlsm) are read with openpyxl
+        in read only mode. Other files are read as text files, comma
+        separated (.csv) or tab separated (e.g. .txt)
+
+    sheet_name: str
+        name of the sheet to read (only used with Excel workbooks)
+
+    chunk_size: int
+        number of rows of each chunk
+
+    Return
+    ------
+    generator of lists with chunk_size row tuples
+    (the last one could be shorter)
+
+    """
+    f_type = os.path.splitext(filename)[1].lower()
+
+    if f_type in ['.xlsx', '.xlsm']:
+        import openpyxl as opxl
+
+        wb = opxl.load_workbook(filename, read_only = True, data_only = True)
+
+        try:
+            rows = wb[sheet_name].iter_rows(values_only = True)
+
+            chunk = list(itertools.islice(rows, chunk_size))
+            while chunk:
+                yield chunk
+                chunk = list(itertools.islice(rows, chunk_size))
+        finally:
+            wb.close()
+
+    else:
+        if f_type == '.csv':
+            delimiter = ','
+        else:
+            delimiter = '\t'
+
+        with open(filename, newline = '') as f:
+            rows = csv.reader(f, delimiter = delimiter)
+
+            chunk = list(itertools.islice(rows, chunk_size))
+            while chunk:
+                yield chunk
+                chunk = list(itertools.islice(rows, chunk_size))
+
+def to_float(value):
+    """
+    it converts a cell value to float. Empty or non numerical values are np.nan
+    """
+    try:
+        return(float(value))
+    except:
+        return(np.nan)
+
+def is_empty(value):
+    """
+    True if a cell value is empty (None, '' or nan)
+    """
+    if value is None:
+        return(True)
+
+    if type(value) == str:
+        return(value.strip() == '')
+
+    try:
+        return(bool(np.isnan(value)))
+    except:
+        return(False)
+
+def export_data_rows(filename, sheet_name, c_well, r_headers = None, headers = None,
+                     chunk_size = 1000):
+    """
+    It streams the data rows of an export sheet. Data rows are the ones next to
+    the headers row until the end of the sheet or until the first empty
+    well cell (as in create_readings) or the first row without well cell.
+
+    Parameters
+    ----------
+    filename: str
+        export file (see iter_export_rows)
+
+    sheet_name : str
+        name of the selected sheet
+
+    c_well : string
+        well column header
+
+    r_headers: int
+        headers row (0 is the first row of the file).
+        If None, it is the first row which include c_well.
+
+    headers: list
+        list with the headers of the sheet columns. If None, the headers row
+        values are used.
+
+    chunk_size: int
+        number of rows read at once
+
+    Return
+    ------
+    generator of (headers, row) tuples
+
+    """
+    found = False
+    i = 0
+
+    for chunk in iter_export_rows(filename, sheet_name, chunk_size):
+        for row in chunk:
+
+            if found == False:
+
+                if (r_headers == None and c_well in row) or i == r_headers:
+                    found = True
+
+                    if headers == None:
+                        headers = list(row)
+
+                    w_col = headers.index(c_well)
+                i += 1
+                continue
+
+            # blank or short rows (e.g. a footer block) end the data rows
+            if len(row) <= w_col or is_empty(row[w_col]):
+                return
+
+            yield(headers, row)
+
+    if found == False:
+        print('"'+str(c_well)+ '" cannot be found in', filename)
+
+def stream_readings(filename, sheet_name, c_well, data_headers, reading_name, signal_name,
+                    d_units='', r_headers = None, headers = None, well_names = None,
+                    chunk_size = 1000):
+    """
+    Streaming version of create_readings. It reads an amplification export
+    (one row per well and cycle) directly from the file, by chunks of rows,
+    and yields one Reading object per well as soon as all its rows were read.
+    The memory used only depends on the rows of one well.
+
+    It asumes the rows of each well are together, as in the instrument exports.
+
+    Parameters
+    ----------
+    filename: str
+        export file (see iter_export_rows)
+
+    sheet_name : str
+        name of the selected sheet
+
+    c_well : string
+        well column header
+
+    data_headers: list
+        list with the headers of the selected data
+
+    reading_name: string
+        name of the reading
+
+    signal_name: string
+        name or description of the signal registered in the reading
+
+    d_units: list
+        list with the units of the included data. In the same order as data_headers
+
+    r_headers: int
+        headers row (0 is the first row of the file).
+        If None, it is the first row which include c_well.
+
+    headers: list
+        list with the headers of the sheet columns. If None, the headers row
+        values are used.
+
+    well_names: list
+        well positions (well.wpos) of the readings to create. If None,
+        a reading is created for each well in the file.
+
+    chunk_size: int
+        number of rows read at once
+
+    Return
+    ------
+    generator of Reading objects. Reading.values[header] is a float array.
+
+    """
+    units = {}
+
+    for i in range(0,len(data_headers)):
+        try:
+            units[data_headers[i]] = d_units[i]
+        except:
+            units[data_headers[i]] = ''
+
+    if well_names != None:
+        well_names = set(well_names)
+
+    def new_reading(well_name, values):
+
+        values = {header: np.array(values[header], dtype = np.float64)
+                  for header in data_headers}
+
+        return(Reading(sheet = sheet_name, well = well_name, r_name = reading_name,
+                       values=values, units = units, signal=signal_name))
+
+    c_well_name = None
+    values = None
+    emitted = set()
+
+    for headers, row in export_data_rows(filename, sheet_name, c_well, r_headers,
+                                         headers, chunk_size):
+
+        well_name = row[headers.index(c_well)]
+
+        if well_name != c_well_name:
+
+            if values != None:
+                emitted.add(c_well_name)
+                yield(new_reading(c_well_name, values))
+
+            if well_name in emitted:
+                print(str(well_name),'rows are not together. A second reading is created')
+
+            c_well_name = well_name
+
+            if well_names == None or well_name in well_names:
+                values = {header: [] for header in data_headers}
+                d_cols = [headers.index(header) for header in data_headers]
+            else:
+                values = None
+
+        if values != None:
+            for header, col in zip(data_headers, d_cols):
+                values[header].append(to_float(row[col]) if col < len(row) else np.nan)
+
+    if values != None:
+        yield(new_reading(c_well_name, values))
+
+def stream_melting_readings(filename, sheet_names, c_well, c_data, data_names,
+                            reading_name, signal_name, d_units='', well_names = None,
+                            chunk_size = 1000):
+    """
+    Streaming version of melting_readings. The melt sheets (one row per well)
+    are read together, by chunks of rows, and one Reading object is
+    yielded per well as soon as its row was read in all the sheets.
+
+    Parameters
+    ----------
+    filename: str
+        export file (see iter_export_rows).
+        For text exports (e.g. .csv) each sheet is a file, so sheet_names are
+        the file names and filename is not used.
+
+    sheet_names : list
+        list with the name of the selected sheets
+
+    c_well : string
+        well column header
+
+    c_data: int
+        column index where data if interest starts
+
+    data_names: list
+        list with the names of the data series
+
+    reading_name: string
+        name of the reading
+
+    signal_name: string
+        name or description of the signal registered in the reading
+
+    d_units: list
+        list with the units of the included data. In the same order as data_headers
+
+    well_names: list
+        well positions (well.wpos) of the readings to create. If None,
+        a reading is created for each well in the file.
+
+    chunk_size: int
+        number of rows read at once
+
+    Return
+    ------
+    generator of Reading objects. Reading.values[data_name] is a float array.
+
+    """
+    units = {}
+
+    for i in range(0,len(data_names)):
+        try:
+            units[data_names[i]] = d_units[i]
+        except:
+            units[data_names[i]] = ''
+
+    if well_names != None:
+        well_names = set(well_names)
+
+    def sheet_rows(s_name):
+
+        if os.path.splitext(filename)[1].lower() in ['.xlsx', '.xlsm']:
+            s_file = filename
+        else:
+            s_file = s_name
+
+        for headers, row in export_data_rows(s_file, s_name, c_well,
+                                             chunk_size = chunk_size):
+
+            yield(row[headers.index(c_well)],
+                  np.array([to_float(v) for v in row[c_data:]], dtype = np.float64))
+
+    pending = dict()   # {well name: {data_name: values}} of incomplete wells
+
+    def new_reading(well_name):
+
+        w_values = pending.pop(well_name)
+        values = {d_name: w_values[d_name] for d_name in data_names if d_name in w_values}
+
+        return(Reading(sheet = sheet_names, well = well_name, r_name = reading_name,
+                       values=values, units = units, signal=signal_name))
+
+    s_rows = [sheet_rows(s_name) for s_name in sheet_names]
+
+    for rows in itertools.zip_longest(*s_rows):
+        for d_name, row in zip(data_names, rows):
+
+            if row == None:
+                continue
+
+            well_name, values = row
+
+            if well_names != None and well_name not in well_names:
+                continue
+
+            if well_name not in pending:
+                pending[well_name] = dict()
+
+            pending[well_name][d_name] = values
+
+            if len(pending[well_name]) == len(data_names):
+                yield(new_reading(well_name))
+
+    # wells which are not in all the sheets
+    for well_name in list(pending.keys()):
+        yield(new_reading(well_name))
+
+# readings values already parsed in this session {cache key: {well: values}}
+ingest_cache = dict()
+
+def file_hash(filename, block_size = 2**20):
+    """
+    it computes the sha256 hash of a file content (read by blocks)
+    
+    Parameters
+    ----------
+    filename: str
+        file to hash
+    block_size: int
+        number of bytes read at once
+    
+    Return
+    ------
+    hexadecimal hash string
+    """
+    f_hash = hashlib.sha256()
+    
+    with open(filename, 'rb') as f:
+        block = f.read(block_size)
+        while block:
+            f_hash.update(block)
+            block = f.read(block_size)
+    
+    return(f_hash.hexdigest())
+
+def load_readings_cached(filename, sheet_name, c_well, data_headers, reading_name, signal_name,
+                         d_units='', r_headers = None, headers = None, cache_folder = None,
+                         chunk_size = 1000, display = True):
+    """
+    Cached version of stream_readings. Parsed values are stored by the file 
+    content hash and the parse parameters (sheet_name, headers, r_headers, 
+    data_headers and c_well), so an unchanged export is parsed only once.
+    Values are kept in memory during the session (ingest_cache) and, if 
+    cache_folder is given, stored as .pkl files to be reused in other sessions.
+    
+    Readings can be assigned with assign_readings:
+        assign_readings(wells, load_readings_cached(filename, ...))
+    
+    Parameters
+    ----------
+    filename, sheet_name, c_well, data_headers, reading_name, signal_name, d_units,
+    r_headers, headers, chunk_size:
+        see stream_readings
+    
+    cache_folder: str
+        folder where parsed values are stored
+    
+    display: boolean
+        if True, it prints if the values were taken from the cache
+    
+    Return
+    ------
+    readings: list
+        list of Reading objects, one per well in the file
+    
+    """
+    p_key = repr((sheet_name, headers, r_headers, data_headers, c_well))
+    key = hashlib.sha256((file_hash(filename) + p_key).encode()).hexdigest()
+    
+    c_name = 'ingest_' + key
+    
+    if key in ingest_cache:
+        w_values = {well: {header: values.copy() for header, values in h_values.items()}
+                    for well, h_values in ingest_cache[key].items()}
+        source = 'memory cache'
+    
+    elif cache_folder != None and os.path.isfile(os.path.join(cache_folder, c_name + '.pkl')):
+        w_values = load_obj(c_name, cache_folder)
+        source = 'cache folder'
+    
+    else:
+        w_values = dict()    # {well name: {header: values}}
+        
+        for reading in stream_readings(filename, sheet_name, c_well, data_headers, reading_name,
+                                       signal_name, d_units, r_headers, headers,
+                                       chunk_size = chunk_size):
+            w_values[reading.well] = dict(reading.values)
+        
+        if cache_folder != None:
+            os.makedirs(cache_folder, exist_ok = True)
+            save_obj(w_values, c_name, cache_folder)
+        
+        source = None
+    
+    if key not in ingest_cache:
+        ingest_cache[key] = {well: {header: values.copy() for header, values in h_values.items()}
+                             for well, h_values in w_values.items()}
+    
+    if display == True:
+        if source != None:
+            print(filename, 'readings were taken from the', source)
+        else:
+            print(filename, 'was parsed')
+    
+    ## create the readings ##
+    units = {}
+    
+    for i in range(0,len(data_headers)):
+        try:
+            units[data_headers[i]] = d_units[i]
+        except:
+            units[data_headers[i]] = ''
+    
+    readings = list()
+    
+    for well_name, values in w_values.items():
+        
+        readings.append(Reading(sheet = sheet_name, well = well_name, r_name = reading_name, 
+                                values=values, units = units, signal=signal_name))
+    
+    return(readings)
+
+def assign_readings(wells, readings, display = True):
+    """
+    It assigns Reading objects (e.g. from stream_readings) to the well with the
+    same position (reading.well == well.wpos).
+    Readings of other wells are discarded.
+
+    Parameters
+    ----------
+    wells: list
+        list of well objects to assign the readings
+
+    readings: iterable
+        Reading objects
+
+    display: boolean
+        to display or not the performed reading assignation
+
+    """
+    w_pos = {well.wpos: well for well in wells}
+
+    for reading in readings:
+
+        well = w_pos.get(reading.well)
+
+        if well != None:
+            well.data.append(reading)
+
+            if display == True:
+                print(reading.r_name,' was added to ', well.wpos,' in position ', len(well.data)-1)
+
+def load_plate(filename, sheet_name, c_well, data_headers, reading_name, signal_name,
+               d_units='', setup_sheet = None, attr_headers = None, exp = None,
+               description = None, chunk_size = 1000):
+    """
+    It creates a Well_set from one plate export file. A Well object is created
+    for each well in the amplification sheet, with its Reading
+    (see stream_readings) and, if setup_sheet is given, the well attributes
+    taken from the plate setup sheet.
+
+    Parameters
+    ----------
+    filename: str
+        export file (see iter_export_rows)
+
+    sheet_name : str
+        name of the amplification data sheet
+
+    c_well : string
+        well column header (in the amplification and setup sheets)
+
+    data_headers: list
+        list with the headers of the selected data
+
+    reading_name: string
+        name of the reading
+
+    signal_name: string
+        name or description of the signal registered in the reading
+
+    d_units: list
+        list with the units of the included data. In the same order as data_headers
+
+    setup_sheet: str
+        name of the sheet with the samples information (one row per well).
+        For text exports (e.g. .csv) it is the setup file name.
+
+    attr_headers: dict
+        {well attribute name: setup sheet header}. By default
+        {'s_name': 'Sample Name', 'reporter': 'Reporter', 'target': 'Target Name'}
+        attributes different of Well arguments are added with setattr.
+
+    exp: str
+        experiment name. By default is the file name (without extension)
+
+    description: str
+        Well_set description
+
+    chunk_size: int
+        number of rows read at once
+
+    Return
+    ------
+    wset: Well_set object
+        Well_set named as the file (without extension)
+
+    """
+    fname = os.path.splitext(os.path.basename(filename))[0]
+
+    if exp == None:
+        exp = fname
+
+    if description == None:
+        description = 'wells loaded from ' + str(filename)
+
+    if attr_headers == None:
+        attr_headers = {'s_name': 'Sample Name', 'reporter': 'Reporter',
+                        'target': 'Target Name'}
+
+    ## well attributes from setup sheet ##
+    w_attrs = dict()   # {well position: {attribute name: value}}
+
+    if setup_sheet != None:
+
+        if os.path.splitext(filename)[1].lower() in ['.xlsx', '.xlsm']:
+            s_file = filename
+        else:
+            s_file = setup_sheet
+
+        for headers, row in export_data_rows(s_file, setup_sheet, c_well,
+                                             chunk_size = chunk_size):
+            attrs = dict()
+
+            for attr, header in attr_headers.items():
+                if header in headers:
+                    attrs[attr] = row[headers.index(header)]
+
+            w_attrs[row[headers.index(c_well)]] = attrs
+
+    ## create the wells ##
+    wells = list()
+
+    for reading in stream_readings(filename, sheet_name, c_well, data_headers, reading_name,
+                                   signal_name, d_units, chunk_size = chunk_size):
+
+        attrs = dict(w_attrs.get(reading.well, dict()))
+
+        well = Well(fname, exp, reading.well, attrs.pop('s_name', None),
+                    attrs.pop('reporter', None), attrs.pop('target', None),
+                    data = [reading], analysis = [])
+
+        for attr, value in attrs.items():
+            setattr(well, attr, value)
+
+        wells.append(well)
+
+    return(Well_set(wells, fname, fname, description))
+
+def load_plates(folder, sheet_name, c_well, data_headers, reading_name, signal_name,
+                f_type = '.xlsx', processes = None, display = True, **kwargs):
+    """
+    It creates a Well_set for each plate export file in folder (see load_plate).
+    Files are loaded in parallel, one file per process.
+
+    The returned Well_sets (and their wells) are ready to be added to
+    a Database. e.g.:
+        wsets = load_plates(folder, ...)
+        database.append_objs('well_sets', wsets)
+        database.append_objs('wells', [w for wset in wsets for w in wset.wells])
+
+    Obs: on Windows (and jupyter notebooks with "spawn" start method) the
+    functions run by the processes have to be importable, so rt_data_manage
+    has to be imported as a module (not copied in the notebook).
+
+    Parameters
+    ----------
+    folder: str
+        folder with the export files
+
+    sheet_name, c_well, data_headers, reading_name, signal_name:
+        see load_plate
+
+    f_type: str
+        extension of the export files to load
+
+    processes: int
+        number of processes. If None, the number of CPUs is used.
+        If 1, files are loaded one by one in this process.
+
+    display: boolean
+        if True, the number of wells loaded of each file is printed
+
+    **kwargs
+        All other arguments are forwarded to load_plate
+
+    Return
+    ------
+    wsets: list
+        list of Well_set objects, in the same order as the sorted file names
+
+    """
+    files = sorted(glob.glob(os.path.join(folder, '*' + f_type)))
+
+    load = functools.partial(load_plate, sheet_name = sheet_name, c_well = c_well,
+                             data_headers = data_headers, reading_name = reading_name,
+                             signal_name = signal_name, **kwargs)
+
+    if processes == 1 or len(files) < 2:
+        wsets = [load(filename) for filename in files]
+
+    else:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            wsets = list(executor.map(load, files))
+
+    if display == True:
+        for wset in wsets:
+            print(str(wset))
+        print('\n'+str(len(wsets)), 'well_sets were loaded from', folder)
+
+    return(wsets)
+
+def well_set_from_table(table, name, description = '', fname = None, exp = None,
+                        well_col = 'Well Position', attr_cols = None, channels = None,
+                        cath_cols = None, reading_name = 'Amplification data', 
+                        signal_name = '', units = None, store = True, display = True):
+    """
+    It creates a Well_set, with its wells, readings and classifications, from
+    a long format table (one row per well and cycle) in a single vectorized 
+    pass, instead of create each Well and then run create_readings and
+    create_classification.
+    
+    e.g. table columns: 
+        'Well Position', 'Sample Name', 'Target Name', 'Reporter', 'Cycle', 
+        'Rn', 'ΔRn', 'Enzyme', 'Primers'
+    
+    Parameters
+    ----------
+    table: data frame
+        pandas data frame in long format. The rows of each well are in 
+        the order of its values (e.g. cycles).
+    
+    name: str
+        name of the Well_set
+    
+    description: str
+        description of the Well_set
+    
+    fname: str
+        filename (experiment file) of the wells
+    
+    exp: str
+        experiment name. By default is fname
+    
+    well_col: str
+        well position column
+    
+    attr_cols: dict
+        {well attribute name: column}. By default 
+        {'s_name': 'Sample Name', 'target': 'Target Name', 'reporter': 'Reporter'}.
+        The value of the first row of each well is used. Attributes different of 
+        Well arguments are added with setattr.
+    
+    channels: list
+        columns with the reading values (e.g. ['Cycle', 'Rn', 'ΔRn']).
+        By default all the numerical columns which are not in attr_cols or cath_cols
+    
+    cath_cols: list
+        columns used to create a classification (named as the column), using 
+        the value of the first row of each well.
+    
+    reading_name: str
+        name of the created readings
+    
+    signal_name: str
+        name or description of the signal registered in the readings
+    
+    units: dict
+        {channel: units}
+    
+    store: boolean
+        if True, readings values are views of a Plate_store
+        (well_set.store), otherwise each reading has its own arrays
+    
+    display: boolean
+        if True, some information is printed
+    
+    Return
+    ------
+    wset: Well_set object
+    
+    """
+    if exp == None:
+        exp = fname
+    
+    if attr_cols == None:
+        attr_cols = {'s_name': 'Sample Name', 'target': 'Target Name', 'reporter': 'Reporter'}
+    
+    attr_cols = {attr: col for attr, col in attr_cols.items() if col in table.columns}
+    
+    if cath_cols == None:
+        cath_cols = list()
+    
+    if units == None:
+        units = dict()
+    
+    if channels == None:
+        no_channel = [well_col] + list(attr_cols.values()) + list(cath_cols)
+        channels = [col for col in table.select_dtypes('number').columns if col not in no_channel]
+    
+    ## rows organization ##
+    codes, w_names = table[well_col].factorize()    # well row of each table row
+    w_names = list(w_names)
+    n_wells = len(w_names)
+    
+    pos = table.groupby(codes, sort = False).cumcount().to_numpy()   # value position in well
+    lengths = np.bincount(codes[codes >= 0], minlength = n_wells)
+    _, first = np.unique(codes, return_index = True)      # first row of each well
+    first = first[-n_wells:]        # without null wells (code -1)
+    
+    valid = codes >= 0
+    
+    ## readings values ##
+    data = dict()
+    for channel in channels:
+        d_array = np.full((n_wells, int(lengths.max()) if n_wells else 0), np.nan)
+        d_array[codes[valid], pos[valid]] = table[channel].to_numpy(dtype = np.float64)[valid]
+        data[channel] = d_array
+    
+    r_units = {channel: units.get(channel, '') for channel in channels}
+    
+    ## wells ##
+    w_attrs = {attr: table[col].to_numpy()[first] for attr, col in attr_cols.items()}
+    
+    wells = list()
+    metadata = list()
+    
+    for i in range(0, n_wells):
+        
+        attrs = {attr: values[i] for attr, values in w_attrs.items()}
+        
+        reading = Reading(sheet = None, well = w_names[i], r_name = reading_name, values = dict(),
+                          units = r_units, signal = signal_name, d_types = list(channels))
+        
+        if store == False:
+            for channel in channels:
+                reading.values[channel] = data[channel][i, :lengths[i]].copy()
+        
+        well = Well(fname, exp, w_names[i], attrs.pop('s_name', None), attrs.pop('reporter', None),
+                    attrs.pop('target', None), [reading], [])
+        
+        for attr, value in attrs.items():
+            setattr(well, attr, value)
+        
+        wells.append(well)
+        metadata.append({'wpos': well.wpos, 's_name': well.s_name, 'reporter': well.reporter,
+                         'target': well.target, 'exp': exp, 'fname': fname})
+    
+    wset = Well_set(wells, name, fname, description)
+    
+    if store == True:
+        wset.store = Plate_store(reading_name, w_names, data, lengths, r_units, metadata)
+        
+        for i, well in enumerate(wells):
+            well.data[0].values.bind(wset.store, i)
+    
+    ## classifications ##
+    for col in cath_cols:
+        
+        c_codes, c_values = table[col].iloc[first].factorize()
+        
+        caths = [Well_cath(col, value) for value in c_values.tolist()]
+        groups = {cath: list() for cath in caths}
+        
+        for well, code in zip(wells, c_codes):
+            if code >= 0:
+                groups[caths[code]].append(well)
+        
+        c_wells = [well for well, code in zip(wells, c_codes) if code >= 0]
+        
+        clf = Classification(col, caths, c_wells, groups)
+        wset.clfs.append(clf)
+        
+        # append the cathegories to the wells (and index them)
+        wset.index_clf(clf)
+    
+    if display == True:
+        print(str(wset), 'was created with', channels, 'readings')
+        for clf in wset.clfs:
+            print(clf.description())
+    
+    return(wset)
+
+def extend_readings(wells, readings, display = True):
+    """
+    It appends the new values of readings (e.g. the export of a run still in
+    progress) to the Reading with the same r_name of each well, instead of
+    create the readings again. 
+    Only the values after the current length of each well reading are
+    appended (i.e. the newly exported cycles).
+    If a well has no reading with that r_name, the whole reading is appended
+    to well.data.
+    Readings bound to a Plate_store (see create_plate_store) are extended 
+    in the store, so they keep being views of it.
+    
+    Parameters
+    ----------
+    wells: list
+        list of well objects with the readings to extend
+    
+    readings: iterable
+        Reading objects with all the values exported up to now
+        (e.g. from stream_readings). reading.well is the well position.
+    
+    display: boolean
+        to display or not the number of appended values of each well
+    
+    Return
+    ------
+    updated: list
+        list of the wells whose readings were extended
+    
+    """
+    w_pos = {well.wpos: well for well in wells}
+    updated = list()
+    
+    for n_reading in readings:
+        
+        well = w_pos.get(n_reading.well)
+        
+        if well == None:
+            continue
+        
+        reading = well.data.get(n_reading.r_name)
+        
+        if reading == None:
+            well.data.append(n_reading)
+            updated.append(well)
+            continue
+        
+        r_keys = stored_keys(reading.values)
+        
+        n_old = min([len(reading.values[d_type]) for d_type in stored_keys(n_reading.values)
+                     if d_type in r_keys], default = 0)
+        n_new = 0
+        
+        store = getattr(reading.values, 'store', None)
+        s_tails = dict()    # {channel: values} to append in the store
+        
+        for d_type in stored_keys(n_reading.values):
+            
+            if d_type not in r_keys:
+                continue
+            
+            n_values = n_reading.values[d_type]
+            
+            tail = n_values[n_old:]
+            n_new = len(tail)
+            
+            if store != None and store.is_view(d_type, reading.values[d_type]):
+                s_tails[d_type] = tail
+            
+            elif type(reading.values[d_type]) == list:
+                reading.values[d_type].extend(list(tail))
+            else:
+                reading.values[d_type] = np.concatenate((reading.values[d_type], tail))
+        
+        if len(s_tails) > 0:
+            store.extend(reading.values.row, s_tails)
+        
+        if n_new > 0:
+            updated.append(well)
+            
+            if display == True:
+                print(n_new, 'values were appended to', reading.r_name, 'of', well.wpos)
+    
+    return(updated)
+
+def create_plate_store(wells, reading_name, channels = None, name = None, bind = True,
+                       display = True):
+    """
+    It creates a Plate_store with the values of the wells readings.
+    if bind == True, the reading values are replaced by views of the store rows,
+    so the values are stored once per plate (reading.values[channel] keeps
+    working as before).
+    
+    Parameters
+    ----------
+    wells: list
+        list with the well objects
+    reading_name: str
+        name of the reading (reading.r_name)
+    channels: list
+        names of the reading series to include. By default all the stored series
+        of the first well reading (derived columns are not included).
+    name: str
+        store name. By default reading_name
+    bind: boolean
+        if True, readings values are replaced by views of the store
+    display: boolean
+        if True, it prints some information about the store
+    
+    Return
+    ------
+    store: Plate_store object
+    
+    """
+    if name == None:
+        name = reading_name
+    
+    readings = list()
+    w_names = list()
+    metadata = list()   # wells information
+    
+    for well in wells:
+        reading = well.data.get(reading_name)
+        
+        if reading != None:
+            readings.append(reading)
+            w_names.append(well.wpos)
+            metadata.append({attr: getattr(well, attr, None) for attr in 
+                             ['wpos', 's_name', 'reporter', 'target', 'exp', 'fname']})
+    
+    if channels == None:
+        channels = stored_keys(readings[0].values) if readings else list()
+    
+    lengths = np.array([len(reading.values[channels[0]]) for reading in readings], 
+                       dtype = np.int64) if channels else np.zeros(len(readings), dtype = np.int64)
+    n_cols = int(lengths.max()) if len(lengths) else 0
+    
+    data = dict()
+    units = dict()
+    
+    for channel in channels:
+        d_array = np.full((len(readings), n_cols), np.nan)
+        
+        for i, reading in enumerate(readings):
+            d_array[i, :lengths[i]] = np.asarray(reading.values[channel], dtype = np.float64)
+        
+        data[channel] = d_array
+        
+        try:
+            units[channel] = readings[0].units[channel]
+        except:
+            units[channel] = ''
+    
+    store = Plate_store(name, w_names, data, lengths, units, metadata)
+    
+    if bind == True:
+        for i, reading in enumerate(readings):
+            
+            # readings created before plate stores were available
+            if not isinstance(reading.values, Reading_values):
+                reading.values = Reading_values(reading.values)
+            
+            reading.values.bind(store, i)
+    
+    if display == True:
+        print('"'+str(name)+'" store was created with', len(readings), 'wells x', n_cols, 
+              'values of', channels)
+    
+    return(store)
+
+# binary plate files: magic string, header length (uint64) and json header,
+# followed by the channel arrays (aligned to plate_align bytes)
+plate_magic = b'RTPLATE1'
+plate_align = 64
+
+def json_value(value):
+    """
+    It converts a value to be written in a json header: numpy values are 
+    converted to python values, nan (e.g. empty sample names) and inf to 
+    None (json null) and other values to str.
+    """
+    if isinstance(value, dict):
+        return({str(key): json_value(d_value) for key, d_value in value.items()})
+    
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return([json_value(l_value) for l_value in value])
+    
+    if isinstance(value, np.generic):
+        value = value.item()
+    
+    if isinstance(value, float) and not np.isfinite(value):
+        return(None)
+    
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return(value)
+    
+    return(str(value))
+
+def save_plate_binary(store, filename):
+    """
+    It saves a Plate_store in a compact binary file, which can be read
+    (memory-mapped) by other tools or processes without unpickle a Database.
+    
+    File layout:
+        - 8 bytes: b'RTPLATE1'
+        - 8 bytes: header length (little endian unsigned integer)
+        - json header with the store name, wells metadata (position, sample 
+          name, reporter, ...), lengths, units and the position of each channel
+        - channel arrays (little endian float64, wells x cycles, C order)
+    
+    Parameters
+    ----------
+    store: Plate_store object
+        store to be saved (see create_plate_store)
+    filename: str
+        file name (with extension, e.g. 'plate_1.rtp')
+    """
+    channels = list()
+    offset = 0
+    
+    for channel, d_array in store.data.items():
+        
+        channels.append({'name': channel, 'units': store.units.get(channel, ''), 
+                         'dtype': '<f8', 'shape': list(d_array.shape), 'offset': offset})
+        
+        offset += d_array.size * 8
+        offset += -offset % plate_align
+    
+    header = {'version': 1, 'name': store.name, 'wells': store.metadata, 
+              'lengths': [int(n) for n in store.lengths], 'channels': channels}
+    
+    h_bytes = json.dumps(json_value(header), allow_nan = False).encode('utf-8')
+    h_bytes += b' ' * (-(len(h_bytes) + 16) % plate_align)   # data starts aligned
+    
+    with open(filename, 'wb') as f:
+        f.write(plate_magic)
+        f.write(np.uint64(len(h_bytes)).astype('<u8').tobytes())
+        f.write(h_bytes)
+        
+        for channel, c_info in zip(store.data.values(), channels):
+            
+            f.write(np.ascontiguousarray(channel, dtype = '<f8').tobytes())
+            f.write(b'\0' * (-f.tell() % plate_align))
+    
+    print('"'+str(store.name)+'" store was saved in', filename)
+
+def load_plate_binary(filename, mmap = True):
+    """
+    It loads a Plate_store saved with save_plate_binary
+    
+    Parameters
+    ----------
+    filename: str
+        plate binary file
+    mmap: boolean
+        if True, channel arrays are read-only memory maps of the file 
+        (values are read from disk only when used). Otherwise they are 
+        loaded in memory.
+    
+    Return
+    ------
+    store: Plate_store object
+        store.metadata has the wells information
+    """
+    with open(filename, 'rb') as f:
+        
+        if f.read(8) != plate_magic:
+            print(filename, 'is not a plate binary file')
+            return(None)
+        
+        h_len = int(np.frombuffer(f.read(8), dtype = '<u8')[0])
+        header = json.loads(f.read(h_len).decode('utf-8'))
+        
+        d_start = 16 + h_len
+        data = dict()
+        units = dict()
+        
+        for c_info in header['channels']:
+            
+            shape = tuple(c_info['shape'])
+            
+            if mmap == True and np.prod(shape) > 0:
+                d_array = np.memmap(filename, dtype = c_info['dtype'], mode = 'r', 
+                                    offset = d_start + c_info['offset'], shape = shape)
+            else:
+                f.seek(d_start + c_info['offset'])
+                d_array = np.fromfile(f, dtype = c_info['dtype'], 
+                                      count = int(np.prod(shape))).reshape(shape)
+            
+            data[c_info['name']] = d_array
+            units[c_info['name']] = c_info['units']
+    
+    wpos = [w_info['wpos'] for w_info in header['wells']]
+    
+    return(Plate_store(header['name'], wpos, data, header['lengths'], units, header['wells']))
+
+def wells_from_store(store, reading_name = None, signal_name = '', sheet = None):
+    """
+    It creates a Well object for each row of a Plate_store (e.g. loaded with
+    load_plate_binary) with a Reading bound to the store row.
+    
+    Parameters
+    ----------
+    store: Plate_store object
+    reading_name: str
+        name of the created readings. By default store.name
+    signal_name: str
+        name or description of the signal registered in the reading
+    sheet: str
+        reading sheet attribute
+    
+    Return
+    ------
+    wells: list
+        list of Well objects
+    """
+    if reading_name == None:
+        reading_name = store.name
+    
+    wells = list()
+    
+    for i, w_info in enumerate(store.metadata):
+        
+        reading = Reading(sheet = sheet, well = w_info['wpos'], r_name = reading_name,
+                          values = dict(), units = dict(store.units), signal = signal_name,
+                          d_types = list(store.data.keys()))
+        reading.values.bind(store, i)
+        
+        well = Well(w_info.get('fname'), w_info.get('exp'), w_info['wpos'], w_info.get('s_name'),
+                    w_info.get('reporter'), w_info.get('target'), [reading], [])
+        wells.append(well)
+    
+    return(wells)
+
+def add_derived(wells, reading_name, column, display = True):
+    """
+    It adds a derived column to the reading of each well.
+    The column values are not stored in the wells but computed when they are
+    requested (reading.values[column.name]). As the same column object is
+    shared by all the wells, computed values are cached by plate.
+    
+    Parameters
+    ----------
+    wells: list
+        list with the well objects to be modified
+    reading_name: str
+        name of the reading object to be modified for each well
+        (reading.r_name)
+    column: Derived_column object
+        column to be added
+    display: boolean
+        if True, it prints the modified wells
+    """
+    
+    for well in wells:
+        idx = well.data.position(reading_name)
+        
+        if idx != None:
+            reading = well.data[idx]
+            
+            # readings created before derived columns were available
+            if not isinstance(reading.values, Reading_values):
+                reading.values = Reading_values(reading.values)
+            
+            reading.values.derived[column.name] = column
+            reading.units[column.name] = column.units
+            
+            if column.name not in reading.d_types:
+                reading.d_types.append(column.name)
+            
+            if display == True:
+                print(column.name, 'serie was added to', well.s_name,'in data',str(idx))
+
+def add_time(wells, reading_name, cycle_key, t_per_c, t_unit, time_key = 'Time'):
+    """
+    This function add time serie to a reading object based on 
+    the cicle data serie.
+    The time serie is a derived column (see add_derived), so it is computed
+    from the current cycle values when requested.
+    
+    Parameters
+    ----------
+    wells: list
+        list with the well objects to be modified
+    reading_name: str
+        name of the reading object to be modified for each well
+        (reading.r_name)
+    cycle_key: str
+        key of the cycle values in the reading data serie.
+    t_per_c: int
+        time per cyle (time elapsed between each cycle measurement)
+    t_units: str
+        measurement unit of the time serie
+    """
+    
+    t_column = Derived_column(time_key, dc_scale, [cycle_key], {'factor': t_per_c}, t_unit)
+    
+    add_derived(wells, reading_name, t_column, display = False)
+    
+    for well in wells:
+        idx = well.data.position(reading_name)
+        
+        if idx != None:
+            print('Time serie was added to', well.s_name,'in data',str(idx))
+
+def add_delta_rn(wells, reading_name, rn_key = 'Rn', cycle_key = 'Cycle', b_start = 3, 
+                 b_end = 15, units = '', drn_key = 'ΔRn', display = True):
+    """
+    It adds the ΔRn serie (Rn minus its baseline) to a reading object as a
+    derived column (see add_derived). The baseline of each well is the mean
+    Rn value between cycles b_start and b_end.
+    
+    Parameters
+    ----------
+    wells: list
+        list with the well objects to be modified
+    reading_name: str
+        name of the reading object to be modified for each well
+    rn_key: str
+        key of the Rn values in the reading
+    cycle_key: str
+        key of the cycle values in the reading
+    b_start, b_end: int
+        baseline cycles (both included)
+    units: str
+        ΔRn units
+    drn_key: str
+        name of the ΔRn serie
+    display: boolean
+        if True, it prints the modified wells
+    """
+    drn_column = Derived_column(drn_key, dc_baseline_subtract, [rn_key, cycle_key],
+                                {'b_start': b_start, 'b_end': b_end}, units, cache = False)
+    
+    add_derived(wells, reading_name, drn_column, display = display)
 
 def save_fig(fname, figure, legend = [0,0], fformat = '.pdf'):
     """
@@ -4280,11 +8416,11 @@ def series_mean_int_rep(dset,keys, display = True):
         y_vals = np.asarray(serie.y)  # step values
         
         # compute the mean values for each concentration
-        nr_x = nr_list(x_vals, False)
+        nr_x, x_inv = unique_list(x_vals, return_inverse = True)
         y_mean = list()
         
-        for x in nr_x:
-            y_x = y_vals[x_vals == x]  # y values of that concentration
+        for y_x in group_values(y_vals, x_inv, len(nr_x)):
+            # y_x = y values of that concentration
             
             y_x =np.array(y_x, dtype=np.float64) # to convert None to np.nan
             
@@ -4385,15 +8521,15 @@ def series_mean(dset, series_attr, keys, s_name, display = True):
     y_vals = np.asarray(y_vals)
     
     # get the non redundant values of x_vals
-    nr_x = nr_list(x_vals,False)
+    nr_x, x_inv = unique_list(x_vals, return_inverse = True)
     
     y_mean = list()
     y_std = list()
     y_n = list()
     y_sem = list()
     
-    for x in nr_x:
-        y_x = y_vals[x_vals == x]  # y values of that concentration
+    for y_x in group_values(y_vals, x_inv, len(nr_x)):
+        # y_x = y values of that concentration
         y_x =np.array(y_x, dtype=np.float64)
         
         mean = np.nanmean(y_x)
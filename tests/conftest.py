@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+pytest configuration: rt_data_manage.py is imported as a module (as in the
+notebooks) and figures are not displayed.
+"""
+import os
+import sys
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'rt_data_manage'))
+
+import numpy as np
+import pytest
+
+import rt_data_manage as rdm
+
+
+def new_well(wpos, fname = 'plate_1', s_name = 'sample', target = 'target'):
+    return(rdm.Well(fname, 'exp', wpos, s_name, 'SYBR', target, [], []))
+
+
+def sigmoid(x, center, width = 1.5, top = 1.0, base = 0.01):
+    return(top/(1 + np.exp(-(np.asarray(x, dtype = float) - center)/width)) + base)
+
+
+@pytest.fixture
+def wells():
+    return([new_well('A'+str(i)) for i in range(1, 13)])
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import builtins
+import pickle
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+def param(name, value):
+    return(rdm.Parameter(name, '', '', value))
+
+
+def test_parameters_are_replaced_by_name():
+    well = new_well('A1')
+    for name, value in [('a', 1), ('b', 2), ('Ct', 3)]:
+        rdm.well_param_assignation(param(name, value), well)
+
+    rdm.well_param_assignation(param('b', 20), well)
+
+    assert isinstance(well.analysis, rdm.Analysis_list)
+    assert [p.name for p in well.analysis] == ['a', 'b', 'Ct']
+    assert rdm.get_well_param(well, 'b') == 20
+    assert rdm.get_well_param(well, 'N') == None
+
+
+def test_old_parameter_is_kept_if_not_confirmed(monkeypatch):
+    well = new_well('A1')
+    rdm.well_param_assignation(param('a', 1), well)
+
+    monkeypatch.setattr(builtins, 'input', lambda text: 'n')
+    rdm.well_param_assignation(param('a', 2), well, ask = True)
+
+    assert rdm.get_well_param(well, 'a') == 1
+
+
+def test_index_follows_list_changes():
+    well = new_well('A1')
+    for name in ['a', 'b', 'c']:
+        rdm.well_param_assignation(param(name, name), well)
+
+    del well.analysis[0]
+    assert well.analysis.position('c') == 1
+    assert well.analysis.get('a') == None
+
+    well.analysis.insert(0, param('x', 'x'))
+    well.analysis[1] = param('y', 'y')     # replaces 'b'
+    assert [well.analysis.position(name) for name in ['x', 'y', 'b', 'c']] == [0, 1, None, 2]
+
+    assert well.analysis.pop_key('c').value == 'c'
+    assert well.analysis.position('c') == None
+
+    l_well = pickle.loads(pickle.dumps(well))
+    assert rdm.get_well_param(l_well, 'y') == 'y'
+    assert l_well.analysis.position('x') == 0
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from scipy.optimize import curve_fit
+
+import rt_data_manage as rdm
+
+
+def bounded_fit(x, y):
+    # the exponential region fitting of exponential_region
+    line = lambda x, a, b: a*x + b
+    params, _ = curve_fit(line, x, y, p0 = [0.1, -1], bounds = ([0, -np.inf], [np.inf, 0]))
+    return(params)
+
+
+def test_same_parameters_as_bounded_curve_fit():
+    x = np.arange(1, 21, dtype = float)
+    rng = np.random.default_rng(1)
+
+    NY = np.vstack([10**(0.15*x - 3) * (1 + rng.normal(0, 0.02, len(x))),  # free solution
+                    10**(0.05*x + 0.2),                      # b > 0 --> b = 0
+                    10**(-0.02*x - 0.5)])                    # a < 0 --> a = 0
+    P1 = np.array([2, 2, 2])
+    P2 = np.array([12, 12, 12])
+
+    A, B, R2, M = rdm.batch_loglinear_fit(x, NY, P1, P2, P2 + 2)
+
+    for i in range(3):
+        a, b = bounded_fit(x[P1[i]:P2[i]+1], np.log10(NY[i, P1[i]:P2[i]+1]))
+        assert np.allclose([A[i], B[i]], [a, b], atol = 1e-6)
+
+    assert B[1] == 0 and A[2] == 0
+    assert 0.99 < R2[0] <= 1
+
+
+def test_series_without_exponential_region():
+    x = np.arange(1, 11, dtype = float)
+    NY = np.vstack([np.linspace(0.1, 1, 10), np.linspace(0.1, 1, 10)])
+
+    A, B, R2, M = rdm.batch_loglinear_fit(x, NY, [-1, 3], [-1, 3], [-1, 5])
+
+    # no region and a single point region can not be fitted
+    assert np.isnan(A).all() and np.isnan(B).all()
+    assert list(R2) == [0, 0]
+    assert M[0] == 1        # maximum value as plateau
+
+
+def test_plateau_and_padded_rows():
+    x = np.arange(1, 11, dtype = float)
+    NY = np.array([[0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0, 2.0, 2.0, 2.0],
+                   [0.1, 0.2, 0.4, 0.8, 0.9, 1.0, 1.1, np.nan, np.nan, np.nan],
+                   [0.1, 0.2, 0.4, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.4]])
+
+    A, B, R2, M = rdm.batch_loglinear_fit(x, NY, [0, 0, 0], [3, 3, 3], [5, 6, 9],
+                                          lengths = [10, 7, 10])
+
+    assert M[0] == 1.5                          # plateau upper bound
+    assert M[1] == 1.1 and M[2] == 1.4          # a single plateau point --> last value
+    assert np.allclose(A[:2], np.log10(2)) and np.allclose(B[:2], -1 - np.log10(2))
+    assert np.allclose(R2[:2], 1)
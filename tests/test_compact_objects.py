@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import numpy as np
+import pytest
+
+import rt_data_manage as rdm
+
+from tests.test_well_set_from_table import long_table
+
+
+def compact_set():
+    wset = rdm.well_set_from_table(long_table(), 'set', cath_cols = ['Enzyme'], display = False)
+    rdm.well_param_assignation(rdm.Parameter('Ct', 'cycle threshold', 'cycles', 20.5),
+                               wset.wells[0])
+    return(rdm.compact_graph(wset, display = False))
+
+
+def test_objects_are_replaced_by_compact_versions():
+    wset = compact_set()
+    well = wset.wells[0]
+
+    assert type(well) == rdm.Compact_well and not hasattr(well, '__dict__')
+    assert type(well.data[0]) == rdm.Compact_reading
+    assert type(well.caths[0]) == rdm.Compact_well_cath
+    assert isinstance(well.analysis, rdm.Analysis_list)
+    assert rdm.get_well_param(well, 'Ct') == 20.5
+    assert well.analysis[0].description == 'cycle threshold'
+
+    # references between objects are kept
+    clf = wset.clfs[0]
+    assert well.caths[0] in clf.groups and well in clf.groups[well.caths[0]]
+    assert [w.wpos for w in wset.select('Enzyme', 'E1')] == ['A1', 'B1']
+
+
+def test_extra_attributes():
+    well = compact_set().wells[1]
+    well.cq_flag = 'check'
+
+    assert well.cq_flag == 'check'
+    assert rdm.inspect(well)['wpos'] == 'A2'
+    assert 'cq_flag' in rdm.attr_names(well)
+
+    del well.cq_flag
+    with pytest.raises(AttributeError):
+        well.cq_flag
+
+
+def test_pickle_round_trip():
+    wset = compact_set()
+    wset.wells[0].cq_flag = 'check'
+
+    l_wset = pickle.loads(pickle.dumps(wset))
+    l_well = l_wset.wells[0]
+
+    assert type(l_well) == rdm.Compact_well
+    assert l_well.cq_flag == 'check'
+    assert l_wset.wells[1].caths[0] in l_wset.clfs[0].groups
+    assert np.array_equal(l_well.data[0].values['Rn'], wset.wells[0].data[0].values['Rn'])
+    assert l_well.data.get('Amplification data') is l_well.data[0]
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+headers = ['Well', 'Well Position', 'Cycle', 'Rn', 'ΔRn']
+
+
+def amplification_sheet(w_names, n_cycles = 4, text_cell = None):
+    rows = [['Block Type', None, None, None, None], [None]*5, list(headers)]
+
+    for k, w_name in enumerate(w_names):
+        for cycle in range(1, n_cycles+1):
+            rows.append([k+1, w_name, cycle, 0.1*cycle + k, 0.05*cycle*k])
+
+    if text_cell != None:
+        rows[text_cell[0]][text_cell[1]] = 'Undetermined'
+
+    rows.append([None]*5)
+    rows.append(['Analysis Type', 'Singleplex', None, None, None])
+
+    return({'Amplification Data': pd.DataFrame(rows)})
+
+
+def create_both(sheets):
+    args = ('Amplification Data', headers, 2, 'Well Position', ['Cycle', 'Rn', 'ΔRn'],
+            'Amplification data', 'SYBR')
+
+    wells = [new_well(w_name) for w_name in ['A1', 'A2', 'B1']]
+    b_wells = [new_well(w_name) for w_name in ['A1', 'A2', 'B1']]
+
+    rdm.create_readings(wells, sheets, *args, display = False)
+    rdm.create_readings_bulk(b_wells, sheets, *args, display = False)
+
+    return(wells, b_wells)
+
+
+def test_bulk_readings_are_the_same_as_create_readings():
+    wells, b_wells = create_both(amplification_sheet(['A1', 'A2']))
+
+    for well, b_well in zip(wells, b_wells):
+        reading = well.data.get('Amplification data')
+        b_reading = b_well.data.get('Amplification data')
+
+        assert b_reading.d_types == reading.d_types
+        assert b_reading.units == reading.units
+
+        for header in reading.d_types:
+            assert isinstance(b_reading.values[header], np.ndarray)
+            assert np.array_equal(b_reading.values[header],
+                                  np.array(reading.values[header], dtype = float))
+
+    # wells without rows get empty readings (as in create_readings)
+    assert len(b_wells[2].data[0].values['Rn']) == 0
+
+
+def test_bulk_readings_with_a_text_cell():
+    # regression: 'Undetermined' cells raised ValueError
+    wells, b_wells = create_both(amplification_sheet(['A1', 'A2'], text_cell = (4, 3)))
+
+    assert wells[0].data[0].values['Rn'][1] == 'Undetermined'
+
+    b_rn = b_wells[0].data[0].values['Rn']
+    assert np.isnan(b_rn[1])
+    assert np.allclose(np.delete(b_rn, 1), [0.1, 0.3, 0.4])
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+def reading(w_name, rn):
+    return(rdm.Reading('Amplification Data', w_name, 'Amplification data',
+                       {'Cycle': np.arange(1, 4, dtype = float), 'Rn': np.asarray(rn, dtype = float)},
+                       {'Rn': 'a.u.'}, 'SYBR'))
+
+
+def test_readings_are_found_by_name():
+    well = new_well('A1')
+    well.data.append(reading('A1', [1, 2, 3]))
+
+    assert isinstance(well.data, rdm.Data_list)
+    assert well.data.get('Melt data') == None
+    assert np.array_equal(well.data.channel('Amplification data', 'Rn'), [1, 2, 3])
+    assert well.data.channel('Amplification data', 'ΔRn', default = 'none') == 'none'
+    assert well.data.channel('Melt data', 'Rn') == None
+
+    values, units = rdm.get_well_reading(well, 'Amplification data', 'Rn')
+    assert np.array_equal(values, [1, 2, 3]) and units == 'a.u.'
+
+
+def test_newest_reading_is_used():
+    # regression: the first reading with a repeated r_name was indexed
+    well = new_well('A1')
+    well.data.append(reading('A1', [1, 2, 3]))
+    well.data.append(reading('A1', [4, 5, 6]))      # e.g. create_readings run again
+
+    assert np.array_equal(well.data.channel('Amplification data', 'Rn'), [4, 5, 6])
+
+    well.data.reindex()
+    assert well.data.position('Amplification data') == 1
+
+    rdm.add_time([well], 'Amplification data', 'Cycle', 30, 's')
+    assert 'Time' in well.data[1].values and 'Time' not in well.data[0].values
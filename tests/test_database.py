@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+def new_database():
+    return(rdm.Database('db', '.', 'db', ['wells']))
+
+
+def test_bulk_append_skips_objects_already_in_the_list():
+    db = new_database()
+    wells = [new_well('A'+str(i)) for i in range(4)]
+
+    added, duplicates = db.bulk_append('wells', wells + wells[:2], display = False)
+
+    assert added == wells
+    assert duplicates == wells[:2]
+    assert db.elements['wells'] == wells
+
+
+def test_bulk_append_after_item_replacement():
+    # regression: a replaced object is not a duplicate anymore
+    db = new_database()
+    old, other, last = new_well('A1'), new_well('A2'), new_well('A3')
+
+    db.append_objs('wells', [old, last])
+    db.elements['wells'][0] = other
+
+    added, duplicates = db.bulk_append('wells', [old], display = False)
+
+    assert added == [old]
+    assert duplicates == []
+    assert db.elements['wells'] == [other, last, old]
+
+
+def test_bulk_append_by_attribute_key():
+    db = new_database()
+    db.bulk_append('wells', [new_well('A1')], display = False)
+
+    added, duplicates = db.bulk_append('wells', [new_well('A1'), new_well('B1')],
+                                       key = ['fname', 'wpos'], display = False)
+
+    assert [well.wpos for well in added] == ['B1']
+    assert [well.wpos for well in duplicates] == ['A1']
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import rt_data_manage as rdm
+
+
+def new_dataset(name, version):
+    d_set = rdm.Data_set(name, dict())
+    d_set.version = version
+    return(d_set)
+
+
+def new_well_set():
+    return(rdm.Well_set([], 'wset', 'plate_1', ''))
+
+
+def test_dsets_is_indexed_by_name():
+    wset = new_well_set()
+    wset.dsets = [new_dataset('Rn', 1), new_dataset('ΔRn', 1)]
+
+    assert isinstance(wset.dsets, rdm.Dset_list)
+    assert rdm.find_dataset(wset.dsets, 'ΔRn') is wset.dsets[1]
+    assert rdm.find_dataset(wset.dsets, 'Tm') == None
+
+
+def test_find_dataset_returns_the_newest_duplicate():
+    # regression: the index returned the oldest one and the list the newest one
+    wset = new_well_set()
+    wset.dsets.append(new_dataset('Rn', 1))
+    wset.dsets.append(new_dataset('Rn', 2))
+
+    assert rdm.find_dataset(wset.dsets, 'Rn').version == 2
+    assert rdm.find_dataset(list(wset.dsets), 'Rn').version == 2
+
+
+def test_dset_assignation_replaces_or_appends():
+    wset = new_well_set()
+    rdm.dset_assignation(wset, new_dataset('Rn', 1))
+    rdm.dset_assignation(wset, new_dataset('ΔRn', 1))
+    rdm.dset_assignation(wset, new_dataset('Rn', 2))
+
+    assert [(d_set.name, d_set.version) for d_set in wset.dsets] == [('Rn', 2), ('ΔRn', 1)]
+    assert wset.dsets.position('Rn') == 0
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+def wells_with_readings(n_wells = 3):
+    wells = [new_well('A'+str(i+1)) for i in range(n_wells)]
+
+    for k, well in enumerate(wells):
+        well.data.append(rdm.Reading('Amplification Data', well.wpos, 'Amplification data',
+                                     {'Cycle': np.arange(1, 21, dtype = float),
+                                      'Rn': np.linspace(1, 2, 20) + k}, {}, 'SYBR'))
+    return(wells)
+
+
+def test_time_is_computed_from_the_cycles():
+    wells = wells_with_readings()
+    rdm.add_time(wells, 'Amplification data', 'Cycle', 30, 's')
+
+    values = wells[0].data[0].values
+
+    assert np.array_equal(values['Time'], 30*np.arange(1, 21))
+    assert wells[0].data[0].units['Time'] == 's'
+    assert 'Time' in wells[0].data[0].d_types
+
+    # the time serie is shared by the plate, not stored in each well
+    assert wells[1].data[0].values['Time'] is values['Time']
+    assert 'Time' not in rdm.stored_keys(values)
+
+
+def test_derived_columns_follow_the_dict_contract():
+    # regression: derived columns were not in keys(), items() or "in"
+    wells = wells_with_readings(1)
+    rdm.add_time(wells, 'Amplification data', 'Cycle', 30, 's')
+
+    values = wells[0].data[0].values
+
+    assert 'Time' in values
+    assert list(values) == list(values.keys()) == ['Cycle', 'Rn', 'Time']
+    assert len(values) == 3
+    assert np.array_equal(dict(values.items())['Time'], values['Time'])
+    assert values.get('Temperature') == None
+
+
+def test_delta_rn_and_pickled_readings():
+    wells = wells_with_readings()
+    rdm.add_delta_rn(wells, 'Amplification data', b_start = 3, b_end = 5, display = False)
+
+    loaded = pickle.loads(pickle.dumps(wells))
+    values = loaded[2].data[0].values
+    rn = np.linspace(1, 2, 20) + 2
+
+    assert rdm.stored_keys(values) == ['Cycle', 'Rn']
+    assert np.allclose(values['ΔRn'], rn - rn[2:5].mean())
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import builtins
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well, sigmoid
+
+
+x = np.arange(1, 41, dtype = float)
+p_name = 'Amplification response region'
+
+
+def sigmoid_set(centers, tops = None):
+    if tops == None:
+        tops = [1.0]*len(centers)
+
+    wells = [new_well('A'+str(i+1)) for i in range(len(centers))]
+    series = {well: rdm.Data_serie(x, sigmoid(x, center, top = top), well)
+              for well, center, top in zip(wells, centers, tops)}
+
+    return(wells, rdm.Data_set('amplification', series))
+
+
+def test_auto_mode_is_the_accepted_interactive_mode(monkeypatch, capsys):
+    monkeypatch.setattr(builtins, 'input', lambda *args: 'y')
+    monkeypatch.setattr(plt, 'show', lambda *args, **kwargs: None)
+    monkeypatch.setattr('time.sleep', lambda *args: None)
+
+    wells, d_set = sigmoid_set([15, 24])
+    thr_limits, rr_limits = rdm.exponential_region(d_set)
+    plt.close('all')
+
+    a_wells, a_set = sigmoid_set([15, 24])
+    a_thr_limits, a_rr_limits, review = rdm.exponential_region_auto(a_set, display = False)
+
+    assert [list(map(int, rr)) for rr in a_rr_limits] == [list(map(int, rr)) for rr in rr_limits]
+    assert np.allclose(a_thr_limits, thr_limits)
+
+    for well, a_well in zip(wells, a_wells):
+        assert np.allclose(a_set.exponential[a_well].value, d_set.exponential[well].value)
+        assert np.allclose(a_set.max_signal[a_well].value, d_set.max_signal[well].value)
+
+
+def test_scores_are_floats_and_no_amplitude_wells_are_not_full_confidence():
+    # regression: ne_amplitude wells had score 1.0 and scores mixed int and float
+    wells, d_set = sigmoid_set([15, 24, 80], tops = [1.0, 1.0, 0.001])
+
+    rdm.exponential_region_auto(d_set, ne_amplitude = 0.05, display = False)
+
+    scores = [d_set.region_score[well] for well in wells]
+
+    assert all([type(score) == float for score in scores])
+    assert scores[0] > 0.9 and scores[1] > 0.9
+    assert np.isnan(scores[2])
+    assert d_set.exponential[wells[2]].value == None
+
+
+def test_stored_regions_are_used_only_if_reviewed_or_current():
+    stored = [12, 12, 14]
+
+    for properties, used in [('', False), ({'points': 15, 'provisional': True}, False),
+                             ({'points': 40}, True), ({'points': 15, 'reviewed': True}, True)]:
+
+        wells, d_set = sigmoid_set([24])
+        rdm.well_param_assignation(rdm.Parameter(p_name, '', '', stored, properties), wells[0])
+
+        thr_limits, rr_limits, review = rdm.exponential_region_auto(d_set, display = False)
+
+        assert (list(rr_limits[0]) == stored) == used
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+x = np.arange(1, 41, dtype = float)
+centers = [14, 18, 22, 26, 30, 34]
+
+
+def sigma_jobs():
+    # f_sigma(t, a, b, c) = a/(1 + exp(-(t + b)*c))
+    return([(x, rdm.f_sigma(x, 1.2, -center, 0.6), rdm.f_sigma, [1, -20, 0.5])
+            for center in centers])
+
+
+def test_same_fits_in_one_or_several_processes():
+    params, covs, R2, success = rdm.fit_jobs(sigma_jobs(), processes = 1)
+    p_params, p_covs, p_R2, p_success = rdm.fit_jobs(sigma_jobs(), processes = 2)
+
+    assert params.shape == (6, 3) and len(covs) == 6
+    assert success.all() and p_success.all()
+    assert np.allclose(params, [[1.2, -center, 0.6] for center in centers], atol = 1e-4)
+    assert np.allclose(params, p_params, atol = 1e-6)
+    assert np.allclose(R2, 1) and np.allclose(p_R2, 1)
+
+
+def test_failed_fits_do_not_stop_the_others():
+    jobs = sigma_jobs()
+    jobs[2] = (x, np.full(len(x), np.nan), rdm.f_sigma, [1, -20, 0.5])
+    bounds = ([0, -50, 0], [5, 0, 5])
+    jobs = [job + (bounds,) for job in jobs]
+
+    for warm_start in [True, False]:
+        params, covs, R2, success = rdm.fit_jobs(jobs, processes = 1, warm_start = warm_start)
+
+        assert list(success) == [True, True, False, True, True, True]
+        assert np.isnan(params[2]).all() and np.isnan(covs[2]).all() and np.isnan(R2[2])
+        assert np.allclose(params[3], [1.2, -26, 0.6], atol = 1e-4)
+
+
+def test_fit_series_parallel(capsys):
+    wells = [new_well('A'+str(i+1)) for i in range(len(centers))]
+    series = {well: rdm.Data_serie(x, rdm.f_sigma(x, 1.2, -center, 0.6), well)
+              for well, center in zip(wells, centers)}
+    d_set = rdm.Data_set('dset', series)
+
+    fits = rdm.fit_series_parallel(d_set, processes = 2)
+
+    assert list(fits.keys()) == wells
+    params, cov, R2, success = fits[wells[-1]]
+    assert success and np.allclose(params, [1.2, -34, 0.6], atol = 1e-4)
+    assert '6 series were fitted. 0 fittings failed' in capsys.readouterr().out
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+@pytest.fixture(autouse = True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(rdm, 'ingest_cache', dict())
+
+
+def write_export(path, rn = 0.1):
+    path.write_text("Well,Well Position,Cycle,Rn\n"
+                    "1,A1,1,{0}\n1,A1,2,{1}\n2,A2,1,1.1\n2,A2,2,1.2\n".format(rn, 2*rn))
+    return(str(path))
+
+
+def load(filename, cache_folder = None):
+    return(rdm.load_readings_cached(filename, None, 'Well Position', ['Cycle', 'Rn'],
+                                    'Amplification data', 'SYBR', cache_folder = cache_folder))
+
+
+def test_unchanged_export_is_parsed_once(tmp_path, capsys):
+    filename = write_export(tmp_path / 'plate.csv')
+
+    readings = load(filename)
+    readings[0].values['Rn'][0] = -1     # the cached values are not modified
+    c_readings = load(filename)
+
+    out = capsys.readouterr().out
+    assert 'was parsed' in out and 'memory cache' in out
+    assert [reading.well for reading in c_readings] == ['A1', 'A2']
+    assert np.array_equal(c_readings[0].values['Rn'], [0.1, 0.2])
+
+
+def test_modified_export_is_parsed_again(tmp_path, capsys):
+    path = tmp_path / 'plate.csv'
+    load(write_export(path))
+    readings = load(write_export(path, rn = 0.3))
+
+    assert capsys.readouterr().out.count('was parsed') == 2
+    assert np.allclose(readings[0].values['Rn'], [0.3, 0.6])
+
+
+def test_cache_folder_is_used_in_other_sessions(tmp_path, monkeypatch, capsys):
+    filename = write_export(tmp_path / 'plate.csv')
+    load(filename, cache_folder = str(tmp_path / 'cache'))
+
+    monkeypatch.setattr(rdm, 'ingest_cache', dict())   # a new session
+    readings = load(filename, cache_folder = str(tmp_path / 'cache'))
+
+    assert 'cache folder' in capsys.readouterr().out
+
+    wells = [new_well('A1'), new_well('A2')]
+    rdm.assign_readings(wells, readings, display = False)
+
+    assert np.array_equal(wells[1].data.channel('Amplification data', 'Rn'), [1.1, 1.2])
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+
+def write_plate(folder, fname, offset):
+    rows = ["Well,Well Position,Cycle,Rn"]
+
+    for k, w_name in enumerate(['A1', 'A2', 'B1']):
+        for cycle in range(1, 4):
+            rows.append(','.join([str(k+1), w_name, str(cycle), str(offset + k + 0.1*cycle)]))
+
+    (folder / (fname + '.csv')).write_text('\n'.join(rows) + '\n')
+
+
+def plate_values(wsets):
+    return([(wset.name, [(well.fname, well.wpos, list(well.data[0].values['Rn']))
+                         for well in wset.wells]) for wset in wsets])
+
+
+def test_load_plate_with_setup_file(tmp_path):
+    write_plate(tmp_path, 'plate_1', 0)
+    setup = tmp_path / 'setup.csv'
+    setup.write_text("Well,Well Position,Sample Name,Target Name,Task\n"
+                     "1,A1,S1,N gene,UNKNOWN\n2,A2,NTC,N gene,NTC\n")
+
+    wset = rdm.load_plate(str(tmp_path / 'plate_1.csv'), None, 'Well Position', ['Cycle', 'Rn'],
+                          'Amplification data', 'SYBR', setup_sheet = str(setup),
+                          attr_headers = {'s_name': 'Sample Name', 'target': 'Target Name',
+                                          'task': 'Task'})
+
+    assert wset.name == 'plate_1'
+    assert [well.wpos for well in wset.wells] == ['A1', 'A2', 'B1']
+    assert [well.s_name for well in wset.wells] == ['S1', 'NTC', None]
+    assert wset.wells[1].task == 'NTC'
+    assert np.allclose(wset.wells[2].data[0].values['Rn'], [2.1, 2.2, 2.3])
+
+
+def test_parallel_load_plates_is_the_same_as_one_by_one(tmp_path):
+    for i in range(3):
+        write_plate(tmp_path, 'plate_'+str(i+1), 10*i)
+
+    args = (str(tmp_path), None, 'Well Position', ['Cycle', 'Rn'], 'Amplification data', 'SYBR')
+
+    wsets = rdm.load_plates(*args, f_type = '.csv', processes = 1, display = False)
+    p_wsets = rdm.load_plates(*args, f_type = '.csv', processes = 2, display = False)
+
+    assert [wset.name for wset in wsets] == ['plate_1', 'plate_2', 'plate_3']
+    assert plate_values(p_wsets) == plate_values(wsets)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+def melt_sheets(w_names, n_temps = 5, footer = False):
+    sheets = dict()
+
+    for s, s_name in enumerate(['Melt Curve Raw', 'Melt Derivative']):
+        rows = [['Block', None] + [None]*n_temps, ['Well', 'Well Position'] + [None]*n_temps]
+
+        for k, w_name in enumerate(w_names):
+            rows.append([k+1, w_name] + [0.5*t + k + s for t in range(n_temps)])
+
+        if footer == True:
+            rows.append(['Analysis Type', 'note'] + ['text']*n_temps)
+
+        sheets[s_name] = pd.DataFrame(rows)
+
+    return(sheets)
+
+
+def create_both(sheets):
+    args = (['Melt Curve Raw', 'Melt Derivative'], 'Well Position', 2,
+            ['Fluorescence', 'Derivative'], 'Melting data', 'SYBR')
+
+    wells = [new_well(w_name) for w_name in ['A1', 'A2']]
+    i_wells = [new_well(w_name) for w_name in ['A1', 'A2']]
+
+    rdm.melting_readings(wells, sheets, *args, display = False)
+    rdm.melting_readings_indexed(i_wells, sheets, *args, display = False)
+
+    return(wells, i_wells)
+
+
+def test_indexed_melting_readings_are_the_same_as_melting_readings():
+    wells, i_wells = create_both(melt_sheets(['A1', 'A2']))
+
+    for well, i_well in zip(wells, i_wells):
+        for d_name in ['Fluorescence', 'Derivative']:
+            assert np.array_equal(i_well.data[0].values[d_name],
+                                  np.array(well.data[0].values[d_name], dtype = float))
+
+
+def test_indexed_melting_readings_with_footer_text_rows():
+    # regression: text cells in the data columns raised ValueError
+    wells, i_wells = create_both(melt_sheets(['A1', 'A2'], footer = True))
+
+    assert np.allclose(i_wells[1].data[0].values['Derivative'], [2, 2.5, 3, 3.5, 4])
+
+
+def test_find_header_gives_the_last_header_cell():
+    sheet = pd.DataFrame([['Well', 1], [2, 'Well'], [3, 4]])
+
+    assert rdm.find_header(sheet, 'Well') == [1, 1]
+    assert rdm.find_header(sheet, 'Sample') == None
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import json
+
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.test_plate_store import wells_with_readings
+
+
+def saved_store(tmp_path):
+    wells = wells_with_readings()
+    wells[1].s_name = np.nan     # empty sample name cell
+    store = rdm.create_plate_store(wells, 'Amplification data', display = False)
+    filename = str(tmp_path / 'plate_1.rtp')
+    rdm.save_plate_binary(store, filename)
+    return(store, filename)
+
+
+def test_header_is_strict_json(tmp_path):
+    store, filename = saved_store(tmp_path)
+
+    with open(filename, 'rb') as f:
+        assert f.read(8) == rdm.plate_magic
+        h_len = int(np.frombuffer(f.read(8), dtype = '<u8')[0])
+        header = json.loads(f.read(h_len), parse_constant = lambda c: 1/0)
+
+    assert (16 + h_len) % rdm.plate_align == 0
+    assert header['wells'][1]['s_name'] is None
+    assert header['lengths'] == [20, 20, 15]
+    assert [c_info['name'] for c_info in header['channels']] == ['Cycle', 'Rn']
+
+
+def test_round_trip(tmp_path):
+    store, filename = saved_store(tmp_path)
+
+    for mmap in [True, False]:
+        l_store = rdm.load_plate_binary(filename, mmap = mmap)
+
+        assert isinstance(l_store.data['Rn'], np.memmap) == mmap
+        assert l_store.wpos == store.wpos
+        assert np.array_equal(l_store.data['Rn'], store.data['Rn'], equal_nan = True)
+        assert l_store.units['Rn'] == 'a.u.'
+
+
+def test_wells_from_store(tmp_path):
+    store, filename = saved_store(tmp_path)
+    wells = rdm.wells_from_store(rdm.load_plate_binary(filename), signal_name = 'SYBR')
+
+    assert [well.wpos for well in wells] == ['A1', 'A2', 'A3']
+    assert wells[0].s_name == 'sample' and wells[1].s_name is None
+    assert wells[2].data[0].r_name == 'Amplification data'
+    assert np.array_equal(wells[2].data[0].values['Rn'], store.values('A3', 'Rn'))
+
+
+def test_not_a_plate_file(tmp_path, capsys):
+    filename = tmp_path / 'other.rtp'
+    filename.write_bytes(b'0123456789abcdef')
+
+    assert rdm.load_plate_binary(str(filename)) == None
+    assert 'is not a plate binary file' in capsys.readouterr().out
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+def wells_with_readings(lengths = (20, 20, 15)):
+    wells = [new_well('A'+str(i+1)) for i in range(len(lengths))]
+
+    for k, (well, n) in enumerate(zip(wells, lengths)):
+        well.data.append(rdm.Reading('Amplification Data', well.wpos, 'Amplification data',
+                                     {'Cycle': np.arange(1, n+1, dtype = float),
+                                      'Rn': np.linspace(1, 2, n) + k},
+                                     {'Cycle': '', 'Rn': 'a.u.'}, 'SYBR'))
+    return(wells)
+
+
+def test_readings_are_bound_to_the_store_rows():
+    wells = wells_with_readings()
+    store = rdm.create_plate_store(wells, 'Amplification data', display = False)
+
+    assert store.wpos == ['A1', 'A2', 'A3']
+    assert store.data['Rn'].shape == (3, 20)
+    assert list(store.lengths) == [20, 20, 15]
+    assert np.isnan(store.data['Rn'][2, 15:]).all()
+    assert store.units['Rn'] == 'a.u.'
+
+    values = wells[2].data[0].values['Rn']
+    assert store.is_view('Rn', values)
+    assert len(values) == 15
+    assert np.array_equal(values, np.linspace(1, 2, 15) + 2)
+    assert np.array_equal(store.values('A2', 'Cycle'), np.arange(1, 21))
+
+    # whole plate operations see the well values
+    store.data['Rn'][0] *= 2
+    assert wells[0].data[0].values['Rn'][-1] == 4
+
+
+def test_unbound_store_copies_the_values():
+    wells = wells_with_readings()
+    store = rdm.create_plate_store(wells, 'Amplification data', bind = False, display = False)
+
+    assert not store.is_view('Rn', wells[0].data[0].values['Rn'])
+    assert np.array_equal(store.views(1)['Rn'], wells[1].data[0].values['Rn'])
+
+
+def test_pickled_wells_share_the_store():
+    wells = wells_with_readings()
+    store = rdm.create_plate_store(wells, 'Amplification data', display = False)
+
+    l_wells = pickle.loads(pickle.dumps(wells))
+    l_store = l_wells[0].data[0].values.store
+
+    assert l_store is not store
+    for well in l_wells:
+        assert well.data[0].values.store is l_store
+        assert l_store.is_view('Rn', well.data[0].values['Rn'])
+    assert np.array_equal(l_wells[2].data[0].values['Rn'], store.values('A3', 'Rn'))
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+import rt_data_manage as rdm
+
+from tests.conftest import sigmoid
+
+
+def series_matrix():
+    x = np.arange(1, 41, dtype = float)
+    rng = np.random.default_rng(0)
+
+    Y = [sigmoid(x, center) + rng.normal(0, 0.002, len(x)) for center in [12, 18, 25, 33]]
+    Y.append(np.zeros(len(x)))              # flat serie (ties everywhere)
+    Y.append(sigmoid(x, 38))                # response at the end of the serie
+    Y.append(np.r_[0, 1, 0, 1, 0, 1, 0, 0, 1, 0].repeat(4).astype(float))   # repeated ddy values
+    return(x, np.vstack(Y))
+
+
+@pytest.mark.parametrize('derivative', ['forward', 'central', 'backward', 'other'])
+def test_same_points_as_serie_by_serie(derivative):
+    x, Y = series_matrix()
+
+    P1, P2, P3 = rdm.response_region_matrix(x, Y, derivative)
+
+    for i, y in enumerate(Y):
+        ddx, ddy, delay = rdm.second_derivative(x, y, derivative)
+        assert (P1[i], P2[i], P3[i]) == rdm.response_region_points(ddy, delay, len(y))
+
+
+def test_response_region_of_a_sigmoid():
+    x = np.arange(1, 41, dtype = float)
+    P1, P2, P3 = rdm.response_region_matrix(x, sigmoid(x, 20))
+
+    # exponential region before the inflection point, plateau after it
+    assert P1[0] < 19 < P2[0] < P3[0] < 40
+    assert P3[0] == P2[0] + 2
+
+
+def test_single_serie():
+    x, Y = series_matrix()
+    P1, P2, P3 = rdm.response_region_matrix(x, Y[0])
+
+    assert P1.shape == (1,)
+    assert P3[0] <= len(x) - 1
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well, sigmoid
+
+
+x = np.arange(1, 41, dtype = float)
+p_name = 'Amplification response region'
+
+
+def export_up_to(n_cycles, w_names = ('A1', 'A2')):
+    return([rdm.Reading('Amplification Data', w_name, 'Amplification data',
+                        {'Cycle': x[:n_cycles], 'ΔRn': sigmoid(x, 12 + 8*k)[:n_cycles]},
+                        {}, 'SYBR') for k, w_name in enumerate(w_names)])
+
+
+def test_extend_readings_appends_only_the_new_cycles():
+    wells = [new_well('A1'), new_well('A2')]
+
+    rdm.extend_readings(wells, export_up_to(10), display = False)
+    updated = rdm.extend_readings(wells, export_up_to(15), display = False)
+    again = rdm.extend_readings(wells, export_up_to(15), display = False)
+
+    assert updated == wells and again == []
+    assert np.array_equal(wells[0].data[0].values['Cycle'], x[:15])
+    assert np.allclose(wells[1].data[0].values['ΔRn'], sigmoid(x, 20)[:15])
+
+
+def test_extend_readings_keeps_store_bound_readings_bound():
+    # regression: extended readings were not views of the plate store anymore
+    wells = [new_well('A1'), new_well('A2')]
+    rdm.extend_readings(wells, export_up_to(3), display = False)
+    store = rdm.create_plate_store(wells, 'Amplification data', display = False)
+
+    rdm.extend_readings(wells, export_up_to(5), display = False)
+
+    assert store.data['ΔRn'].shape == (2, 5)
+    assert list(store.lengths) == [5, 5]
+
+    for well in wells:
+        values = well.data[0].values
+
+        assert len(values['ΔRn']) == 5
+        assert store.is_view('ΔRn', values['ΔRn']) and store.is_view('Cycle', values['Cycle'])
+
+
+def test_running_regions_are_provisional():
+    # regression: a region of a partial run was reused after the run ended
+    wells = [new_well('A1'), new_well('A2')]
+    rdm.extend_readings(wells, export_up_to(15), display = False)
+
+    Cts = rdm.update_running_wells(wells, 'Amplification data', 'Cycle', 'ΔRn', 0.2,
+                                   display = False)
+
+    assert np.isclose(Cts[wells[0]], rdm.crossing_time(x[:15], sigmoid(x, 12)[:15], 0.2))
+    assert Cts[wells[1]] == None
+    assert wells[0].analysis.get(p_name) == None
+    assert wells[0].analysis.get('Running response region').properties == {'points': 15,
+                                                                           'provisional': True}
+
+    rdm.extend_readings(wells, export_up_to(40), display = False)
+    d_set = rdm.Data_set('final', {well: rdm.Data_serie(x, well.data[0].values['ΔRn'], well)
+                                   for well in wells})
+
+    thr_limits, rr_limits, review = rdm.exponential_region_auto(d_set, display = False)
+    ddx, ddy, delay = rdm.second_derivative(x, sigmoid(x, 12))
+
+    assert list(rr_limits[0]) == list(rdm.response_region_points(ddy, delay, len(x)))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+
+
+@pytest.fixture
+def wells():
+    wells = list()
+    for i, (target, conc, enzyme) in enumerate([('N gene', 0.1, 'Bst'), ('N gene', 10, 'Bsm'),
+                                                 ('S gene', 1, 'Bst'), ('N gene', 'n.a.', None)]):
+        well = new_well('A'+str(i+1), s_name = 'S'+str(i+1), target = target)
+        well.conc = conc
+
+        if enzyme != None:
+            well.caths.append(rdm.Well_cath('Enzymes', enzyme))
+        wells.append(well)
+    return(wells)
+
+
+def wpos(wells):
+    return([well.wpos for well in wells])
+
+
+def test_conditions_are_joined(wells):
+    conditions = [('target', '==', 'N gene'), ('Enzymes', 'cath', 'Bst')]
+
+    assert wpos(rdm.select_query(wells, conditions, display = False)) == ['A1']
+    assert wpos(rdm.select_query(wells, conditions, logic = 'or', display = False)) == \
+        ['A1', 'A2', 'A3', 'A4']
+    assert list(rdm.select_query(wells, conditions, mask = True, display = False)) == \
+        [True, False, False, False]
+
+
+@pytest.mark.parametrize('condition, selected', [
+    (('target', '!=', 'N gene'), ['A3']),
+    (('target', 'in', 'S'), ['A3']),
+    (('s_name', 'not in', ['1', '2']), ['A3', 'A4']),
+    (('conc', 'range', [0.5, None]), ['A2', 'A3']),
+    (('conc', '<', 5), ['A1', 'A3']),
+    (('Enzymes', 'cath', ['Bst', 'Bsm']), ['A1', 'A2', 'A3']),
+    (('missing', '==', None), ['A1', 'A2', 'A3', 'A4']),
+])
+def test_operators(wells, condition, selected):
+    assert wpos(rdm.select_query(wells, [condition], display = False)) == selected
+
+
+def test_compiled_query_is_reused(wells, capsys):
+    query = rdm.compile_query(('conc', '>=', 1))
+
+    assert query.att_names == ['conc']
+    assert wpos(rdm.select_query(wells, query)) == ['A2', 'A3']
+    assert wpos(rdm.select_query(wells[2:], query)) == ['A3']
+    assert '2 objects were selected' in capsys.readouterr().out
+
+    # same selection as the one attribute select_objects
+    assert rdm.select_objects(wells, 'target', 'S') == \
+        rdm.select_query(wells, [('target', 'in', 'S')], display = False)
+
+
+def test_wrong_arguments():
+    with pytest.raises(ValueError):
+        rdm.compile_query([('target', '~', 'N')])
+
+    with pytest.raises(ValueError):
+        rdm.compile_query([('target', '==', 'N')], logic = 'xor')
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import builtins
+import pickle
+import time
+
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.test_plate_store import wells_with_readings
+
+
+def shared_dataset(monkeypatch, lengths = (20, 20, 20)):
+    # data 0 (Amplification data), x 0 (Cycle), y 1 (Rn)
+    answers = iter(['0', '0', '1'])
+    monkeypatch.setattr(builtins, 'input', lambda text: next(answers))
+    monkeypatch.setattr(time, 'sleep', lambda t: None)
+
+    wset = rdm.Well_set(wells_with_readings(lengths), 'set', 'plate_1', '')
+    return(wset, rdm.create_dataset(wset, append = False, shared_x = True))
+
+
+def test_series_share_x_and_y_matrix(monkeypatch):
+    wset, dset = shared_dataset(monkeypatch)
+    series = dset.series
+
+    assert isinstance(series, rdm.Series_matrix)
+    assert series.Y.shape == (3, 20)
+    assert all(series.is_view(well) for well in wset.wells)
+    assert series[wset.wells[2]].x is series.x
+    assert np.array_equal(series[wset.wells[2]].y, np.linspace(1, 2, 20) + 2)
+    assert np.array_equal(series.rows([wset.wells[1]]), series.Y[[1]])
+    assert series.max_y() == 4
+
+
+def test_different_x_values_are_not_shared(monkeypatch):
+    wset, dset = shared_dataset(monkeypatch, lengths = (20, 20, 15))
+
+    assert not isinstance(dset.series, rdm.Series_matrix)
+    assert len(dset.series[wset.wells[2]].y) == 15
+
+
+def test_pickle_keeps_the_views(monkeypatch):
+    wset, dset = shared_dataset(monkeypatch)
+    dset.series[wset.wells[0]] = rdm.Data_serie([1, 2], [5, 6], wset.wells[0])
+
+    l_series = pickle.loads(pickle.dumps(dset.series))
+    l_wells = list(l_series.keys())
+
+    assert not l_series.is_view(l_wells[0])
+    assert l_series.is_view(l_wells[1]) and l_series[l_wells[1]].well is l_wells[1]
+    assert np.array_equal(l_series[l_wells[2]].y, dset.series.Y[2])
+    assert l_series.max_y() == 6
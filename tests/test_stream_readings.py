@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+
+amplification_csv = (
+    "Block Type,96-Well Block\n"
+    "\n"
+    "Well,Well Position,Cycle,Rn\n"
+    "1,A1,1,0.1\n"
+    "1,A1,2,0.2\n"
+    "2,A2,1,1.1\n"
+    "2,A2,2\n"
+    "\n"
+    "Analysis Type,Singleplex\n")
+
+
+def write(tmp_path, filename, text):
+    path = tmp_path / filename
+    path.write_text(text)
+    return(str(path))
+
+
+def test_stream_readings_of_an_export_with_footer(tmp_path):
+    # regression: the blank row and the footer block raised IndexError
+    filename = write(tmp_path, 'plate.csv', amplification_csv)
+
+    readings = list(rdm.stream_readings(filename, None, 'Well Position', ['Cycle', 'Rn'],
+                                        'Amplification data', 'SYBR'))
+
+    assert [reading.well for reading in readings] == ['A1', 'A2']
+    assert np.array_equal(readings[0].values['Rn'], [0.1, 0.2])
+    assert np.array_equal(readings[1].values['Cycle'], [1, 2])
+    assert readings[1].values['Rn'][0] == 1.1 and np.isnan(readings[1].values['Rn'][1])
+
+
+def test_stream_readings_of_selected_wells_in_small_chunks(tmp_path):
+    filename = write(tmp_path, 'plate.csv', amplification_csv)
+
+    readings = list(rdm.stream_readings(filename, None, 'Well Position', ['Rn'],
+                                        'Amplification data', 'SYBR', well_names = ['A2'],
+                                        chunk_size = 2))
+
+    assert [reading.well for reading in readings] == ['A2']
+
+
+def test_stream_melting_readings(tmp_path):
+    raw = write(tmp_path, 'raw.csv', "Well,Well Position,T1,T2\n1,A1,1,2\n2,A2,3,4\n\n")
+    der = write(tmp_path, 'der.csv', "Well,Well Position,T1,T2\n1,A1,5,6\n2,A2,7,8\n")
+
+    readings = list(rdm.stream_melting_readings(raw, [raw, der], 'Well Position', 2,
+                                                ['Fluorescence', 'Derivative'],
+                                                'Melting data', 'SYBR'))
+
+    assert [reading.well for reading in readings] == ['A1', 'A2']
+    assert np.array_equal(readings[1].values['Fluorescence'], [3, 4])
+    assert np.array_equal(readings[1].values['Derivative'], [7, 8])
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well, sigmoid
+
+
+x = np.arange(1, 41, dtype = float)
+
+
+def sigmoid_set(centers):
+    wells = [new_well('A'+str(i+1)) for i in range(len(centers))]
+    series = {well: rdm.Data_serie(x, sigmoid(x, center), well)
+              for well, center in zip(wells, centers)}
+
+    return(wells, rdm.Data_set('amplification', series))
+
+
+def exp_parameter(value):
+    return(rdm.Parameter(['a', 'b', 'N'], '', '', value))
+
+
+def test_crossing_matrix_is_crossing_time_of_each_row():
+    Y = np.vstack([sigmoid(x, center) for center in [12, 25, 80, 1]])
+
+    Xt = rdm.crossing_matrix(x, Y, 0.2)
+    expected = [rdm.crossing_time(x, y, 0.2) for y in Y]
+
+    assert np.allclose(Xt[[0, 1, 3]], [expected[i] for i in [0, 1, 3]])
+    assert np.isnan(Xt[2]) and expected[2] == None
+
+
+def test_crossing_matrix_ignores_padding():
+    Y = np.array([[0.0, 0.1, 0.5, 0.0], [0.0, 0.1, 0.3, 0.9]])
+
+    Xt = rdm.crossing_matrix(np.arange(4.0), Y, 0.4, lengths = [2, 4])
+
+    assert np.isnan(Xt[0])
+    assert np.isclose(Xt[1], 2 + 0.1/0.6)
+
+
+def test_raw_threshold_times_of_list_and_matrix_series():
+    wells, d_set = sigmoid_set([12, 18, 80])
+    m_set = rdm.Data_set('matrix', rdm.Series_matrix(x, np.vstack(
+        [d_set.series[well].y for well in wells]), wells))
+
+    keys, Cts = rdm.threshold_times(0.2, d_set)
+    m_keys, m_Cts = rdm.threshold_times(0.2, m_set)
+
+    assert keys == wells and m_keys == wells
+    assert np.allclose(Cts, m_Cts, equal_nan = True)
+    assert np.isclose(Cts[0], rdm.crossing_time(x, d_set.series[wells[0]].y, 0.2))
+    assert np.isnan(Cts[2])
+
+
+def test_fitted_threshold_times_use_the_inverse():
+    wells, d_set = sigmoid_set([12, 18])
+    d_set.exponential = {wells[0]: exp_parameter([0.25, -3.0, 1.0]),
+                         wells[1]: exp_parameter(None)}
+
+    keys, Cts = rdm.threshold_times(0.2, d_set)
+
+    assert np.isclose(Cts[0], rdm.f_10exp_lineal(0.2, [0.25, -3.0, 1.0], inverse = True))
+    assert np.isclose(Cts[1], rdm.crossing_time(x, d_set.series[wells[1]].y, 0.2))
+
+
+def test_fits_which_cannot_cross_are_nan():
+    # regression: flat (NTC) and out of range fits gave inf or a value after the run
+    wells, d_set = sigmoid_set([80, 80, 12])
+    d_set.exponential = {wells[0]: exp_parameter([0.0, -2.0, 1.0]),
+                         wells[1]: exp_parameter([0.01, -2.0, 1.0]),
+                         wells[2]: exp_parameter([0.25, -3.0, 1.0])}
+
+    keys, Cts = rdm.threshold_times(0.2, d_set, assign = True)
+
+    assert np.isnan(Cts[0]) and np.isnan(Cts[1])
+    assert np.isfinite(Cts[2])
+    assert rdm.get_well_param(wells[0], 'Ct') == None
+    assert np.isclose(rdm.get_well_param(wells[2], 'Ct'), Cts[2])
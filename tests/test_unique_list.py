@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import rt_data_manage as rdm
+
+
+def test_order_of_appearance_and_inverse():
+    a_list = ['b', 'a', 'b', np.nan, float('nan'), [1, 2], [1, 2], np.array([1, 2]),
+              np.array([1, 2]), 'a']
+
+    nr_elements, inverse = rdm.unique_list(a_list, return_inverse = True)
+
+    assert nr_elements[:2] == ['b', 'a']
+    assert np.isnan(nr_elements[2])
+    assert nr_elements[3] == [1, 2]
+    assert np.array_equal(nr_elements[4], [1, 2]) and len(nr_elements) == 5
+    assert list(inverse) == [0, 1, 0, 2, 2, 3, 3, 4, 4, 1]
+    assert all(rdm.unique_key(nr_elements[i]) == rdm.unique_key(element)
+               for element, i in zip(a_list, inverse))
+
+
+def test_numeric_arrays_give_the_same_result():
+    values = np.array([3.0, 1.0, 3.0, np.nan, 2.0, 1.0, np.nan])
+
+    nr_elements, inverse = rdm.unique_list(values, return_inverse = True)
+    l_elements, l_inverse = rdm.unique_list(list(values), return_inverse = True)
+
+    assert nr_elements[:2] == [3.0, 1.0] and nr_elements[3] == 2.0
+    assert np.isnan(nr_elements[2])
+    assert np.array_equal(inverse, l_inverse)
+    assert np.array_equal(inverse, [0, 1, 0, 2, 3, 1, 2])
+
+
+def test_group_values():
+    inverse = rdm.unique_list(['x', 'y', 'x', 'z', 'y'], return_inverse = True)[1]
+    groups = rdm.group_values([10, 20, 30, 40, 50], inverse, 3)
+
+    assert [list(group) for group in groups] == [[10, 30], [20, 50], [40]]
+
+    # empty groups are kept
+    groups = rdm.group_values([1, 2], [0, 2], 4)
+    assert [len(group) for group in groups] == [1, 0, 1, 0]
+
+
+def test_nr_list(capsys):
+    assert rdm.nr_list(['S1', 'S2', 'S1']) == ['S1', 'S2']
+    assert "1: 'S2'" in capsys.readouterr().out
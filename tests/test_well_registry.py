@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import numpy as np
+
+import rt_data_manage as rdm
+
+from tests.conftest import new_well
+from tests.test_database import new_database
+
+
+def test_same_key_same_id():
+    registry = rdm.Well_registry()
+    wells = [new_well('A1'), new_well('A2'), new_well('A1', fname = 'plate_2')]
+
+    assert list(registry.register_wells(wells)) == [0, 1, 2]
+    assert registry.register(new_well('A2')) == 1       # another object, same key
+    assert len(registry) == 3
+    assert registry.keys[2] == ('plate_2', 'A1', 'SYBR')
+
+    assert registry.get_id(new_well('B1')) == None
+    assert list(registry.get_ids([new_well('B1'), wells[2]])) == [-1, 2]
+    assert len(registry) == 3
+
+    l_registry = pickle.loads(pickle.dumps(registry))
+    assert l_registry.get_id(new_well('A1', fname = 'plate_2')) == 2
+
+
+def test_key_attributes():
+    registry = rdm.Well_registry(key_attrs = ['wpos'])
+
+    assert registry.register(new_well('A1')) == registry.register(new_well('A1', fname = 'p2'))
+
+
+def test_dedupe_and_join():
+    registry = rdm.Well_registry()
+    plate_a = [new_well('A1'), new_well('A2'), new_well('A3')]
+    plate_b = [new_well('A3'), new_well('A1'), new_well('B1')]
+
+    unique_wells, duplicates = registry.dedupe(plate_a + plate_b)
+    assert unique_wells == plate_a + plate_b[2:]
+    assert duplicates == plate_b[:2]
+
+    pairs = registry.join(plate_a, plate_b)
+    assert pairs == [(plate_a[0], plate_b[1]), (plate_a[2], plate_b[0])]
+
+
+def test_database_bulk_append_by_registry():
+    db = new_database()
+    registry = rdm.Well_registry()
+    db.bulk_append('wells', [new_well('A1'), new_well('A2')], key = registry.register,
+                   display = False)
+
+    added, duplicates = db.bulk_append('wells', [new_well('A2'), new_well('A3')],
+                                       key = registry.register, display = False)
+
+    assert [well.wpos for well in added] == ['A3']
+    assert [well.wpos for well in duplicates] == ['A2']
+    assert np.array_equal(registry.get_ids(db.elements['wells']), [0, 1, 2])
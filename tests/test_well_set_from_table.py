@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+import rt_data_manage as rdm
+
+
+def long_table():
+    rows = list()
+    for w_name, s_name, enzyme, n in [('A1', 'S1', 'E1', 4), ('A2', 'S2', 'E2', 4),
+                                      ('B1', np.nan, 'E1', 3)]:
+        for cycle in range(1, n+1):
+            rows.append({'Well Position': w_name, 'Sample Name': s_name, 'Target Name': 'T',
+                         'Reporter': 'SYBR', 'Enzyme': enzyme, 'Cycle': cycle,
+                         'Rn': 0.1*cycle + (w_name == 'A2')})
+    return(pd.DataFrame(rows))
+
+
+def test_wells_and_readings():
+    wset = rdm.well_set_from_table(long_table(), 'set', fname = 'plate_1', cath_cols = ['Enzyme'],
+                                   units = {'Rn': 'a.u.'}, display = False)
+
+    assert [well.wpos for well in wset.wells] == ['A1', 'A2', 'B1']
+    assert wset.wells[0].s_name == 'S1' and wset.wells[0].exp == 'plate_1'
+    assert wset.wells[1].target == 'T' and wset.wells[1].reporter == 'SYBR'
+
+    reading = wset.wells[2].data[0]
+    assert reading.r_name == 'Amplification data'
+    assert reading.units['Rn'] == 'a.u.'
+    assert set(rdm.stored_keys(reading.values)) == {'Cycle', 'Rn'}
+    assert np.allclose(reading.values['Rn'], [0.1, 0.2, 0.3])
+    assert np.allclose(wset.wells[1].data[0].values['Rn'], 1 + 0.1*np.arange(1, 5))
+
+    assert wset.store.is_view('Rn', reading.values['Rn'])
+
+
+def test_classifications_are_indexed():
+    wset = rdm.well_set_from_table(long_table(), 'set', cath_cols = ['Enzyme'], display = False)
+
+    assert [clf.name for clf in wset.clfs] == ['Enzyme']
+    assert [well.wpos for well in wset.select('Enzyme', 'E1')] == ['A1', 'B1']
+    assert [cath.value for cath in wset.wells[1].caths] == ['E2']
+
+
+def test_same_readings_as_without_store():
+    table = long_table()
+    wset = rdm.well_set_from_table(table, 'set', display = False)
+    c_wset = rdm.well_set_from_table(table, 'set', store = False, display = False)
+
+    assert getattr(c_wset, 'store', None) is None
+    for well, c_well in zip(wset.wells, c_wset.wells):
+        assert np.array_equal(well.data[0].values['Rn'], c_well.data[0].values['Rn'])
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import rt_data_manage as rdm
+
+
+def new_well_set(wells):
+    wset = rdm.Well_set(wells, 'wset', 'plate_1', '')
+    rdm.create_classification(wset, wells, [i % 3 for i in range(len(wells))], 'grp',
+                              display = False)
+    return(wset)
+
+
+def wpos(wells):
+    return([well.wpos for well in wells])
+
+
+def test_select_matches_select_wells_cath(wells):
+    wset = new_well_set(wells)
+
+    assert wpos(wset.select('grp', 1)) == ['A2', 'A5', 'A8', 'A11']
+    assert wset.select('grp', [0, 2]) == rdm.select_wells_cath(wells, 'grp', [0, 2])
+
+
+def test_classification_updates_the_index_instead_of_rebuild_it(wells):
+    wset = new_well_set(wells)
+    index = wset.caths_index()
+
+    rdm.create_classification(wset, wells, ['x']*4 + ['y']*8, 'half', display = False)
+
+    assert wset.caths_index() is index
+    assert wpos(wset.select('half', 'x')) == ['A1', 'A2', 'A3', 'A4']
+
+
+def test_select_after_a_cath_is_replaced_by_hand(wells):
+    # regression: same number of wells and caths, but other cath object
+    wset = new_well_set(wells)
+    wset.caths_index()
+
+    wells[0].caths[0] = rdm.Well_cath('grp', 1)
+
+    assert wset.select('grp', 1) == rdm.select_wells_cath(wells, 'grp', 1)
+    assert wpos(wset.select('grp', 1)) == ['A1', 'A2', 'A5', 'A8', 'A11']
+
+
+def test_assign_caths_to_wells_updates_the_index(wells):
+    wset = new_well_set(wells)
+    index = wset.caths_index()
+
+    rdm.assign_caths_to_wells([rdm.Well_cath('ctrl', 'NTC')]*2, wells[:2], well_set = wset)
+
+    assert wset.caths_index() is index
+    assert wpos(wset.select('ctrl', 'NTC')) == ['A1', 'A2']
+
+
+def test_remove_clf_removes_its_caths_from_the_index(wells):
+    wset = new_well_set(wells)
+    rdm.create_classification(wset, wells, ['x']*12, 'all', display = False)
+
+    wset.remove_clf(0)
+
+    assert wset.select('grp', [0, 1, 2]) == []
+    assert len(wset.select('all', 'x')) == 12
+    assert [len(well.caths) for well in wells] == [1]*12